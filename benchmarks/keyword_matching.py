@@ -0,0 +1,92 @@
+"""키워드/금지어 매칭 마이크로벤치마크.
+
+긴 한국어 출력에 대해 키워드 수를 늘려 가며 Aho-Corasick 오토마톤과
+키워드별 `in` 검사를 비교한다. (KEYWORD_AUTOMATON_MIN_TERMS 조정 근거)
+
+사용법:
+    python -m benchmarks.keyword_matching
+    python -m benchmarks.keyword_matching --chars 200000 --terms 10 100 1000 5000
+"""
+
+import argparse
+import random
+import time
+
+from prompt_evaluator.config import KEYWORD_AUTOMATON_MIN_TERMS
+from prompt_evaluator.evaluators.keyword_matcher import KeywordAutomaton, match_terms
+
+HANGUL_START = 0xAC00
+SYLLABLE_POOL = 400  # 자주 쓰이는 음절 수준의 작은 풀 (부분 일치가 자주 생기도록)
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(
+        chr(HANGUL_START + rng.randrange(SYLLABLE_POOL))
+        for _ in range(rng.randint(2, 4))
+    )
+
+
+def make_text(rng: random.Random, chars: int) -> str:
+    words = []
+    length = 0
+    while length < chars:
+        word = make_word(rng)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def best_of(repeat: int, fn) -> float:
+    """repeat회 실행 중 최소 소요 시간(ms)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 매칭 마이크로벤치마크")
+    parser.add_argument("--chars", type=int, default=80_000, help="출력 길이 (문자)")
+    parser.add_argument(
+        "--terms", type=int, nargs="+", default=[10, 50, 100, 500, 1000, 5000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = make_text(rng, args.chars)
+    lowered_text = text.lower()
+    print(f"출력 {len(text):,}자, 반복 {args.repeat}회 중 최소값")
+    print(f"KEYWORD_AUTOMATON_MIN_TERMS = {KEYWORD_AUTOMATON_MIN_TERMS}\n")
+    print(f"{'terms':>6}  {'compile':>9}  {'automaton':>10}  {'in-scan':>9}  {'match_terms':>11}")
+
+    for n in args.terms:
+        # 절반은 출력에서 뽑아 실제로 포함되게 하고, 절반은 무작위 (대부분 미포함)
+        words = text.split()
+        terms = [rng.choice(words) for _ in range(n // 2)]
+        terms += [make_word(rng) for _ in range(n - len(terms))]
+        lowered = tuple(t.lower() for t in terms)
+
+        compile_ms = best_of(1, lambda: KeywordAutomaton(lowered))
+        automaton = KeywordAutomaton(lowered)
+        automaton_ms = best_of(args.repeat, lambda: automaton.search(lowered_text))
+        scan_ms = best_of(args.repeat, lambda: [t in lowered_text for t in lowered])
+        half = n // 2
+        match_ms = best_of(
+            args.repeat, lambda: match_terms(text, terms[:half], terms[half:])
+        )
+
+        expected = {i for i, t in enumerate(lowered) if t in lowered_text}
+        assert automaton.search(lowered_text) == expected
+
+        print(
+            f"{n:>6}  {compile_ms:>7.2f}ms  {automaton_ms:>8.2f}ms  "
+            f"{scan_ms:>7.2f}ms  {match_ms:>9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
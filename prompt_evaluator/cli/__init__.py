@@ -10,16 +10,20 @@ app = typer.Typer(name="prompt-evaluator", help="프롬프트 평가 시스템 C
 
 def _register():
     from prompt_evaluator.cli import prompt as prompt_cli, baseline as baseline_cli
-    from prompt_evaluator.cli.experiment import experiment, regression
+    from prompt_evaluator.cli import verdict as verdict_cli
+    from prompt_evaluator.cli.experiment import experiment, regression, compare, rescore
     from prompt_evaluator.cli.config import validate
     from prompt_evaluator.cli.dataset import list_sets, upload, collect, profiles
     from prompt_evaluator.cli.scaffold import init
 
     app.add_typer(prompt_cli.app, name="prompt")
     app.add_typer(baseline_cli.app, name="baseline")
+    app.add_typer(verdict_cli.app, name="verdict")
     app.command()(init)
     app.command()(experiment)
     app.command()(regression)
+    app.command()(compare)
+    app.command()(rescore)
     app.command()(validate)
     app.command(name="list")(list_sets)
     app.command()(upload)
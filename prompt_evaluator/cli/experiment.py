@@ -4,6 +4,7 @@ from typing import Annotated, Optional
 
 import typer
 
+from prompt_evaluator.config import DEFAULT_PAIRWISE_MAX_WORKERS
 from prompt_evaluator.pipelines.pipeline import run_experiment
 from prompt_evaluator.versioning.prompt_metadata import (
     load_metadata,
@@ -22,6 +23,7 @@ from prompt_evaluator.regression.baseline import (
     _compute_summary_from_runs,
     _extract_case_results,
 )
+from prompt_evaluator.regression.canary import JudgeDriftError
 from prompt_evaluator.regression.comparator import (
     compare_results,
     format_regression_report,
@@ -169,6 +171,23 @@ def experiment(
         str,
         typer.Option("--backend", "-b", help="실험 백엔드 (langsmith/langfuse/both)"),
     ] = "both",
+    reuse_baseline: Annotated[
+        Optional[str],
+        typer.Option(
+            "--reuse-baseline",
+            help="기준선 버전 (출력이 동일한 케이스는 기준선 Judge 점수 상속, 예: latest)",
+        ),
+    ] = None,
+    canary_block: Annotated[
+        bool,
+        typer.Option(
+            "--canary-block", help="Judge 카나리아 drift가 임계값을 넘으면 실패 처리"
+        ),
+    ] = False,
+    canary_refresh: Annotated[
+        bool,
+        typer.Option("--canary-refresh", help="Judge 카나리아 기준 점수 다시 기록"),
+    ] = False,
 ):
     """평가 실험 실행 (LangSmith 또는 Langfuse).
 
@@ -179,7 +198,40 @@ def experiment(
     4. Langfuse 결과는 로컬에 자동 저장
 
     --no-push 또는 --version 지정 시 버저닝 건너뜀.
+    --reuse-baseline 지정 시 기준선과 출력이 byte 단위로 같은 케이스는 Judge를 다시 호출하지 않음.
+    full 모드에서 eval_prompts/canary.json이 있으면 Judge 카나리아를 병렬로 채점하여 drift를 보고.
     """
+    try:
+        _run_experiment_backends(
+            name,
+            mode=mode,
+            prefix=prefix,
+            version=version,
+            changes=changes,
+            no_push=no_push,
+            backend=backend,
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
+        )
+    except JudgeDriftError as e:
+        typer.echo(f"\n✗ Judge drift로 실행 차단: {e}")
+        raise typer.Exit(1)
+
+
+def _run_experiment_backends(
+    name: str,
+    mode: str,
+    prefix: str | None,
+    version: str | None,
+    changes: str | None,
+    no_push: bool,
+    backend: str,
+    reuse_baseline: str | None,
+    canary_block: bool,
+    canary_refresh: bool,
+) -> None:
+    """experiment 명령 본체 (백엔드별 실행 및 결과 저장)."""
     from prompt_evaluator.context import get_context
 
     if mode not in ["quick", "full"]:
@@ -227,6 +279,9 @@ def experiment(
             experiment_prefix=prefix,
             prompt_version=version,
             backend="langfuse",
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
         )
         _save_langfuse_result(name, result)
         typer.echo(f"\n🔬 [2/2] LangSmith Experiment 실행: {name}")
@@ -237,6 +292,9 @@ def experiment(
             experiment_prefix=prefix,
             prompt_version=version,
             backend="langsmith",
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
         )
         return
 
@@ -250,6 +308,9 @@ def experiment(
             experiment_prefix=prefix,
             prompt_version=version,
             backend="langfuse",
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
         )
         _save_langfuse_result(name, result)
         return
@@ -261,6 +322,9 @@ def experiment(
         experiment_prefix=prefix,
         prompt_version=version,
         backend="langsmith",
+        reuse_baseline=reuse_baseline,
+        canary_block=canary_block,
+        canary_refresh=canary_refresh,
     )
 
 
@@ -450,3 +514,187 @@ def regression(
 
     if fail_on_regression and report.has_regression:
         raise typer.Exit(1)
+
+
+def compare(
+    name: Annotated[str, typer.Option("--name", "-n", help="평가 세트 이름")],
+    version_a: Annotated[
+        str, typer.Option("--a", help="A 버전 (local 또는 버전 태그)")
+    ],
+    version_b: Annotated[
+        str, typer.Option("--b", help="B 버전 (local 또는 버전 태그)")
+    ] = "local",
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="캐시된 출력을 무시하고 다시 실행")
+    ] = False,
+    workers: Annotated[
+        int, typer.Option("--workers", "-w", help="동시 실행/Judge 호출 수")
+    ] = DEFAULT_PAIRWISE_MAX_WORKERS,
+):
+    """두 프롬프트 버전을 pairwise Judge로 A/B 비교.
+
+    케이스마다 두 출력을 A→B, B→A 순서로 모두 Judge에 제시하여 위치 편향을
+    상쇄하고, 케이스별 판정과 B 승률(95% 신뢰구간)을 출력합니다.
+    버전별 출력은 results/comparisons/{name}/outputs/ 에 캐시되어 재사용됩니다.
+
+    Usage:
+        # Langfuse v1.0 vs 현재 로컬 프롬프트
+        compare --name prep_generate --a v1.0 --b local
+
+        # 두 등록 버전 비교 (출력 재생성)
+        compare --name prep_generate --a v1.0 --b v1.1 --no-cache
+    """
+    from prompt_evaluator.pipelines.compare import (
+        run_pairwise_comparison,
+        save_comparison_result,
+    )
+
+    typer.echo(f"\nPairwise 비교: {name} (A={version_a}, B={version_b})")
+    typer.echo("-" * 60)
+
+    try:
+        result = run_pairwise_comparison(
+            name,
+            version_a,
+            version_b,
+            use_cache=not no_cache,
+            max_workers=workers,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        typer.echo(f"비교 실행 실패: {e}")
+        raise typer.Exit(1)
+
+    typer.echo("\n[케이스별 판정]")
+    for case in result["results"]:
+        orders = case["orders"]
+        ab = orders["ab"].get("winner", "error")
+        ba = orders["ba"].get("winner", "error")
+        mark = "" if case["consistent"] else "  (순서에 따라 판정 불일치)"
+        typer.echo(
+            f"  {case['id']}: {case['verdict'] or 'error'} "
+            f"[A→B: {ab}, B→A: {ba}]{mark}"
+        )
+
+    summary = result["summary"]
+    low, high = summary["ci_b"]
+    typer.echo("\n[요약]")
+    typer.echo(
+        f"  A 승 {summary['wins_a']} / B 승 {summary['wins_b']} / "
+        f"무승부 {summary['ties']} / 오류 {summary['errors']}"
+    )
+    typer.echo(
+        f"  B 승률: {summary['win_rate_b']:.1%} (95% CI {low:.1%} ~ {high:.1%})"
+    )
+    typer.echo(f"  순서 일관성: {summary['position_consistency']:.1%}")
+    if summary["preferred"]:
+        typer.echo(f"  결론: {summary['preferred']} 버전이 유의미하게 우세")
+    else:
+        typer.echo("  결론: 유의미한 차이 없음 (신뢰구간이 50%를 포함)")
+
+    path = save_comparison_result(result)
+    typer.echo(f"\n  결과 저장: {path}")
+
+
+def rescore(
+    name: Annotated[str, typer.Option("--name", "-n", help="프롬프트 이름")],
+    experiment_name: Annotated[
+        Optional[str],
+        typer.Option("--experiment", "-e", help="재채점할 실험 이름 (기본: latest)"),
+    ] = None,
+    all_experiments: Annotated[
+        bool, typer.Option("--all", help="results/experiments/{name}/ 의 모든 실험 재채점")
+    ] = False,
+    save: Annotated[
+        bool,
+        typer.Option("--save", help="재채점 결과를 '{실험 이름}-rescored.json'으로 저장"),
+    ] = False,
+):
+    """저장된 실험 출력을 현재 expected.json/config.yaml로 다시 채점 (LLM 호출 없음).
+
+    expected.json의 keywords/forbidden/reference나 rule_based 설정을 바꾼 뒤,
+    과거 실험 출력에 rule-based 검사만 다시 실행하고 weights/thresholds로 판정을 다시 계산합니다.
+    Judge 점수는 저장된 값을 그대로 사용합니다.
+
+    Usage:
+        # 최신 실험 재채점
+        rescore --name prep_generate
+
+        # 모든 과거 실험 재채점 후 저장
+        rescore --name prep_generate --all --save
+    """
+    from pathlib import Path
+
+    from prompt_evaluator.regression.baseline import (
+        list_experiment_results,
+        load_experiment_result,
+        rescore_rule_checks,
+    )
+
+    typer.echo(f"\n재채점: {name}")
+    typer.echo("-" * 60)
+
+    if all_experiments:
+        import json
+
+        experiments = []
+        for path in list_experiment_results(name):
+            if path.stem.endswith("-rescored"):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                experiments.append((path.stem, json.load(f)))
+    elif experiment_name:
+        experiments = [(experiment_name, load_experiment_result(name, experiment_name))]
+    else:
+        experiments = [("latest", load_latest_experiment(name))]
+
+    experiments = [(label, data) for label, data in experiments if data]
+    if not experiments:
+        typer.echo("  재채점할 실험 결과가 없습니다. 먼저 experiment 명령으로 실험을 실행하세요.")
+        raise typer.Exit(1)
+
+    for label, data in experiments:
+        try:
+            rescored = rescore_rule_checks(name, data)
+        except (FileNotFoundError, ValueError) as e:
+            typer.echo(f"\n✗ 재채점 실패: {e}")
+            raise typer.Exit(1)
+
+        before = data.get("summary", {})
+        after = rescored["summary"]
+        changed = [
+            new.get("case_id", "")
+            for old, new in zip(data.get("results", []), rescored["results"])
+            if old.get("passed") != new.get("passed")
+        ]
+        before_rate = before.get("pass_rate")
+        before_str = f"{before_rate:.1%}" if before_rate is not None else "-"
+        typer.echo(
+            f"  • {label}: pass_rate {before_str} → {after['pass_rate']:.1%} "
+            f"(판정 변경 {len(changed)}건)"
+        )
+        if changed:
+            typer.echo(f"      {', '.join(changed)}")
+        missing = rescored["rescored"]["missing_cases"]
+        if missing:
+            typer.echo(f"      expected.json에 없는 케이스 {len(missing)}건은 기존 점수 유지")
+        newly_skipped = rescored["rescored"]["newly_skipped"]
+        if newly_skipped:
+            typer.echo(
+                f"      선행 검사(depends_on) 실패로 Judge 점수 skipped 처리 {len(newly_skipped)}건: "
+                f"{', '.join(newly_skipped)}"
+            )
+        needs_judge = rescored["rescored"]["needs_judge"]
+        if needs_judge:
+            typer.echo(
+                f"      ⚠ 선행 검사를 새로 통과해 Judge 채점이 필요한 케이스 {len(needs_judge)}건 "
+                "(experiment 재실행 필요):"
+            )
+            for entry in needs_judge:
+                typer.echo(f"        - {entry['case_id']}: {', '.join(entry['criteria'])}")
+
+        if save:
+            exp_name = data.get("experiment_name") or Path(label).stem
+            path = save_experiment_result(
+                name, rescored, f"{exp_name}-rescored", update_latest=False
+            )
+            typer.echo(f"      결과 저장: {path}")
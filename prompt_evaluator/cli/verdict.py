@@ -0,0 +1,87 @@
+"""Judge verdict 조회 CLI 명령어"""
+
+import json
+from typing import Annotated, Optional
+
+import typer
+
+from prompt_evaluator.evaluators.verdict_store import (
+    collect_verdict_ids,
+    get_verdict_store,
+)
+from prompt_evaluator.regression.baseline import (
+    load_experiment_result,
+    load_latest_experiment,
+)
+
+
+app = typer.Typer(help="Judge verdict (체크리스트/피드백) 조회")
+
+
+def _echo_verdict(verdict_id: str, verdict: dict | None) -> None:
+    if verdict is None:
+        typer.echo(f"  verdict 없음: {verdict_id}")
+        return
+    score = verdict.get("score")
+    score_str = f"{score:.2f}" if isinstance(score, (int, float)) else "-"
+    typer.echo(f"\n  [{verdict.get('criterion', '?')}] {score_str} (verdict {verdict_id})")
+    for key, value in (verdict.get("checklist") or {}).items():
+        mark = f"{value:.2f}" if isinstance(value, float) else str(value)
+        typer.echo(f"    - {key}: {mark}")
+    if verdict.get("agreement"):
+        typer.echo(f"    agreement: {verdict['agreement']}")
+    if verdict.get("feedback"):
+        typer.echo(f"    feedback: {verdict['feedback']}")
+
+
+@app.command(name="show")
+def verdict_show(
+    verdict_id: Annotated[str, typer.Argument(help="verdict ID")],
+    raw: Annotated[bool, typer.Option("--json", help="JSON 원문 출력")] = False,
+):
+    """verdict ID로 Judge verdict 조회.
+
+    Usage: verdict show 3f2a9c0d1e4b5a67
+    """
+    verdict = get_verdict_store().get(verdict_id)
+    if verdict is None:
+        typer.echo(f"verdict를 찾을 수 없습니다: {verdict_id}")
+        raise typer.Exit(1)
+    if raw:
+        typer.echo(json.dumps(verdict, ensure_ascii=False, indent=2))
+    else:
+        _echo_verdict(verdict_id, verdict)
+
+
+@app.command(name="case")
+def verdict_case(
+    name: Annotated[str, typer.Argument(help="프롬프트 이름")],
+    case_id: Annotated[str, typer.Argument(help="케이스 ID")],
+    experiment: Annotated[
+        Optional[str],
+        typer.Option("--experiment", "-e", help="실험 결과 파일명 (기본: latest)"),
+    ] = None,
+):
+    """로컬 실험 결과에서 케이스의 모든 Judge verdict 조회.
+
+    Usage: verdict case prep_output_analyze case_003 --experiment "prep_output_analyze-full-20260129-143000"
+    """
+    result = (
+        load_experiment_result(name, experiment)
+        if experiment
+        else load_latest_experiment(name)
+    )
+    if result is None:
+        typer.echo(f"실험 결과 없음: {name} ({experiment or 'latest'})")
+        raise typer.Exit(1)
+
+    verdict_ids = collect_verdict_ids(result).get(case_id)
+    if not verdict_ids:
+        typer.echo(f"케이스 '{case_id}'에 저장된 verdict가 없습니다.")
+        raise typer.Exit(1)
+
+    typer.echo(f"\n📋 {name} / {case_id} ({result.get('experiment_name', '')})")
+    verdicts = get_verdict_store().get_many(list(verdict_ids.values()))
+    for verdict_id in verdict_ids.values():
+        _echo_verdict(verdict_id, verdicts.get(verdict_id))
+    typer.echo()
@@ -14,6 +14,7 @@ DEFAULT_LLM_JUDGE_MODEL = "gpt-4o"
 DEFAULT_EMBEDDING_PROVIDER = "openai"
 OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
 VERTEX_EMBEDDING_MODEL = "text-embedding-004"
+EMBEDDING_BATCH_SIZE = 100  # 임베딩 API 1회 요청당 최대 텍스트 수
 
 # Gemini
 GEMINI_MODEL = "gemini-2.5-flash"
@@ -21,6 +22,16 @@ GEMINI_MAX_TOKENS = 20000
 GEMINI_TEMPERATURE = 0
 GEMINI_THINKING_BUDGET = 0
 
+# OpenAI 호환 엔드포인트 (역할별). BASE_URL을 지정하면 해당 서버로 호출
+# (로컬 추론 서버, prompt_evaluator.utils.stub_server 등). 미지정 시 OpenAI API 사용
+EXECUTION_BASE_URL = os.getenv("EXECUTION_BASE_URL")
+EXECUTION_MODEL = os.getenv("EXECUTION_MODEL", DEFAULT_MODEL)
+EXECUTION_API_KEY = os.getenv("EXECUTION_API_KEY")
+JUDGE_BASE_URL = os.getenv("JUDGE_BASE_URL")
+JUDGE_MODEL = os.getenv("JUDGE_MODEL", DEFAULT_LLM_JUDGE_MODEL)
+JUDGE_API_KEY = os.getenv("JUDGE_API_KEY")
+LOCAL_API_KEY_PLACEHOLDER = "local"  # 인증이 없는 로컬 서버용 (ChatOpenAI는 키 필수)
+
 # GCP
 GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT")
 GOOGLE_CLOUD_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
@@ -34,6 +45,7 @@ DEFAULT_KEYWORD_THRESHOLD = 0.5
 DEFAULT_PASS_THRESHOLD = 0.5
 DEFAULT_EMBEDDING_THRESHOLD = 0.75
 DEFAULT_STRING_SIMILARITY_THRESHOLD = 0.30
+DEFAULT_CRITERIA_REFERENCE_THRESHOLD = 0.80
 
 # =============================================================================
 # 길이 제한
@@ -41,9 +53,30 @@ DEFAULT_STRING_SIMILARITY_THRESHOLD = 0.30
 
 DEFAULT_MIN_LENGTH = 10
 DEFAULT_MAX_LENGTH = 5000
+SCHEMA_MAX_REPORTED_ERRORS = 5  # schema_compliance 코멘트에 표시할 최대 오류 수
+
+# =============================================================================
+# 키워드 매칭 / 텍스트 정규화
+# =============================================================================
+
+NORMALIZATION_CACHE_SIZE = 4096  # 정규화기별 텍스트 결과 캐시 크기
+KEYWORD_AUTOMATON_MIN_TERMS = 128  # 이 개수 이상이면 Aho-Corasick, 미만이면 `in` 검사
+MORPHEME_MIN_STEM = 2  # match: morpheme에서 조사/어미를 떼어 낸 어간의 최소 음절 수
+MORPHEME_INDEX_CACHE_SIZE = 256  # 출력 텍스트별 어간 색인 캐시 크기
+PATTERN_CACHE_SIZE = 1024  # pattern 검사 정규식 컴파일 캐시 크기
+RULE_CHECK_ENTRY_POINT_GROUP = "prompt_evaluator.rule_checks"  # rule-based 검사 플러그인 entry point 그룹
 
 # =============================================================================
 # LLM 호출 설정
 # =============================================================================
 
 DEFAULT_TEMPERATURE = 0
+DEFAULT_JUDGE_REPAIR_RETRIES = 1  # Judge 응답 스키마 검증 실패 시 재요청 횟수
+DEFAULT_SELF_CONSISTENCY_MIN_SAMPLES = 2  # 1차 샘플 수 (만장일치면 조기 종료)
+DEFAULT_SELF_CONSISTENCY_TEMPERATURE = 0.7
+DEFAULT_LOGPROB_TOP_K = 5  # logprob 모드에서 토큰 위치별로 받을 상위 후보 수
+DEFAULT_PAIRWISE_MAX_WORKERS = 8  # pairwise 비교 시 동시 Judge/실행 호출 수
+DEFAULT_CONFIDENCE_Z = 1.96  # 승률 신뢰구간 (95%)
+DEFAULT_CANARY_DRIFT_THRESHOLD = 0.15  # Judge 카나리아 케이스별 허용 점수 변화
+CANARY_MAX_CASES = 10  # 카나리아 세트 최대 케이스 수 (실행당 고정 Judge 비용 상한)
+CANARY_MAX_WORKERS = 4
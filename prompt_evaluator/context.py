@@ -63,6 +63,10 @@ class EvalContext:
     def experiments_dir(self) -> Path:
         return self.results_dir / "experiments"
 
+    @property
+    def comparisons_dir(self) -> Path:
+        return self.results_dir / "comparisons"
+
     @classmethod
     def from_config(cls, config_path: str | Path | None = None) -> "EvalContext":
         """config.yaml에서 컨텍스트 로드.
@@ -3,65 +3,71 @@
 rule_based.py, llm_judge.py의 평가 로직을 호출하고
 결과를 각 플랫폼이 요구하는 형식으로 변환한다.
 
-Note: keyword/forbidden 어댑터는 LangSmith/Langfuse 간 핵심 로직이 동일하지만,
+Note: rule-based/Judge 어댑터는 LangSmith/Langfuse 간 핵심 로직이 동일하지만,
 플랫폼별 함수 시그니처가 다르기 때문에 별도로 정의한다.
+rule-based 검사는 케이스당 하나의 어댑터 호출에서 모두 실행하여 점수 여러 개를 반환한다.
+한 실험의 어댑터들은 CaseResultCache를 공유하여 케이스 출력 파싱과 rule-based 검사
+(Judge depends_on 게이트, criteria_reference 포함)를 케이스당 한 번만 실행한다.
 - LangSmith: (run, example) → EvaluationResult
 - Langfuse: (*, output, metadata, ...) → Evaluation
 """
 
 from typing import Callable
 
-from prompt_evaluator.evaluators.llm_judge import run_checklist_evaluation
-from prompt_evaluator.evaluators.rule_based import (
-    keyword_inclusion,
-    forbidden_word_check,
+from prompt_evaluator.evaluators.criteria_reference import (
+    criteria_reference_batch,
+    criteria_reference_check,
+    format_criteria_reference_report,
+)
+from prompt_evaluator.evaluators.dependencies import (
+    format_skip_comment,
+    get_failed_checks,
 )
+from prompt_evaluator.evaluators.llm_judge import run_checklist_evaluation
+from prompt_evaluator.evaluators.scoring import ERROR, SKIPPED, fingerprint_output
+from prompt_evaluator.evaluators.registry import CaseResultCache, get_rule_suite
+from prompt_evaluator.evaluators.rule_based import get_reference_text, get_rule_checks
+from prompt_evaluator.evaluators.semantic import semantic_similarity_batch
+from prompt_evaluator.evaluators.verdict_store import store_verdict
 from prompt_evaluator.models import get_judge_llm
 
+INHERITED_COMMENT = "Inherited from baseline (identical output)"
+CANARY_SKIP_COMMENT = "Skipped: judge drift exceeded canary threshold"
+
 
 # =============================================================================
 # LangSmith 어댑터
 # =============================================================================
 
 
-def create_langsmith_keyword_evaluator(expected_all: dict) -> Callable:
-    """LangSmith용 키워드 포함 평가자."""
-
-    def evaluator(run, example):
-        from langsmith.evaluation import EvaluationResult
-
-        output = run.outputs.get("output", "")
-        case_id = example.metadata.get("case_id", "") if example.metadata else ""
-        expected = expected_all.get(case_id, {})
-
-        result = keyword_inclusion(output, expected.get("keywords", []))
-
-        return EvaluationResult(
-            key="keyword_inclusion",
-            score=result["score"],
-            comment=result["details"],
-        )
-
-    return evaluator
-
+def create_langsmith_rule_evaluator(
+    expected_all: dict,
+    eval_config: dict | None = None,
+    cache: CaseResultCache | None = None,
+) -> Callable:
+    """LangSmith용 rule-based 평가자 (설정된 모든 검사를 한 번에 실행하여 점수 여러 개 반환).
 
-def create_langsmith_forbidden_evaluator(expected_all: dict) -> Callable:
-    """LangSmith용 금지어 검사 평가자."""
+    출력 정규화(CaseArtifact)와 검사 결과는 cache에 케이스당 한 번만 계산되어 다른 평가자와 공유된다.
+    검사(RuleSuite)는 평가자 생성 시 한 번만 만들어 설정 오류(스키마, 정규식 등)를 첫 케이스 전에 드러낸다.
+    """
+    checks = get_rule_checks(eval_config)
+    get_rule_suite(eval_config, checks)
+    cache = cache or CaseResultCache(expected_all, eval_config)
 
     def evaluator(run, example):
         from langsmith.evaluation import EvaluationResult
 
         output = run.outputs.get("output", "")
         case_id = example.metadata.get("case_id", "") if example.metadata else ""
-        expected = expected_all.get(case_id, {})
-
-        result = forbidden_word_check(output, expected.get("forbidden", []))
-
-        return EvaluationResult(
-            key="forbidden_word_check",
-            score=result["score"],
-            comment=result["details"],
-        )
+        results = cache.run(case_id, output, checks)
+        return {
+            "results": [
+                EvaluationResult(
+                    key=name, score=result["score"], comment=result["details"]
+                )
+                for name, result in results.items()
+            ]
+        }
 
     return evaluator
 
@@ -69,8 +75,26 @@ def create_langsmith_forbidden_evaluator(expected_all: dict) -> Callable:
 def create_langsmith_evaluator(
     criterion: str,
     prompt_template: str = "",
+    expected_all: dict | None = None,
+    depends_on: list[str] | None = None,
+    options: dict | None = None,
+    inherited: dict | None = None,
+    eval_config: dict | None = None,
+    cache: CaseResultCache | None = None,
+    canary=None,
 ) -> Callable:
-    """LangSmith용 LLM Judge 평가자."""
+    """LangSmith용 LLM Judge 평가자.
+
+    depends_on이 지정되면 선행 rule-based 검사 실패 시 Judge를 호출하지 않고
+    skipped로 기록한다. options는 기준별 옵션 (criterion_options[criterion]).
+    inherited(build_inherited_scores 결과)에 출력이 동일한 케이스가 있으면
+    Judge 대신 기준선 점수를 상속한다.
+    eval_config는 선행 검사에 rule-based 평가자와 같은 옵션(normalize 등)을 적용할 때 사용하며,
+    선행 검사 결과는 cache(rule-based 평가자와 공유)에서 읽는다.
+    canary(JudgeCanaryGate)가 drift 초과를 알리면 Judge를 호출하지 않고 skipped로 기록한다.
+    """
+    expected_all = expected_all or {}
+    cache = cache or CaseResultCache(expected_all, eval_config)
 
     def evaluator(run, example):
         from langsmith.evaluation import EvaluationResult
@@ -78,75 +102,331 @@ def create_langsmith_evaluator(
         output = run.outputs.get("output", "")
         inputs = example.inputs
 
+        if depends_on:
+            case_id = example.metadata.get("case_id", "") if example.metadata else ""
+            failed = get_failed_checks(cache.run(case_id, output, depends_on))
+            if failed:
+                return EvaluationResult(
+                    key=criterion,
+                    score=None,
+                    value=SKIPPED,
+                    comment=format_skip_comment(failed),
+                )
+
+        if inherited:
+            case_id = example.metadata.get("case_id", "") if example.metadata else ""
+            score = _find_inherited_score(inherited, case_id, output, criterion)
+            if score is not None:
+                return EvaluationResult(
+                    key=criterion, score=score, comment=INHERITED_COMMENT
+                )
+
+        if canary is not None and canary.drift_exceeded():
+            return EvaluationResult(
+                key=criterion, score=None, value=SKIPPED, comment=CANARY_SKIP_COMMENT
+            )
+
         result = run_checklist_evaluation(
             output=output,
             inputs=inputs,
             prompt_template=prompt_template,
             criteria=[criterion],
+            criterion_options={criterion: options or {}},
         )
 
         criterion_result = result.get(criterion, {})
+        if criterion_result.get("score") is None:
+            return EvaluationResult(
+                key=criterion,
+                score=None,
+                value=ERROR,
+                comment=f"Error: {criterion_result.get('error', 'Evaluation failed')}",
+            )
 
+        verdict_id = store_verdict(criterion, criterion_result)
+        comment = _format_judge_comment(criterion_result)
+        if verdict_id:
+            comment = f"{comment or ''} (verdict {verdict_id})".strip()
         return EvaluationResult(
             key=criterion,
-            score=criterion_result.get("score", 0.0),
+            score=criterion_result["score"],
+            comment=comment,
+        )
+
+    return evaluator
+
+
+def create_langsmith_semantic_summary_evaluator(
+    expected_all: dict, threshold: float | None = None
+) -> Callable:
+    """LangSmith용 임베딩 유사도 평가자 (실험 종료 후 전체 출력을 한 번에 임베딩).
+
+    케이스 점수(semantic_similarity)는 run별 피드백으로 기록하고 평균(semantic_similarity_mean)을
+    실험 점수로 반환한다. 케이스별 평가자로 두면 출력마다 임베딩 요청이 한 번씩 발생한다.
+    """
+    options = {} if threshold is None else {"threshold": threshold}
+
+    def summary_evaluator(runs, examples):
+        from langsmith import Client
+        from langsmith.evaluation import EvaluationResult
+
+        scored_runs, outputs, references = [], [], []
+        for run, example in zip(runs, examples):
+            case_id = example.metadata.get("case_id", "") if example.metadata else ""
+            reference = get_reference_text(expected_all.get(case_id, {}))
+            if reference is not None:
+                scored_runs.append(run)
+                outputs.append((run.outputs or {}).get("output", ""))
+                references.append(reference)
+
+        results = semantic_similarity_batch(outputs, references, **options)
+        if not results:
+            return EvaluationResult(
+                key="semantic_similarity_mean", score=None, comment="No reference"
+            )
+
+        client = Client()
+        for run, result in zip(scored_runs, results):
+            client.create_feedback(
+                run.id,
+                key="semantic_similarity",
+                score=result["score"],
+                comment=result["details"],
+            )
+        return EvaluationResult(
+            key="semantic_similarity_mean",
+            score=sum(r["score"] for r in results) / len(results),
+            comment=_format_semantic_summary(results),
+        )
+
+    return summary_evaluator
+
+
+def create_langsmith_criteria_reference_evaluator(
+    expected_all: dict,
+    threshold: float | None = None,
+    cache: CaseResultCache | None = None,
+) -> Callable:
+    """LangSmith용 기준 코드별 점수 참조 비교 평가자 (Judge 호출 없음, JSON 파싱은 cache와 공유)."""
+    options = {} if threshold is None else {"threshold": threshold}
+    cache = cache or CaseResultCache(expected_all, None)
+
+    def evaluator(run, example):
+        from langsmith.evaluation import EvaluationResult
+
+        output = run.outputs.get("output", "")
+        case_id = example.metadata.get("case_id", "") if example.metadata else ""
+        result = criteria_reference_check(
+            cache.artifact(case_id, output), expected_all.get(case_id, {}), **options
+        )
+        if result is None:
+            return EvaluationResult(
+                key="criteria_reference", score=None, comment="No reference"
+            )
+        return EvaluationResult(
+            key="criteria_reference",
+            score=result["score"],
+            comment=result["details"],
         )
 
     return evaluator
 
 
+def create_langsmith_criteria_reference_summary_evaluator(
+    expected_all: dict,
+    cache: CaseResultCache | None = None,
+) -> Callable:
+    """LangSmith용 실험 단위 항목별 정밀도/재현율 집계 (전체 run을 한 번에 계산)."""
+    cache = cache or CaseResultCache(expected_all, None)
+
+    def summary_evaluator(runs, examples):
+        from langsmith.evaluation import EvaluationResult
+
+        outputs, expected_list = [], []
+        for run, example in zip(runs, examples):
+            case_id = example.metadata.get("case_id", "") if example.metadata else ""
+            output = (run.outputs or {}).get("output", "")
+            outputs.append(cache.artifact(case_id, output))
+            expected_list.append(expected_all.get(case_id, {}))
+
+        _, report = criteria_reference_batch(outputs, expected_list)
+        return EvaluationResult(
+            key="criteria_reference_accuracy",
+            score=report.accuracy,
+            comment=format_criteria_reference_report(report),
+        )
+
+    return summary_evaluator
+
+
 # =============================================================================
 # Langfuse 어댑터
 # =============================================================================
 
 
-def create_langfuse_keyword_evaluator(expected_all: dict) -> Callable:
-    """Langfuse용 키워드 포함 평가자."""
+def create_langfuse_rule_evaluator(
+    expected_all: dict,
+    eval_config: dict | None = None,
+    cache: CaseResultCache | None = None,
+) -> Callable:
+    """Langfuse용 rule-based 평가자 (설정된 모든 검사를 한 번에 실행하여 Evaluation 목록 반환)."""
+    checks = get_rule_checks(eval_config)
+    get_rule_suite(eval_config, checks)
+    cache = cache or CaseResultCache(expected_all, eval_config)
 
     def evaluator(*, output, expected_output, input, metadata, **kwargs):
         from langfuse import Evaluation
 
         text = output.get("output", "") if isinstance(output, dict) else str(output)
         case_id = metadata.get("case_id", "") if metadata else ""
-        expected = expected_all.get(case_id, {})
+        results = cache.run(case_id, text, checks)
+        return [
+            Evaluation(name=name, value=result["score"], comment=result["details"])
+            for name, result in results.items()
+        ]
+
+    return evaluator
+
+
+def create_langfuse_semantic_run_evaluator(
+    expected_all: dict,
+    threshold: float | None = None,
+    case_results: dict | None = None,
+) -> Callable:
+    """Langfuse용 임베딩 유사도 평가자 (run_evaluators, 실험 종료 후 전체 출력을 한 번에 임베딩).
 
-        result = keyword_inclusion(text, expected.get("keywords", []))
+    케이스 점수(semantic_similarity)는 trace별 score로 기록하고 평균(semantic_similarity_mean)을
+    실험 점수로 반환한다. case_results가 주어지면 {trace_id: 결과}를 채워 로컬 결과에 합칠 수 있게 한다.
+    참조가 없는 케이스는 점수를 남기지 않는다.
+    """
+    options = {} if threshold is None else {"threshold": threshold}
 
+    def run_evaluator(*, item_results, **kwargs):
+        from langfuse import Evaluation
+        from prompt_evaluator.utils.langfuse_client import get_langfuse_client
+
+        scored_items, outputs, references = [], [], []
+        for item_result in item_results:
+            item = item_result.item
+            metadata = getattr(item, "metadata", None) or {}
+            case_id = metadata.get("case_id", "")
+            reference = get_reference_text(expected_all.get(case_id, {}))
+            if reference is None:
+                continue
+            output = item_result.output or ""
+            text = output.get("output", "") if isinstance(output, dict) else str(output)
+            scored_items.append(item_result)
+            outputs.append(text)
+            references.append(reference)
+
+        results = semantic_similarity_batch(outputs, references, **options)
+        if not results:
+            return []
+
+        langfuse = get_langfuse_client()
+        for item_result, result in zip(scored_items, results):
+            if item_result.trace_id:
+                langfuse.create_score(
+                    name="semantic_similarity",
+                    value=result["score"],
+                    trace_id=item_result.trace_id,
+                    comment=result["details"],
+                )
+                if case_results is not None:
+                    case_results[item_result.trace_id] = result
         return Evaluation(
-            name="keyword_inclusion",
-            value=result["score"],
-            comment=result["details"],
+            name="semantic_similarity_mean",
+            value=sum(r["score"] for r in results) / len(results),
+            comment=_format_semantic_summary(results),
         )
 
-    return evaluator
+    return run_evaluator
 
 
-def create_langfuse_forbidden_evaluator(expected_all: dict) -> Callable:
-    """Langfuse용 금지어 검사 평가자."""
+def create_langfuse_criteria_reference_evaluator(
+    expected_all: dict,
+    threshold: float | None = None,
+    cache: CaseResultCache | None = None,
+) -> Callable:
+    """Langfuse용 기준 코드별 점수 참조 비교 평가자 (참조가 없는 케이스는 점수를 남기지 않음)."""
+    options = {} if threshold is None else {"threshold": threshold}
+    cache = cache or CaseResultCache(expected_all, None)
 
     def evaluator(*, output, expected_output, input, metadata, **kwargs):
         from langfuse import Evaluation
 
         text = output.get("output", "") if isinstance(output, dict) else str(output)
         case_id = metadata.get("case_id", "") if metadata else ""
-        expected = expected_all.get(case_id, {})
-
-        result = forbidden_word_check(text, expected.get("forbidden", []))
+        result = criteria_reference_check(
+            cache.artifact(case_id, text), expected_all.get(case_id, {}), **options
+        )
+        if result is None:
+            return []
 
         return Evaluation(
-            name="forbidden_word_check",
+            name="criteria_reference",
             value=result["score"],
             comment=result["details"],
+            metadata={"mismatched": result["mismatched"], "missing": result["missing"]},
         )
 
     return evaluator
 
 
+def create_langfuse_criteria_reference_run_evaluator(
+    expected_all: dict, cache: CaseResultCache | None = None
+) -> Callable:
+    """Langfuse용 실험 단위 항목별 정밀도/재현율/혼동 행렬 집계 (run_evaluators)."""
+    cache = cache or CaseResultCache(expected_all, None)
+
+    def run_evaluator(*, item_results, **kwargs):
+        from langfuse import Evaluation
+
+        outputs, expected_list = [], []
+        for item_result in item_results:
+            metadata = getattr(item_result.item, "metadata", None) or {}
+            case_id = metadata.get("case_id", "")
+            output = item_result.output or ""
+            text = output.get("output", "") if isinstance(output, dict) else str(output)
+            outputs.append(cache.artifact(case_id, text))
+            expected_list.append(expected_all.get(case_id, {}))
+
+        _, report = criteria_reference_batch(outputs, expected_list)
+        if report.accuracy is None:
+            return []
+        return Evaluation(
+            name="criteria_reference_accuracy",
+            value=report.accuracy,
+            comment=format_criteria_reference_report(report),
+            metadata=report.to_dict(),
+        )
+
+    return run_evaluator
+
+
 def create_langfuse_evaluator(
     criterion: str,
     prompt_template: str = "",
+    expected_all: dict | None = None,
+    depends_on: list[str] | None = None,
+    options: dict | None = None,
+    inherited: dict | None = None,
+    eval_config: dict | None = None,
+    cache: CaseResultCache | None = None,
+    canary=None,
 ) -> Callable:
-    """Langfuse용 LLM Judge 평가자."""
+    """Langfuse용 LLM Judge 평가자.
+
+    depends_on이 지정되면 선행 rule-based 검사 실패 시 Judge를 호출하지 않고
+    skipped (CATEGORICAL)로 기록한다. options는 기준별 옵션 (criterion_options[criterion]).
+    inherited(build_inherited_scores 결과)에 출력이 동일한 케이스가 있으면
+    Judge 대신 기준선 점수를 상속하고 metadata에 inherited로 표시한다.
+    eval_config는 선행 검사에 rule-based 평가자와 같은 옵션(normalize 등)을 적용할 때 사용하며,
+    선행 검사 결과는 cache(rule-based 평가자와 공유)에서 읽는다.
+    canary(JudgeCanaryGate)가 drift 초과를 알리면 Judge를 호출하지 않고 skipped로 기록한다.
+    """
+    expected_all = expected_all or {}
+    cache = cache or CaseResultCache(expected_all, eval_config)
 
     def evaluator(*, output, expected_output, input, metadata, **kwargs):
         from langfuse import Evaluation
@@ -157,6 +437,36 @@ def create_langfuse_evaluator(
         if not text:
             return Evaluation(name=name, value=0.0, comment="Empty output")
 
+        if depends_on:
+            case_id = metadata.get("case_id", "") if metadata else ""
+            failed = get_failed_checks(cache.run(case_id, text, depends_on))
+            if failed:
+                return Evaluation(
+                    name=name,
+                    value=SKIPPED,
+                    comment=format_skip_comment(failed),
+                    data_type="CATEGORICAL",
+                )
+
+        if inherited:
+            case_id = metadata.get("case_id", "") if metadata else ""
+            score = _find_inherited_score(inherited, case_id, text, criterion)
+            if score is not None:
+                return Evaluation(
+                    name=name,
+                    value=score,
+                    comment=INHERITED_COMMENT,
+                    metadata={"inherited": True},
+                )
+
+        if canary is not None and canary.drift_exceeded():
+            return Evaluation(
+                name=name,
+                value=SKIPPED,
+                comment=CANARY_SKIP_COMMENT,
+                data_type="CATEGORICAL",
+            )
+
         judge_handler = get_langfuse_handler()
         bound_judge = get_judge_llm().with_config({"callbacks": [judge_handler]})
         try:
@@ -166,13 +476,73 @@ def create_langfuse_evaluator(
                 prompt_template=prompt_template,
                 criteria=[criterion],
                 llm=bound_judge,
+                criterion_options={criterion: options or {}},
             )
-            if criterion in results:
-                return Evaluation(name=name, value=results[criterion]["score"])
+            criterion_result = results.get(criterion, {})
+            if criterion_result.get("score") is not None:
+                metadata = _judge_metadata(criterion_result) or {}
+                verdict_id = store_verdict(criterion, criterion_result)
+                if verdict_id:
+                    metadata["verdict_id"] = verdict_id
+                return Evaluation(
+                    name=name,
+                    value=criterion_result["score"],
+                    comment=_format_judge_comment(criterion_result),
+                    metadata=metadata or None,
+                )
+            error = criterion_result.get("error", "Evaluation failed")
         except Exception as e:
-            return Evaluation(name=name, value=0.0, comment=f"Error: {e}")
+            error = str(e)
 
-        return Evaluation(name=name, value=0.0, comment="Evaluation failed")
+        return Evaluation(
+            name=name,
+            value=ERROR,
+            comment=f"Error: {error}",
+            data_type="CATEGORICAL",
+        )
 
     evaluator.__name__ = f"llm_judge_{criterion}"
     return evaluator
+
+
+def _find_inherited_score(
+    inherited: dict, case_id: str, output: str, criterion: str
+) -> float | None:
+    """출력이 기준선과 동일하면 해당 기준의 기준선 점수 반환."""
+    entry = inherited.get(case_id)
+    normalize = tuple(entry.get("normalize") or ()) if entry else ()
+    if not entry or entry["fingerprint"] != fingerprint_output(output, normalize):
+        return None
+    return entry["scores"].get(criterion)
+
+
+def _judge_metadata(criterion_result: dict) -> dict | None:
+    """Judge 결과 중 점수 외 부가 정보 (self-consistency 샘플 수, 항목별 일치율 등)."""
+    metadata = {
+        key: criterion_result[key]
+        for key in ("samples", "agreement")
+        if criterion_result.get(key)
+    }
+    if criterion_result.get("mode") == "logprob":
+        metadata["mode"] = "logprob"
+        metadata["probabilities"] = criterion_result.get("checklist", {})
+    return metadata or None
+
+
+def _format_judge_comment(criterion_result: dict) -> str | None:
+    """self-consistency 항목별 일치율 / logprob 항목별 P(1)을 코멘트 문자열로 변환."""
+    if criterion_result.get("mode") == "logprob":
+        items = ", ".join(
+            f"{k}={v:.2f}" for k, v in criterion_result.get("checklist", {}).items()
+        )
+        return f"logprob P(pass): {items}"
+    agreement = criterion_result.get("agreement")
+    if not agreement:
+        return None
+    items = ", ".join(f"{k}={v:.0%}" for k, v in agreement.items())
+    return f"samples={criterion_result.get('samples')} agreement: {items}"
+
+
+def _format_semantic_summary(results: list[dict]) -> str:
+    passed = sum(1 for r in results if r["passed"])
+    return f"{passed}/{len(results)} cases above similarity threshold"
@@ -0,0 +1,108 @@
+"""케이스 단위 출력 정규화 결과 (rule-based 평가자 공용).
+
+rule-based 평가자들이 각자 출력을 소문자화/공백 정규화하던 것을 케이스당 한 번만 계산하고
+공유한다. 각 정규화 형태와 JSON/마크다운 파싱 결과는 처음 접근할 때 계산되어 캐시된다
+(schema_compliance, json_assertions, criteria_reference가 같은 파싱 결과를 사용).
+
+예시:
+    artifact = CaseArtifact(output)
+    keyword_inclusion(artifact, ["목표"])
+    exact_match(artifact, reference)
+"""
+
+import json
+import re
+import unicodedata
+from functools import cached_property
+from typing import Any
+
+_CODE_FENCE_RE = re.compile(r"^```[\w-]*\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+
+def strip_code_fence(text: str) -> str:
+    """JSON 출력을 감싼 코드 펜스(```json ... ```) 제거 (없으면 앞뒤 공백만 제거)."""
+    text = text.strip()
+    fenced = _CODE_FENCE_RE.match(text)
+    return fenced.group(1) if fenced else text
+
+
+class CaseArtifact:
+    """한 케이스 출력의 정규화 형태 모음.
+
+    Args:
+        raw: LLM 출력 원문
+
+    Attributes (지연 계산):
+        lower: 소문자화
+        collapsed: 연속 공백/줄바꿈을 공백 하나로, 앞뒤 공백 제거
+        nfc: 유니코드 NFC 정규화
+        nfkc: 유니코드 NFKC 정규화 (전각/호환 문자 통합)
+        normalized: NFC + 소문자 + 공백 정규화 (문자열 유사도 비교용)
+        tokens: 공백 기준 토큰 목록
+        json_value: 코드 펜스를 제거하고 파싱한 JSON (파싱 실패 시 None, json_error 확인)
+        json_error: JSON 파싱 오류 메시지 (성공 시 None)
+        markdown: 헤더/섹션/불릿 구조 (markdown_structure.MarkdownDocument)
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+
+    @classmethod
+    def of(cls, output: "str | CaseArtifact") -> "CaseArtifact":
+        """문자열이면 새로 만들고, 이미 CaseArtifact면 그대로 반환."""
+        return output if isinstance(output, CaseArtifact) else cls(output)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.raw.lower()
+
+    @cached_property
+    def collapsed(self) -> str:
+        return " ".join(self.tokens)
+
+    @cached_property
+    def nfc(self) -> str:
+        return unicodedata.normalize("NFC", self.raw)
+
+    @cached_property
+    def nfkc(self) -> str:
+        return unicodedata.normalize("NFKC", self.raw)
+
+    @cached_property
+    def normalized(self) -> str:
+        return " ".join(self.nfc.lower().split())
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        return self.raw.split()
+
+    @cached_property
+    def _parsed_json(self) -> tuple[Any, str | None]:
+        try:
+            return json.loads(strip_code_fence(self.raw)), None
+        except json.JSONDecodeError as e:
+            return None, str(e)
+
+    @property
+    def json_value(self) -> Any:
+        return self._parsed_json[0]
+
+    @property
+    def json_error(self) -> str | None:
+        return self._parsed_json[1]
+
+    @cached_property
+    def markdown(self):
+        from prompt_evaluator.evaluators.markdown_structure import parse_markdown
+
+        return parse_markdown(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __repr__(self) -> str:
+        preview = self.raw[:30] + ("..." if len(self.raw) > 30 else "")
+        return f"CaseArtifact({preview!r})"
@@ -0,0 +1,280 @@
+"""기준 코드별 이진 점수 참조 평가자 (Judge 호출 없음).
+
+leader_scoring처럼 출력이 {"scores": [{"criteria_code", "score", ...}]} 형태이고
+expected.json의 reference에 기대 고득점/저득점 항목 목록이 있는 경우,
+출력 점수를 참조 목록과 직접 비교하여 점수화한다.
+
+- 케이스 점수: 참조 목록에 있는 항목 중 출력 점수가 일치한 비율
+- 실험 단위: 항목별 정밀도/재현율과 혼동 행렬 (1점 = positive)
+
+예시 (expected.json):
+    "reference": {
+      "expected_high_score_criteria": ["LISTENING_03", ...],
+      "expected_low_score_criteria": ["LISTENING_01", ...]
+    }
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from prompt_evaluator.config import DEFAULT_CRITERIA_REFERENCE_THRESHOLD
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+
+HIGH_KEY = "expected_high_score_criteria"
+LOW_KEY = "expected_low_score_criteria"
+
+# 라벨/예측 행렬 값 (MISSING: 참조 없음 또는 출력에 항목 없음)
+MISSING = -1
+
+def parse_criteria_scores(
+    output: str | CaseArtifact | dict | list,
+) -> dict[str, int] | None:
+    """출력에서 {criteria_code: 0|1} 추출.
+
+    코드 펜스(```json)로 감싼 출력과 scores 리스트만 있는 출력도 허용한다.
+    CaseArtifact면 캐시된 JSON 파싱 결과를 사용한다.
+
+    Returns:
+        항목별 점수 (JSON 파싱 실패 또는 scores 형식이 아니면 None)
+    """
+    data = output
+    if isinstance(output, (str, CaseArtifact)):
+        artifact = CaseArtifact.of(output)
+        if artifact.json_error is not None:
+            return None
+        data = artifact.json_value
+
+    if isinstance(data, dict):
+        data = data.get("scores")
+    if not isinstance(data, list):
+        return None
+
+    scores = {}
+    for item in data:
+        if not isinstance(item, dict) or "criteria_code" not in item:
+            continue
+        try:
+            scores[str(item["criteria_code"])] = 1 if int(item.get("score", 0)) >= 1 else 0
+        except (TypeError, ValueError):
+            continue
+    return scores
+
+
+def get_reference_labels(expected: dict[str, Any]) -> dict[str, int]:
+    """expected.json 케이스에서 {criteria_code: 기대 점수} 추출 (참조 없으면 빈 dict)."""
+    reference = expected.get("reference")
+    if not isinstance(reference, dict):
+        return {}
+    labels = {code: 0 for code in reference.get(LOW_KEY) or []}
+    labels.update({code: 1 for code in reference.get(HIGH_KEY) or []})
+    return labels
+
+
+@dataclass
+class CriteriaReferenceReport:
+    """실험 단위 항목별 비교 결과.
+
+    Attributes:
+        codes: 항목 코드 (열 순서)
+        labels: (케이스 수, 항목 수) 기대 점수 (참조 없음은 MISSING)
+        predictions: (케이스 수, 항목 수) 출력 점수 (출력에 없음은 MISSING)
+        confusion: (항목 수, 2, 2) 항목별 혼동 행렬 [[TN, FP], [FN, TP]]
+        missing: (항목 수,) 참조는 있으나 출력에 점수가 없는 케이스 수
+        precision: (항목 수,) 정밀도 (예측 1이 없으면 NaN)
+        recall: (항목 수,) 재현율 (기대 1이 없으면 NaN)
+    """
+
+    codes: list[str]
+    labels: np.ndarray
+    predictions: np.ndarray
+    confusion: np.ndarray
+    missing: np.ndarray
+    precision: np.ndarray
+    recall: np.ndarray
+
+    @property
+    def total_confusion(self) -> np.ndarray:
+        """(2, 2) 전체 항목 합산 혼동 행렬."""
+        return self.confusion.sum(axis=0)
+
+    @property
+    def accuracy(self) -> float | None:
+        """참조가 있는 모든 (케이스, 항목) 중 일치 비율 (출력 누락은 불일치)."""
+        labeled = int((self.labels != MISSING).sum())
+        if labeled == 0:
+            return None
+        return float(np.trace(self.total_confusion)) / labeled
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 (NaN은 None)."""
+
+        def as_list(values: np.ndarray) -> list[float | None]:
+            return [None if np.isnan(v) else float(v) for v in values]
+
+        return {
+            "codes": self.codes,
+            "confusion": self.total_confusion.tolist(),
+            "accuracy": self.accuracy,
+            "per_criterion": {
+                code: {
+                    "precision": precision,
+                    "recall": recall,
+                    "confusion": matrix,
+                    "missing": missing,
+                }
+                for code, precision, recall, matrix, missing in zip(
+                    self.codes,
+                    as_list(self.precision),
+                    as_list(self.recall),
+                    self.confusion.tolist(),
+                    self.missing.tolist(),
+                )
+            },
+        }
+
+
+def build_criteria_reference_report(
+    predictions: list[dict[str, int] | None],
+    labels: list[dict[str, int]],
+) -> CriteriaReferenceReport:
+    """케이스별 예측/기대 점수 목록을 행렬로 만들어 항목별 지표를 한 번에 계산.
+
+    Args:
+        predictions: 케이스별 parse_criteria_scores 결과 (파싱 실패는 None)
+        labels: 같은 순서의 get_reference_labels 결과
+    """
+    if len(predictions) != len(labels):
+        raise ValueError("predictions와 labels의 길이가 다릅니다.")
+
+    codes = sorted({code for case in labels for code in case})
+    column = {code: j for j, code in enumerate(codes)}
+    n, k = len(labels), len(codes)
+    label_matrix = np.full((n, k), MISSING, dtype=np.int8)
+    pred_matrix = np.full((n, k), MISSING, dtype=np.int8)
+    for i, (pred, label) in enumerate(zip(predictions, labels)):
+        for code, value in label.items():
+            label_matrix[i, column[code]] = value
+        for code, value in (pred or {}).items():
+            if code in column:
+                pred_matrix[i, column[code]] = value
+
+    labeled = label_matrix != MISSING
+    predicted = pred_matrix != MISSING
+    compared = labeled & predicted
+    confusion = np.zeros((k, 2, 2), dtype=np.int64)
+    for actual in (0, 1):
+        for guess in (0, 1):
+            confusion[:, actual, guess] = (
+                compared & (label_matrix == actual) & (pred_matrix == guess)
+            ).sum(axis=0)
+
+    tp = confusion[:, 1, 1].astype(float)
+    predicted_pos = confusion[:, :, 1].sum(axis=1).astype(float)
+    actual_pos = (labeled & (label_matrix == 1)).sum(axis=0).astype(float)
+    precision = np.divide(
+        tp, predicted_pos, out=np.full(k, np.nan), where=predicted_pos > 0
+    )
+    recall = np.divide(tp, actual_pos, out=np.full(k, np.nan), where=actual_pos > 0)
+
+    return CriteriaReferenceReport(
+        codes=codes,
+        labels=label_matrix,
+        predictions=pred_matrix,
+        confusion=confusion,
+        missing=(labeled & ~predicted).sum(axis=0),
+        precision=precision,
+        recall=recall,
+    )
+
+
+def criteria_reference_batch(
+    outputs: list[str | CaseArtifact],
+    expected_list: list[dict[str, Any]],
+    threshold: float = DEFAULT_CRITERIA_REFERENCE_THRESHOLD,
+) -> tuple[list[dict[str, Any] | None], CriteriaReferenceReport]:
+    """출력/참조 쌍 목록을 한 번에 비교.
+
+    Args:
+        outputs: LLM 출력 목록
+        expected_list: 같은 순서의 expected.json 케이스 데이터
+        threshold: 케이스 통과 기준 일치율
+
+    Returns:
+        (케이스별 결과, 실험 단위 리포트). 참조가 없는 케이스의 결과는 None,
+        케이스 결과는 {"score", "passed", "mismatched", "missing", "details"}
+        (출력 파싱 실패는 score 0.0)
+    """
+    predictions = [parse_criteria_scores(output) for output in outputs]
+    labels = [get_reference_labels(expected) for expected in expected_list]
+    report = build_criteria_reference_report(predictions, labels)
+
+    labeled = report.labels != MISSING
+    correct = (labeled & (report.labels == report.predictions)).sum(axis=1)
+    labeled_count = labeled.sum(axis=1)
+
+    results: list[dict[str, Any] | None] = []
+    for i, (pred, label) in enumerate(zip(predictions, labels)):
+        if not label:
+            results.append(None)
+            continue
+        if pred is None:
+            results.append(
+                {
+                    "score": 0.0,
+                    "passed": False,
+                    "mismatched": [],
+                    "missing": sorted(label),
+                    "details": "Output is not a criteria score JSON",
+                }
+            )
+            continue
+        score = float(correct[i]) / int(labeled_count[i])
+        mismatched = [c for c, v in label.items() if c in pred and pred[c] != v]
+        missing = [c for c in label if c not in pred]
+        details = f"Matched {int(correct[i])}/{int(labeled_count[i])} reference criteria"
+        if mismatched:
+            details += f", mismatched: {', '.join(sorted(mismatched))}"
+        if missing:
+            details += f", missing: {', '.join(sorted(missing))}"
+        results.append(
+            {
+                "score": score,
+                "passed": score >= threshold,
+                "mismatched": sorted(mismatched),
+                "missing": sorted(missing),
+                "details": details,
+            }
+        )
+    return results, report
+
+
+def criteria_reference_check(
+    output: str | CaseArtifact,
+    expected: dict[str, Any],
+    threshold: float = DEFAULT_CRITERIA_REFERENCE_THRESHOLD,
+) -> dict[str, Any] | None:
+    """단일 케이스 비교 (참조가 없으면 None)."""
+    return criteria_reference_batch([output], [expected], threshold)[0][0]
+
+
+def format_criteria_reference_report(report: CriteriaReferenceReport) -> str:
+    """실험 단위 리포트 요약 문자열 (불일치가 많은 항목 최대 5개 표시)."""
+    (tn, fp), (fn, tp) = report.total_confusion.tolist()
+    accuracy = report.accuracy
+    head = f"TP={tp} FP={fp} FN={fn} TN={tn}"
+    if accuracy is not None:
+        head += f", accuracy {accuracy:.0%}"
+
+    errors = report.confusion[:, 0, 1] + report.confusion[:, 1, 0] + report.missing
+    worst = [
+        f"{report.codes[j]}(P={_pct(report.precision[j])}, R={_pct(report.recall[j])})"
+        for j in np.argsort(-errors, kind="stable")[:5]
+        if errors[j] > 0
+    ]
+    return head + (f"; weakest: {', '.join(worst)}" if worst else "")
+
+
+def _pct(value: float) -> str:
+    return "-" if np.isnan(value) else f"{value:.0%}"
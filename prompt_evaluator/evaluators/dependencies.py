@@ -0,0 +1,85 @@
+"""평가자 간 의존성 처리.
+
+config.yaml의 llm_judge 평가자에 depends_on을 지정하면, 선행 rule-based
+검사가 실패한 케이스에서는 Judge 호출을 건너뛰고 점수를 skipped로 기록한다.
+depends_on에는 sanity 검사(scoring.SANITY_CHECKS)만 지정할 수 있다.
+(compute_pass_result는 sanity 실패 시 Judge 점수와 무관하게 실패 처리하므로
+해당 케이스의 Judge 호출은 비용만 발생시킨다.)
+
+예시:
+    evaluators:
+      - type: llm_judge
+        depends_on:
+          - keyword_inclusion
+          - forbidden_word_check
+        criteria: [...]
+"""
+
+from typing import Any
+
+from prompt_evaluator.evaluators.rule_based import run_rule_evaluators
+from prompt_evaluator.evaluators.scoring import SANITY_CHECKS
+
+
+def get_judge_dependencies(llm_judge_config: dict | None) -> list[str]:
+    """llm_judge 설정에서 선행 rule-based 검사 목록 추출.
+
+    Args:
+        llm_judge_config: config.yaml의 llm_judge 평가자 설정
+
+    Returns:
+        선행 검사 이름 목록 (미지정 시 빈 리스트)
+
+    Raises:
+        ValueError: sanity 검사(SANITY_CHECKS)가 아닌 이름이 포함된 경우
+    """
+    if not llm_judge_config:
+        return []
+
+    depends_on = llm_judge_config.get("depends_on") or []
+    unsupported = [d for d in depends_on if d not in SANITY_CHECKS]
+    if unsupported:
+        raise ValueError(
+            f"depends_on은 sanity 검사만 허용: {unsupported} (허용: {list(SANITY_CHECKS)})"
+        )
+    return list(depends_on)
+
+
+def find_failed_dependencies(
+    output: str,
+    expected: dict[str, Any],
+    depends_on: list[str],
+    eval_config: dict[str, Any] | None = None,
+) -> list[str]:
+    """선행 검사 중 실패한 항목 반환.
+
+    Args:
+        output: LLM 출력 텍스트
+        expected: expected.json의 해당 케이스 데이터
+        depends_on: 선행 검사 이름 목록
+        eval_config: config.yaml 설정 (rule-based 평가자와 같은 normalize/옵션 적용)
+
+    Returns:
+        실패한 검사 이름 목록 (모두 통과하면 빈 리스트)
+    """
+    if not depends_on:
+        return []
+
+    results = run_rule_evaluators(
+        output, expected, checks=depends_on, eval_config=eval_config
+    )
+    return get_failed_checks(results)
+
+
+def get_failed_checks(results: dict[str, dict[str, Any]]) -> list[str]:
+    """검사 결과({검사 이름: 결과}) 중 실패한 검사 이름.
+
+    실험 중에는 CaseResultCache.run(case_id, output, depends_on) 결과를 넘겨
+    rule-based 평가자가 이미 실행한 검사를 다시 실행하지 않는다.
+    """
+    return [name for name, result in results.items() if not result["passed"]]
+
+
+def format_skip_comment(failed: list[str]) -> str:
+    """skipped 점수에 남길 사유 문자열."""
+    return f"Skipped: dependency failed ({', '.join(failed)})"
@@ -0,0 +1,249 @@
+"""JSON 경로 단언 검사 (Judge 호출 없음).
+
+output_format: json 타겟에서 출력 전체를 문자열로 비교하는 대신, expected.json 케이스별
+assertions에 JSON 경로와 기대 조건을 선언해 필요한 값만 확인한다. 출력 JSON은 케이스당
+한 번만 파싱되어(CaseArtifact) schema_compliance, criteria_reference와 공유된다.
+
+    # expected.json
+    "case_id": {
+      "assertions": [
+        {"path": "$.question_context", "length": {"min": 5, "max": 7}},
+        {"path": "$.question_context[*].question_theme", "type": "string"},
+        {"path": "$.question_context[0].response_quality", "equals": "detailed"},
+        {"path": "$.question_context[*].question_theme", "equals": "Work", "any": true},
+        {"path": "$.batch_id", "exists": false}
+      ]
+    }
+
+타겟 공통 단언은 config.yaml rule_based 블록의 json_assertions에 같은 형식으로 선언한다.
+
+경로 문법 (JSONPath 부분 집합):
+    $            루트
+    .key         객체 키 (['key'] / ["key"]도 허용)
+    [0], [-1]    배열 인덱스
+    [*], .*      배열 원소 / 객체 값 전체
+
+조건 (한 단언에 여러 개 지정 가능, 경로가 여러 값에 매칭되면 기본적으로 모든 값이 만족해야 함):
+    equals       값이 같음
+    contains     문자열이면 부분 문자열, 배열이면 원소, 객체면 키 포함
+    length       길이 범위 {"min", "max"} 또는 정확한 길이 (정수)
+    type         string | number | integer | boolean | array | object | null
+    exists       경로 존재 여부 (기본 true)
+
+경로가 여러 값에 매칭될 때 하나만 만족해도 되면 "any": true를 함께 지정한다.
+    {"path": "$.question_context[*].question_theme", "equals": "Career", "any": true}
+"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+
+JSON_ASSERTION_OPS = ["equals", "contains", "length", "type", "exists"]
+JSON_ASSERTION_MODIFIERS = ["any"]
+
+JSON_TYPES = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+_STEP_RE = re.compile(
+    r"\.(?P<key>[^.\[\]]+)"
+    r"|\[(?P<index>-?\d+)\]"
+    r"|\[(?P<wild>\*)\]"
+    r"|\['(?P<sq>[^']*)'\]"
+    r'|\["(?P<dq>[^"]*)"\]'
+)
+
+_WILDCARD = object()
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> tuple:
+    """'$.a[0].b' → ("a", 0, "b") (같은 경로는 한 번만 파싱).
+
+    Raises:
+        ValueError: 지원하지 않는 경로 문법
+    """
+    if not path.startswith("$"):
+        raise ValueError(f"JSON 경로는 '$'로 시작해야 합니다: {path}")
+    steps = []
+    position = 1
+    while position < len(path):
+        match = _STEP_RE.match(path, position)
+        if not match:
+            raise ValueError(f"잘못된 JSON 경로 '{path}' (위치 {position})")
+        if match.group("index") is not None:
+            steps.append(int(match.group("index")))
+        elif match.group("wild") or match.group("key") == "*":
+            steps.append(_WILDCARD)
+        else:
+            key = match.group("key")
+            steps.append(key if key is not None else match.group("sq") or match.group("dq") or "")
+        position = match.end()
+    return tuple(steps)
+
+
+def resolve_path(data: Any, path: str) -> list[Any]:
+    """경로에 매칭되는 값 목록 (없으면 빈 리스트)."""
+    values = [data]
+    for step in compile_path(path):
+        next_values = []
+        for value in values:
+            if step is _WILDCARD:
+                if isinstance(value, list):
+                    next_values.extend(value)
+                elif isinstance(value, dict):
+                    next_values.extend(value.values())
+            elif isinstance(step, int):
+                if isinstance(value, list) and -len(value) <= step < len(value):
+                    next_values.append(value[step])
+            elif isinstance(value, dict) and step in value:
+                next_values.append(value[step])
+        values = next_values
+    return values
+
+
+def _check_value(value: Any, assertion: dict[str, Any]) -> str | None:
+    """값 하나에 대한 조건 검사 (실패 시 사유 문자열)."""
+    if "type" in assertion:
+        check = JSON_TYPES.get(assertion["type"])
+        if check is None or not check(value):
+            return f"type {type(value).__name__} != {assertion['type']}"
+    if "equals" in assertion and value != assertion["equals"]:
+        return f"{value!r} != {assertion['equals']!r}"
+    if "contains" in assertion:
+        needle = assertion["contains"]
+        if isinstance(value, str):
+            ok = isinstance(needle, str) and needle in value
+        elif isinstance(value, (list, dict)):
+            ok = needle in value
+        else:
+            ok = False
+        if not ok:
+            return f"does not contain {needle!r}"
+    if "length" in assertion:
+        if not isinstance(value, (str, list, dict)):
+            return f"length of {type(value).__name__}"
+        bounds = assertion["length"]
+        if isinstance(bounds, int):
+            bounds = {"min": bounds, "max": bounds}
+        low, high = bounds.get("min", 0), bounds.get("max")
+        if len(value) < low or (high is not None and len(value) > high):
+            return f"length {len(value)} not in [{low}, {high if high is not None else '∞'}]"
+    return None
+
+
+def check_assertion(data: Any, assertion: dict[str, Any]) -> str | None:
+    """단언 하나 검사 (통과 시 None, 실패 시 사유)."""
+    values = resolve_path(data, assertion["path"])
+    if not assertion.get("exists", True):
+        return f"exists ({len(values)} matches)" if values else None
+    if not values:
+        return "path not found"
+    reasons = [_check_value(value, assertion) for value in values]
+    if assertion.get("any", False):
+        return None if None in reasons else f"no match among {len(values)} values ({reasons[0]})"
+    return next((reason for reason in reasons if reason), None)
+
+
+def get_json_assertions(
+    options: list[dict[str, Any]] | None, expected: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """타겟 공통 단언(config.yaml)과 케이스별 assertions(expected.json)를 합친 목록."""
+    return list(options or []) + list((expected or {}).get("assertions") or [])
+
+
+def json_assertions(
+    output: str | CaseArtifact, assertions: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """출력 JSON에 경로 단언 검사.
+
+    Args:
+        output: LLM 출력 텍스트 또는 CaseArtifact (캐시된 파싱 결과 사용)
+        assertions: get_json_assertions() 결과
+
+    Returns:
+        {
+            "score": float (만족한 단언 비율),
+            "passed": bool,
+            "failures": [{"path": str, "reason": str}, ...],
+            "details": str
+        }
+    """
+    if not assertions:
+        return {
+            "score": 1.0,
+            "passed": True,
+            "failures": [],
+            "details": "No assertions to check",
+        }
+
+    artifact = CaseArtifact.of(output)
+    if artifact.json_error is not None:
+        return {
+            "score": 0.0,
+            "passed": False,
+            "failures": [{"path": "$", "reason": f"Invalid JSON: {artifact.json_error}"}],
+            "details": f"Invalid JSON: {artifact.json_error}",
+        }
+
+    failures = []
+    for assertion in assertions:
+        reason = check_assertion(artifact.json_value, assertion)
+        if reason:
+            failures.append({"path": assertion["path"], "reason": reason})
+
+    total = len(assertions)
+    if failures:
+        shown = "; ".join(f"{f['path']}: {f['reason']}" for f in failures)
+        details = f"{len(failures)}/{total} assertions failed: {shown}"
+    else:
+        details = f"All {total} assertions passed"
+    return {
+        "score": (total - len(failures)) / total,
+        "passed": not failures,
+        "failures": failures,
+        "details": details,
+    }
+
+
+def json_exact_match(output: str | CaseArtifact, reference: Any) -> dict[str, Any]:
+    """출력 JSON과 구조화된 reference의 값 비교 (키 순서/공백 무관).
+
+    Returns:
+        {"score": float (0.0 or 1.0), "passed": bool, "details": str}
+    """
+    artifact = CaseArtifact.of(output)
+    if artifact.json_error is not None:
+        return {
+            "score": 0.0,
+            "passed": False,
+            "details": f"Invalid JSON: {artifact.json_error}",
+        }
+    passed = artifact.json_value == reference
+    return {
+        "score": 1.0 if passed else 0.0,
+        "passed": passed,
+        "details": "Exact match (JSON)" if passed else "Not an exact match (JSON)",
+    }
+
+
+def create_json_assertions_check(options: list[dict[str, Any]], eval_config: dict[str, Any]):
+    """registry 팩토리. config.yaml 공통 단언의 경로는 실험 시작 시 컴파일한다."""
+    for assertion in options or []:
+        compile_path(assertion["path"])
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any] | None:
+        assertions = get_json_assertions(options, expected)
+        if not assertions:
+            return None
+        return json_assertions(artifact, assertions)
+
+    return check
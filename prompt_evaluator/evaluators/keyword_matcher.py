@@ -0,0 +1,179 @@
+"""다중 키워드 매칭 (Aho-Corasick).
+
+키워드 목록을 한 번 오토마톤으로 컴파일해 두고, 출력 텍스트를 한 번 훑으면서
+포함된 키워드를 모두 찾는다. 키워드마다 `in` 검사를 반복하는 방식(키워드 수 × 출력 길이)과
+결과는 같고, 같은 키워드 목록은 캐시된 오토마톤을 재사용한다 (평가자/백엔드 간 공유).
+
+키워드가 적으면 C로 구현된 `in` 검사가 더 빠르므로, KEYWORD_AUTOMATON_MIN_TERMS개 미만이면
+오토마톤을 만들지 않고 `in` 검사를 그대로 사용한다.
+
+config.yaml rule_based 블록의 match로 매칭 방식을 고른다:
+    substring: 부분 문자열 포함 (기본)
+    morpheme: 어절 단위 어간 비교 (morphology.py, 한국어 조사/활용형 처리)
+"""
+
+from collections import deque
+from functools import lru_cache
+
+from prompt_evaluator.config import KEYWORD_AUTOMATON_MIN_TERMS
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+from prompt_evaluator.evaluators.normalization import get_normalizer
+
+MATCH_MODES = ["substring", "morpheme"]
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 오토마톤 (문자 단위 trie + failure link).
+
+    Args:
+        terms: 검색할 키워드 목록 (이미 대소문자 정규화된 상태)
+    """
+
+    def __init__(self, terms: tuple[str, ...]):
+        self.terms = terms
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for index, term in enumerate(terms):
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(index)
+
+        # BFS로 failure link 계산, 출력은 failure 체인을 따라 미리 합쳐 둠
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(out) for out in outputs]
+        self._alphabet = frozenset(ch for edges in goto for ch in edges)
+        # 빈 문자열 키워드는 항상 포함된 것으로 본다 ("" in text)
+        self._always = frozenset(i for i, term in enumerate(terms) if term == "")
+
+    def search(self, text: str) -> set[int]:
+        """text에 포함된 키워드 인덱스 집합 (모든 키워드를 찾으면 조기 종료)."""
+        found = set(self._always)
+        remaining = len(self.terms) - len(found)
+        if remaining == 0:
+            return found
+
+        goto, fail, outputs, alphabet = (
+            self._goto,
+            self._fail,
+            self._outputs,
+            self._alphabet,
+        )
+        state = 0
+        for ch in text:
+            if ch not in alphabet:
+                state = 0
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    if index not in found:
+                        found.add(index)
+                        remaining -= 1
+                if remaining == 0:
+                    break
+        return found
+
+
+@lru_cache(maxsize=1024)
+def compile_keywords(terms: tuple[str, ...]) -> KeywordAutomaton:
+    """키워드 튜플 → 오토마톤 (같은 목록은 한 번만 컴파일)."""
+    return KeywordAutomaton(terms)
+
+
+def find_terms(
+    text: str | CaseArtifact,
+    terms: list[str],
+    case_sensitive: bool = False,
+    normalize: tuple[str, ...] = (),
+    mode: str = "substring",
+) -> list[bool]:
+    """각 키워드가 text에 포함되는지 여부 (terms와 같은 순서).
+
+    Args:
+        text: 검색 대상 텍스트 (CaseArtifact면 캐시된 소문자 형태 사용)
+        terms: 키워드 목록
+        case_sensitive: 대소문자 구분 여부
+        normalize: 텍스트와 키워드에 함께 적용할 정규화 단계 (normalization.py)
+        mode: 매칭 방식 (MATCH_MODES)
+    """
+    if mode not in MATCH_MODES:
+        raise ValueError(f"알 수 없는 match 방식: {mode} (허용: {MATCH_MODES})")
+    if not terms:
+        return []
+    artifact = CaseArtifact.of(text)
+    if normalize:
+        normalizer = get_normalizer(normalize)
+        text = normalizer(artifact.raw)
+        terms = [normalizer(term) for term in terms]
+        if not case_sensitive:
+            text = text.lower()
+            terms = [term.lower() for term in terms]
+    elif case_sensitive:
+        text = artifact.raw
+    else:
+        text = artifact.lower
+        terms = [term.lower() for term in terms]
+    if mode == "morpheme":
+        from prompt_evaluator.evaluators.morphology import get_morpheme_index
+
+        index = get_morpheme_index(text)
+        return [index.contains(term) for term in terms]
+    if len(terms) < KEYWORD_AUTOMATON_MIN_TERMS:
+        return [term in text for term in terms]
+
+    found = compile_keywords(tuple(terms)).search(text)
+    return [i in found for i in range(len(terms))]
+
+
+def get_match_mode(eval_config: dict | None) -> str:
+    """config.yaml rule_based 블록의 match 방식 (미지정 시 substring)."""
+    for evaluator in (eval_config or {}).get("evaluators", []):
+        if evaluator.get("type") == "rule_based":
+            return evaluator.get("match") or "substring"
+    return "substring"
+
+
+def match_terms(
+    output: str | CaseArtifact,
+    keywords: list[str],
+    forbidden: list[str],
+    case_sensitive: bool = False,
+    normalize: tuple[str, ...] = (),
+    mode: str = "substring",
+) -> dict[str, list[str]]:
+    """기대 키워드와 금지어를 한 번의 스캔으로 검사.
+
+    Returns:
+        {"found": [...], "missing": [...], "violations": [...]} (각각 입력 순서 유지)
+    """
+    hits = find_terms(
+        output, list(keywords) + list(forbidden), case_sensitive, normalize, mode
+    )
+    keyword_hits, forbidden_hits = hits[: len(keywords)], hits[len(keywords) :]
+    return {
+        "found": [k for k, hit in zip(keywords, keyword_hits) if hit],
+        "missing": [k for k, hit in zip(keywords, keyword_hits) if not hit],
+        "violations": [w for w, hit in zip(forbidden, forbidden_hits) if hit],
+    }
@@ -1,19 +1,382 @@
 """LLM-as-a-Judge 평가자.
 
 eval_prompts/{criterion}.txt에서 평가 프롬프트를 로드하여 실행.
+
+Judge 응답은 기준별 체크리스트 키로 생성한 JSON Schema(OpenAI structured output)로
+강제하고, 검증에 실패하면 제한된 횟수만큼 repair 재요청한다.
+끝내 실패한 기준은 0.0이 아닌 error 상태로 기록하여 평균 계산에서 제외한다.
+
+메시지는 provider prefix 캐싱이 최대한 적용되도록 고정된 순서로 구성한다:
+    system (공통) → 타겟 프롬프트 (타겟 내 공통) → 기준 루브릭 (기준 내 공통) → 케이스 입력/출력
+
+평가 프롬프트 파일은 선택적인 YAML front matter로 기준이 필요로 하는 입력을 선언할 수 있다:
+    ---
+    inputs: none          # all (기본) | none | [field, ...]
+    prompt: false         # 타겟 프롬프트 포함 여부 (기본 true)
+    ---
+선언되지 않은 입력은 Judge 메시지에서 빠지며, 절약된 입력 토큰은 기준별로 집계한다.
+
+criterion_options의 mode: logprob인 체크리스트 기준은 JSON 대신 항목별 0/1 한 토큰만
+생성하게 하고, 토큰 logprob에서 P(1)을 읽어 확률 점수로 사용한다.
 """
 
+import contextvars
 import json
+import math
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
 import logging
 
+import yaml
+
+from prompt_evaluator.config import (
+    DEFAULT_JUDGE_REPAIR_RETRIES,
+    DEFAULT_LOGPROB_TOP_K,
+    DEFAULT_SELF_CONSISTENCY_MIN_SAMPLES,
+    DEFAULT_SELF_CONSISTENCY_TEMPERATURE,
+)
 from prompt_evaluator.models import get_judge_llm
 
 logger = logging.getLogger(__name__)
 
+JUDGE_SYSTEM_PROMPT = "You are a precise evaluator. Score each checklist item as 0 (fail) or 1 (pass). Be strict but fair. Respond with valid JSON only."
+
+# 평가 프롬프트의 Response Format에서 "checklist": {{ ... }} 블록 추출
+_CHECKLIST_BLOCK_RE = re.compile(r'"checklist"\s*:\s*\{\{(.*?)\}\}', re.DOTALL)
+_CHECKLIST_KEY_RE = re.compile(r'"(\w+)"\s*:')
+
+
+# 케이스별로 달라지는 placeholder ({{input}} 같은 escape는 제외)
+_DYNAMIC_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{(input|output)\}(?!\})")
+_PROMPT_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{prompt\}(?!\})")
+_INPUT_PLACEHOLDER_RE = re.compile(r"(?<!\{)\{input\}(?!\})")
+_SECTION_HEADING_RE = re.compile(r"^#{1,6} ", re.MULTILINE)
+
+TARGET_PROMPT_REFERENCE = "(See the target prompt provided above.)"
+OMITTED_REFERENCE = "(Not provided: not needed for this criterion.)"
+
+# 평가 프롬프트 파일 맨 앞의 YAML front matter
+_FRONT_MATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)\n---[ \t]*(?:\n|\Z)", re.DOTALL)
+
+# criterion_options.mode 허용 값
+JUDGE_MODES = ["json", "logprob"]
+
+
+class JudgeValidationError(ValueError):
+    """Judge 응답이 체크리스트 스키마를 만족하지 않는 경우."""
+
+
+def parse_criterion_file(text: str) -> tuple[dict, str]:
+    """평가 프롬프트 파일을 front matter와 본문 템플릿으로 분리.
+
+    Returns:
+        (front matter dict, 본문 템플릿). front matter가 없으면 ({}, text)
+
+    Raises:
+        ValueError: front matter가 YAML mapping이 아닌 경우
+    """
+    match = _FRONT_MATTER_RE.match(text)
+    if not match:
+        return {}, text
+    meta = yaml.safe_load(match.group(1)) or {}
+    if not isinstance(meta, dict):
+        raise ValueError("평가 프롬프트 front matter는 YAML mapping이어야 합니다.")
+    return meta, text[match.end() :]
+
+
+def project_inputs(inputs: dict, spec: Any = "all") -> dict | None:
+    """front matter의 inputs 선언에 따라 Judge에 전달할 입력만 남김.
+
+    Args:
+        inputs: 케이스 입력 전체
+        spec: "all" | "none" | [field, ...]
+
+    Returns:
+        투영된 입력 (none이면 None)
+    """
+    if spec is None or spec == "all":
+        return inputs
+    if spec == "none" or spec is False:
+        return None
+    if isinstance(spec, str):
+        spec = [spec]
+    return {key: inputs[key] for key in spec if key in inputs}
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # 인코딩 파일을 받을 수 없는 오프라인 환경 등
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (tiktoken 사용 불가 시 문자 4개당 1토큰)."""
+    if not text:
+        return 0
+    encoder = _token_encoder()
+    if encoder is None:
+        return max(1, len(text) // 4)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def extract_checklist_keys(template: str) -> list[str]:
+    """평가 프롬프트의 Response Format에서 체크리스트 키 목록 추출.
+
+    Args:
+        template: eval_prompts/{criterion}.txt 내용
+
+    Returns:
+        체크리스트 키 목록 (체크리스트가 없으면 빈 리스트)
+    """
+    match = _CHECKLIST_BLOCK_RE.search(template)
+    if not match:
+        return []
+    return list(dict.fromkeys(_CHECKLIST_KEY_RE.findall(match.group(1))))
+
+
+def build_verdict_schema(criterion: str, checklist_keys: list[str]) -> dict:
+    """체크리스트 키로 Judge 응답용 JSON Schema (OpenAI response_format) 생성.
+
+    Args:
+        criterion: 평가 기준 이름 (예: general/output_quality)
+        checklist_keys: 체크리스트 키 목록
+
+    Returns:
+        response_format에 전달할 json_schema dict
+    """
+    if checklist_keys:
+        properties: dict[str, Any] = {
+            "checklist": {
+                "type": "object",
+                "properties": {
+                    key: {"type": "integer", "enum": [0, 1]} for key in checklist_keys
+                },
+                "required": checklist_keys,
+                "additionalProperties": False,
+            },
+            "feedback": {"type": "string"},
+        }
+    else:
+        properties = {
+            "score": {"type": "number"},
+            "feedback": {"type": "string"},
+        }
+
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": re.sub(r"[^a-zA-Z0-9_-]", "_", criterion)[:64],
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": properties,
+                "required": list(properties),
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def parse_verdict(content: str, checklist_keys: list[str]) -> dict:
+    """Judge 응답을 파싱하고 체크리스트 스키마로 검증.
+
+    Args:
+        content: Judge 응답 텍스트 (JSON)
+        checklist_keys: 기대하는 체크리스트 키 목록
+
+    Returns:
+        {"score": float, "checklist": dict, "feedback": str}
+
+    Raises:
+        JudgeValidationError: JSON 파싱 또는 스키마 검증 실패
+    """
+    try:
+        result = json.loads(content)
+    except (json.JSONDecodeError, TypeError) as e:
+        raise JudgeValidationError(f"JSON 파싱 실패: {e}") from e
+
+    if not isinstance(result, dict):
+        raise JudgeValidationError("응답이 JSON object가 아닙니다.")
+
+    feedback = result.get("feedback", "")
+
+    if checklist_keys:
+        checklist = result.get("checklist")
+        if not isinstance(checklist, dict):
+            raise JudgeValidationError("checklist 필드가 없습니다.")
+        missing = [k for k in checklist_keys if k not in checklist]
+        if missing:
+            raise JudgeValidationError(f"checklist 항목 누락: {missing}")
+        invalid = [k for k in checklist_keys if checklist[k] not in (0, 1)]
+        if invalid:
+            raise JudgeValidationError(f"checklist 값은 0 또는 1이어야 합니다: {invalid}")
+        checklist = {k: int(checklist[k]) for k in checklist_keys}
+        score = sum(checklist.values()) / len(checklist)
+        return {"score": float(score), "checklist": checklist, "feedback": feedback}
+
+    score = result.get("score")
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        raise JudgeValidationError("score 필드가 숫자가 아닙니다.")
+    if not 0.0 <= score <= 1.0:
+        raise JudgeValidationError(f"score 범위 초과: {score}")
+    return {"score": float(score), "checklist": {}, "feedback": feedback}
+
+
+def split_judge_template(template: str) -> tuple[str, str]:
+    """평가 프롬프트를 케이스 공통(static) 부분과 케이스별(dynamic) 부분으로 분리.
+
+    마크다운 헤딩 단위로 섹션을 나누고, {input}/{output}을 포함한 섹션만
+    원래 순서대로 뒤쪽으로 옮긴다. 나머지 섹션(루브릭, 체크리스트, 응답 형식)은
+    원래 순서를 유지한다.
+
+    Returns:
+        (static 템플릿, dynamic 템플릿)
+    """
+    starts = [m.start() for m in _SECTION_HEADING_RE.finditer(template)]
+    bounds = [0] + [i for i in starts if i > 0] + [len(template)]
+    sections = [template[a:b] for a, b in zip(bounds, bounds[1:]) if template[a:b]]
+
+    static = [sec for sec in sections if not _DYNAMIC_PLACEHOLDER_RE.search(sec)]
+    dynamic = [sec for sec in sections if _DYNAMIC_PLACEHOLDER_RE.search(sec)]
+    return "".join(static).strip(), "".join(dynamic).strip()
+
+
+def build_judge_messages(
+    template: str,
+    prompt_template: str,
+    input_text: str,
+    output: str,
+    include_prompt: bool = True,
+) -> list[tuple[str, str]]:
+    """prefix 캐싱에 유리한 고정 순서로 Judge 메시지 구성.
+
+    1. system: 모든 Judge 호출 공통
+    2. user: 타겟 프롬프트 전문 (템플릿에 {prompt}가 있는 경우, 타겟 내 모든 기준 공통)
+    3. user: 기준 루브릭/체크리스트/응답 형식 (기준 내 모든 케이스 공통)
+    4. user: 케이스 입력/출력
+
+    include_prompt가 False면 타겟 프롬프트 메시지를 생략한다 (front matter prompt: false).
+    """
+    static, dynamic = split_judge_template(template)
+    uses_prompt = include_prompt and bool(_PROMPT_PLACEHOLDER_RE.search(template))
+    format_args = {
+        "prompt": TARGET_PROMPT_REFERENCE if include_prompt else OMITTED_REFERENCE,
+        "input": input_text,
+        "output": output,
+    }
+
+    messages = [("system", JUDGE_SYSTEM_PROMPT)]
+    if uses_prompt:
+        target_prompt = prompt_template if prompt_template else "(프롬프트 없음)"
+        messages.append(("user", f"## Target Prompt:\n{target_prompt}"))
+    if static:
+        messages.append(("user", static.format(**format_args)))
+    if dynamic:
+        messages.append(("user", dynamic.format(**format_args)))
+    return messages
+
+
+# =============================================================================
+# Judge 토큰 사용량 집계 (prompt cache 적중 확인용)
+# =============================================================================
+
+# 사용량 집계 범위 (카나리아 등 실험 외 Judge 호출은 별도 범위로 기록)
+EXPERIMENT_USAGE_SCOPE = "experiment"
+_usage_scope: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "judge_usage_scope", default=EXPERIMENT_USAGE_SCOPE
+)
+_usage_lock = threading.Lock()
+_usage_totals: dict[str, dict[str, int]] = {}
+_tokens_saved: dict[str, dict[str, int]] = {}
+
+
+def _scope_totals(scope: str) -> dict[str, int]:
+    return _usage_totals.setdefault(
+        scope, {"calls": 0, "input_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    )
+
+
+@contextmanager
+def judge_usage_scope(scope: str):
+    """블록 안의 Judge 호출 사용량을 scope 범위로 따로 집계 (get_judge_usage(scope)로 조회)."""
+    token = _usage_scope.set(scope)
+    try:
+        yield
+    finally:
+        _usage_scope.reset(token)
+
+
+def extract_usage(response) -> dict[str, int]:
+    """Judge 응답에서 입력/캐시/출력 토큰 수 추출."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    input_tokens = usage.get("input_tokens", 0)
+    output_tokens = usage.get("output_tokens", 0)
+    cached_tokens = (usage.get("input_token_details") or {}).get("cache_read", 0)
+
+    if not usage:
+        # usage_metadata가 없는 경우 OpenAI 원본 token_usage 사용
+        metadata = getattr(response, "response_metadata", None) or {}
+        token_usage = metadata.get("token_usage") or {}
+        input_tokens = token_usage.get("prompt_tokens", 0)
+        output_tokens = token_usage.get("completion_tokens", 0)
+        cached_tokens = (token_usage.get("prompt_tokens_details") or {}).get(
+            "cached_tokens", 0
+        )
+
+    return {
+        "input_tokens": input_tokens or 0,
+        "cached_tokens": cached_tokens or 0,
+        "output_tokens": output_tokens or 0,
+    }
+
+
+def record_judge_usage(usage: dict[str, int]) -> None:
+    """Judge 호출 1회의 토큰 사용량을 현재 집계 범위에 누적."""
+    with _usage_lock:
+        totals = _scope_totals(_usage_scope.get())
+        totals["calls"] += 1
+        for key in ("input_tokens", "cached_tokens", "output_tokens"):
+            totals[key] += usage.get(key, 0)
+
+
+def record_tokens_saved(criterion: str, tokens: int) -> None:
+    """입력 투영으로 절약한 Judge 입력 토큰 수를 기준별로 누적."""
+    with _usage_lock:
+        saved = _tokens_saved.setdefault(_usage_scope.get(), {})
+        saved[criterion] = saved.get(criterion, 0) + tokens
+
+
+def get_judge_usage(scope: str = EXPERIMENT_USAGE_SCOPE) -> dict[str, Any]:
+    """누적 Judge 토큰 사용량, 캐시 적중률, 기준별 절약 입력 토큰 반환 (scope 범위)."""
+    with _usage_lock:
+        totals: dict[str, Any] = dict(_scope_totals(scope))
+        totals["input_tokens_saved"] = dict(_tokens_saved.get(scope, {}))
+    totals["cache_hit_rate"] = (
+        totals["cached_tokens"] / totals["input_tokens"]
+        if totals["input_tokens"]
+        else 0.0
+    )
+    return totals
+
+
+def reset_judge_usage() -> None:
+    """누적 Judge 토큰 사용량 초기화 (실험 시작 시 호출, 모든 범위)."""
+    with _usage_lock:
+        _usage_totals.clear()
+        _tokens_saved.clear()
+
 
 def run_checklist_evaluation(
     output: str,
@@ -22,6 +385,8 @@ def run_checklist_evaluation(
     criteria: list[str] | None = None,
     llm=None,
     eval_prompts_dir: str | Path | None = None,
+    max_repair_retries: int = DEFAULT_JUDGE_REPAIR_RETRIES,
+    criterion_options: dict[str, dict] | None = None,
 ) -> dict[str, Any]:
     """체크리스트 기반 LLM 평가 실행.
 
@@ -31,9 +396,16 @@ def run_checklist_evaluation(
         prompt_template: 원본 프롬프트 (instruction_following용)
         criteria: 평가 기준 목록 (None이면 기본 3개)
         llm: Judge LLM 인스턴스 (None이면 기본 judge_llm 사용)
+        max_repair_retries: 응답 검증 실패 시 repair 재요청 횟수
+        criterion_options: 기준별 옵션 (config.yaml llm_judge.criterion_options)
+            - samples: self-consistency 최대 샘플 수 (2 이상이면 다수결 투표)
+            - min_samples: 1차 샘플 수 (만장일치면 조기 종료)
+            - temperature: 샘플링 temperature
+            - mode: "json" (기본) | "logprob" (항목별 0/1 단일 토큰 + logprob 확률 점수)
 
     Returns:
-        각 기준별 점수 및 상세 결과
+        각 기준별 점수 및 상세 결과.
+        실패한 기준은 {"score": None, "error": str}로 기록 (0.0과 구분).
     """
     criteria = criteria or [
         "instruction_following",
@@ -42,14 +414,12 @@ def run_checklist_evaluation(
     ]
 
     input_text = json.dumps(inputs, ensure_ascii=False, indent=2)
+    criterion_options = criterion_options or {}
     results = {}
 
     # LLM 선택: 주입된 LLM or 기본 judge_llm
     evaluator_llm = llm if llm is not None else get_judge_llm()
 
-    # JSON 응답 강제 (OpenAI)
-    json_judge = evaluator_llm.bind(response_format={"type": "json_object"})
-
     from prompt_evaluator.context import get_context
 
     ctx = get_context()
@@ -58,43 +428,408 @@ def run_checklist_evaluation(
     for criterion in criteria:
         prompt_path = prompts_dir / f"{criterion}.txt"
         if not prompt_path.exists():
-            results[criterion] = {"score": 0.0}
+            results[criterion] = {
+                "score": None,
+                "error": f"평가 프롬프트 없음: {prompt_path}",
+            }
+            continue
+
+        try:
+            meta, template = parse_criterion_file(
+                prompt_path.read_text(encoding="utf-8")
+            )
+        except (ValueError, yaml.YAMLError) as e:
+            results[criterion] = {"score": None, "error": f"front matter 오류: {e}"}
             continue
 
-        template = prompt_path.read_text(encoding="utf-8")
-        eval_prompt = template.format(
-            prompt=prompt_template if prompt_template else "(프롬프트 없음)",
-            input=input_text,
-            output=output,
+        criterion_input, include_prompt, tokens_saved = _project_judge_context(
+            template, meta, inputs, input_text, prompt_template
+        )
+        messages = build_judge_messages(
+            template,
+            prompt_template,
+            criterion_input,
+            output,
+            include_prompt=include_prompt,
+        )
+
+        checklist_keys = extract_checklist_keys(template)
+        options = criterion_options.get(criterion) or {}
+        samples = int(options.get("samples", 1))
+        mode = options.get("mode", "json")
+        if mode == "logprob" and not checklist_keys:
+            logger.warning(
+                f"  ⚠ logprob 모드는 체크리스트 기준만 지원 [{criterion}] → json 모드로 평가"
+            )
+            mode = "json"
+
+        # 체크리스트 키 기반 JSON Schema 강제 (OpenAI structured output)
+        schema_judge = evaluator_llm.bind(
+            response_format=build_verdict_schema(criterion, checklist_keys)
         )
 
         try:
-            messages = [
+            if mode == "logprob":
+                logprob_judge = evaluator_llm.bind(
+                    logprobs=True,
+                    top_logprobs=DEFAULT_LOGPROB_TOP_K,
+                    temperature=0,
+                    max_tokens=2 * len(checklist_keys) + 2,
+                )
+                results[criterion] = run_logprob_evaluation(
+                    logprob_judge, messages, checklist_keys, max_repair_retries
+                )
+            elif samples > 1:
+                sampling_judge = schema_judge.bind(
+                    temperature=options.get(
+                        "temperature", DEFAULT_SELF_CONSISTENCY_TEMPERATURE
+                    )
+                )
+                results[criterion] = run_self_consistency(
+                    sampling_judge,
+                    messages,
+                    checklist_keys,
+                    max_samples=samples,
+                    min_samples=int(
+                        options.get("min_samples", DEFAULT_SELF_CONSISTENCY_MIN_SAMPLES)
+                    ),
+                    max_repair_retries=max_repair_retries,
+                )
+            else:
+                results[criterion] = _invoke_with_repair(
+                    schema_judge, messages, checklist_keys, max_repair_retries
+                )
+        except JudgeValidationError as e:
+            logger.warning(f"  ⚠ LLM Judge 응답 검증 실패 [{criterion}]: {e}")
+            results[criterion] = {"score": None, "error": str(e)}
+        except Exception as e:
+            logger.warning(f"  ⚠ LLM Judge 평가 실패 [{criterion}]: {e}")
+            results[criterion] = {"score": None, "error": str(e)}
+
+        if tokens_saved:
+            # self-consistency는 샘플마다 같은 메시지를 보내므로 샘플 수만큼 절약
+            saved = tokens_saved * results[criterion].get("samples", 1)
+            results[criterion]["input_tokens_saved"] = saved
+            record_tokens_saved(criterion, saved)
+
+    # 전체 점수 계산 (error 기준 제외)
+    valid_scores = [r["score"] for r in results.values() if r["score"] is not None]
+    if valid_scores:
+        results["overall"] = {"score": sum(valid_scores) / len(valid_scores)}
+
+    return results
+
+
+def _project_judge_context(
+    template: str,
+    meta: dict,
+    inputs: dict,
+    input_text: str,
+    prompt_template: str,
+) -> tuple[str, bool, int]:
+    """front matter 선언에 따라 기준별 입력 텍스트/타겟 프롬프트 포함 여부 결정.
+
+    Returns:
+        (기준에 전달할 입력 텍스트, 타겟 프롬프트 포함 여부, 호출당 절약 입력 토큰 추정치)
+    """
+    tokens_saved = 0
+
+    projected = project_inputs(inputs, meta.get("inputs", "all"))
+    if projected is inputs:
+        criterion_input = input_text
+    else:
+        criterion_input = (
+            OMITTED_REFERENCE
+            if projected is None
+            else json.dumps(projected, ensure_ascii=False, indent=2)
+        )
+        if _INPUT_PLACEHOLDER_RE.search(template):
+            tokens_saved += max(
+                0, estimate_tokens(input_text) - estimate_tokens(criterion_input)
+            )
+
+    include_prompt = bool(meta.get("prompt", True))
+    if not include_prompt and _PROMPT_PLACEHOLDER_RE.search(template):
+        tokens_saved += estimate_tokens(prompt_template)
+
+    return criterion_input, include_prompt, tokens_saved
+
+
+def _invoke_with_repair(
+    judge,
+    messages: list[tuple[str, str]],
+    checklist_keys: list[str],
+    max_repair_retries: int,
+) -> dict:
+    """Judge 호출 후 검증 실패 시 오류를 알려주고 재요청 (최대 max_repair_retries회).
+
+    Raises:
+        JudgeValidationError: 재요청 후에도 검증 실패
+    """
+    attempt_messages = list(messages)
+    total_usage = {"input_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    for attempt in range(max_repair_retries + 1):
+        response = judge.invoke(attempt_messages)
+        usage = extract_usage(response)
+        record_judge_usage(usage)
+        for key in total_usage:
+            total_usage[key] += usage[key]
+        try:
+            verdict = parse_verdict(response.content, checklist_keys)
+            verdict["usage"] = total_usage
+            if attempt:
+                verdict["repaired"] = True
+            return verdict
+        except JudgeValidationError as e:
+            if attempt >= max_repair_retries:
+                raise
+            attempt_messages = list(messages) + [
+                ("assistant", response.content or ""),
                 (
-                    "system",
-                    "You are a precise evaluator. Score each checklist item as 0 (fail) or 1 (pass). Be strict but fair. Respond with valid JSON only.",
+                    "user",
+                    f"Your previous response was invalid: {e}. "
+                    "Respond again with JSON that strictly follows the required schema.",
                 ),
-                ("user", eval_prompt),
             ]
-            response = json_judge.invoke(messages)
+    raise JudgeValidationError("repair 재시도 초과")
 
-            result = json.loads(response.content)
 
-            checklist = result.get("checklist", {})
-            if checklist:
-                score = sum(checklist.values()) / len(checklist)
-            else:
-                score = result.get("score", 0)
+# =============================================================================
+# Self-consistency 투표
+# =============================================================================
+
+
+def run_self_consistency(
+    judge,
+    messages: list[tuple[str, str]],
+    checklist_keys: list[str],
+    max_samples: int,
+    min_samples: int = DEFAULT_SELF_CONSISTENCY_MIN_SAMPLES,
+    max_repair_retries: int = DEFAULT_JUDGE_REPAIR_RETRIES,
+) -> dict:
+    """Judge를 여러 번 병렬 샘플링하고 체크리스트 항목별 다수결로 집계.
+
+    1차로 min_samples개를 병렬 샘플링하여 모든 항목이 만장일치면 조기 종료하고,
+    아니면 max_samples까지 나머지를 병렬 샘플링한다.
+
+    Args:
+        judge: temperature가 바인딩된 Judge LLM
+        messages: Judge 메시지
+        checklist_keys: 체크리스트 키 목록
+        max_samples: 최대 샘플 수 (K)
+        min_samples: 1차 샘플 수
+        max_repair_retries: 샘플별 repair 재요청 횟수
 
-            results[criterion] = {"score": float(score)}
+    Returns:
+        {"score", "checklist", "agreement", "samples", "feedback", "usage"}
+        agreement는 항목별 다수결 값과 일치한 샘플 비율
+
+    Raises:
+        JudgeValidationError: 유효한 샘플이 하나도 없는 경우
+    """
+    min_samples = max(1, min(min_samples, max_samples))
+
+    verdicts = _sample_verdicts(
+        judge, messages, checklist_keys, min_samples, max_repair_retries
+    )
+    if len(verdicts) < max_samples and not _is_unanimous(verdicts, checklist_keys):
+        verdicts += _sample_verdicts(
+            judge,
+            messages,
+            checklist_keys,
+            max_samples - len(verdicts),
+            max_repair_retries,
+        )
 
+    if not verdicts:
+        raise JudgeValidationError("유효한 self-consistency 샘플이 없습니다.")
+
+    usage = {"input_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    for verdict in verdicts:
+        for key in usage:
+            usage[key] += verdict.get("usage", {}).get(key, 0)
+
+    result: dict[str, Any] = {
+        "samples": len(verdicts),
+        "feedback": verdicts[0].get("feedback", ""),
+        "usage": usage,
+    }
+
+    if not checklist_keys:
+        scores = [v["score"] for v in verdicts]
+        result["score"] = sum(scores) / len(scores)
+        result["checklist"] = {}
+        result["agreement"] = {}
+        return result
+
+    checklist = {}
+    agreement = {}
+    for key in checklist_keys:
+        votes = [v["checklist"][key] for v in verdicts]
+        ones = sum(votes)
+        # 동수는 엄격하게 0 (fail)
+        majority = 1 if ones * 2 > len(votes) else 0
+        checklist[key] = majority
+        agreement[key] = votes.count(majority) / len(votes)
+
+    result["score"] = sum(checklist.values()) / len(checklist)
+    result["checklist"] = checklist
+    result["agreement"] = agreement
+    return result
+
+
+def _sample_verdicts(
+    judge,
+    messages: list[tuple[str, str]],
+    checklist_keys: list[str],
+    n: int,
+    max_repair_retries: int,
+) -> list[dict]:
+    """Judge를 n회 병렬 호출하여 유효한 verdict 목록 반환 (실패 샘플은 제외)."""
+
+    def sample(_):
+        try:
+            return _invoke_with_repair(
+                judge, messages, checklist_keys, max_repair_retries
+            )
         except Exception as e:
-            logger.warning(f"  ⚠ LLM Judge 평가 실패 [{criterion}]: {e}")
-            results[criterion] = {"score": 0.0, "error": str(e)}
+            logger.warning(f"  ⚠ self-consistency 샘플 실패: {e}")
+            return None
 
-    # 전체 점수 계산
-    if results:
-        overall = sum(r["score"] for r in results.values()) / len(results)
-        results["overall"] = {"score": overall}
+    # 샘플 스레드에도 호출한 쪽의 사용량 집계 범위를 전달
+    contexts = [contextvars.copy_context() for _ in range(n)]
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        verdicts = executor.map(lambda ctx, i: ctx.run(sample, i), contexts, range(n))
+        return [v for v in verdicts if v is not None]
 
-    return results
+
+def _is_unanimous(verdicts: list[dict], checklist_keys: list[str]) -> bool:
+    """모든 샘플의 체크리스트 (또는 점수)가 일치하는지 확인."""
+    if len(verdicts) < 2:
+        return False
+    if not checklist_keys:
+        return len({v["score"] for v in verdicts}) == 1
+    return all(
+        len({v["checklist"][key] for v in verdicts}) == 1 for key in checklist_keys
+    )
+
+
+# =============================================================================
+# Logprob 단일 토큰 채점
+# =============================================================================
+
+
+def build_logprob_instruction(checklist_keys: list[str]) -> str:
+    """항목별 0/1 한 토큰만 출력하도록 하는 마지막 user 메시지.
+
+    앞선 메시지(루브릭/응답 형식 포함)는 json 모드와 동일하게 두어 prefix 캐시를 공유한다.
+    """
+    items = "\n".join(f"{i}. {key}" for i, key in enumerate(checklist_keys, 1))
+    return (
+        "Ignore the JSON response format above. For each checklist item below, in order, "
+        "output a single digit: 1 if the item passes, 0 if it fails. "
+        "Put each digit on its own line and output nothing else.\n\n"
+        f"## Checklist Items\n{items}"
+    )
+
+
+def _digit_probability(entry: dict) -> float:
+    """0/1 토큰 위치의 top_logprobs에서 P(1) 계산 (0/1 후보만으로 재정규화)."""
+    mass = {"0": 0.0, "1": 0.0}
+    for candidate in entry.get("top_logprobs") or []:
+        token = str(candidate.get("token", "")).strip()
+        if token in mass:
+            mass[token] += math.exp(candidate["logprob"])
+    total = mass["0"] + mass["1"]
+    if total == 0:
+        # top_logprobs가 없으면 샘플링된 토큰 자체를 확정 값으로 사용
+        return 1.0 if str(entry.get("token", "")).strip() == "1" else 0.0
+    return mass["1"] / total
+
+
+def parse_logprob_checklist(response, checklist_keys: list[str]) -> dict:
+    """logprob 응답에서 체크리스트 항목별 P(1)을 추출.
+
+    Returns:
+        {"score": float, "checklist": {key: P(1)}, "feedback": "", "mode": "logprob"}
+
+    Raises:
+        JudgeValidationError: logprobs가 없거나 0/1 토큰 수가 항목 수와 다른 경우
+    """
+    metadata = getattr(response, "response_metadata", None) or {}
+    content = (metadata.get("logprobs") or {}).get("content")
+    if not content:
+        raise JudgeValidationError(
+            "응답에 logprobs가 없습니다 (logprobs를 지원하지 않는 모델일 수 있음)."
+        )
+
+    digits = [
+        entry for entry in content if str(entry.get("token", "")).strip() in ("0", "1")
+    ]
+    if len(digits) != len(checklist_keys):
+        raise JudgeValidationError(
+            f"0/1 토큰 수({len(digits)})가 체크리스트 항목 수({len(checklist_keys)})와 다릅니다."
+        )
+
+    checklist = {
+        key: _digit_probability(entry) for key, entry in zip(checklist_keys, digits)
+    }
+    return {
+        "score": sum(checklist.values()) / len(checklist),
+        "checklist": checklist,
+        "feedback": "",
+        "mode": "logprob",
+    }
+
+
+def run_logprob_evaluation(
+    judge,
+    messages: list[tuple[str, str]],
+    checklist_keys: list[str],
+    max_repair_retries: int = DEFAULT_JUDGE_REPAIR_RETRIES,
+) -> dict:
+    """항목별 0/1 단일 토큰 Judge 호출 후 logprob 확률 평균으로 점수화.
+
+    Args:
+        judge: logprobs/top_logprobs/max_tokens가 바인딩된 Judge LLM
+        messages: json 모드와 동일한 Judge 메시지
+        checklist_keys: 체크리스트 키 목록
+        max_repair_retries: 토큰 수 불일치 시 재요청 횟수
+
+    Returns:
+        {"score", "checklist": {key: P(1)}, "feedback", "mode", "usage"}
+
+    Raises:
+        JudgeValidationError: 재요청 후에도 파싱 실패
+    """
+    logprob_messages = list(messages) + [
+        ("user", build_logprob_instruction(checklist_keys))
+    ]
+    attempt_messages = list(logprob_messages)
+    total_usage = {"input_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    for attempt in range(max_repair_retries + 1):
+        response = judge.invoke(attempt_messages)
+        usage = extract_usage(response)
+        record_judge_usage(usage)
+        for key in total_usage:
+            total_usage[key] += usage[key]
+        try:
+            verdict = parse_logprob_checklist(response, checklist_keys)
+            verdict["usage"] = total_usage
+            if attempt:
+                verdict["repaired"] = True
+            return verdict
+        except JudgeValidationError as e:
+            if attempt >= max_repair_retries:
+                raise
+            # temperature 0에서 같은 메시지를 재전송하면 같은 응답이 나오므로 오류를 알려주고 재요청
+            attempt_messages = list(logprob_messages) + [
+                ("assistant", response.content or ""),
+                (
+                    "user",
+                    f"Your previous response was invalid: {e}. "
+                    f"Answer again with exactly {len(checklist_keys)} lines, "
+                    "each a single digit 0 or 1, and output nothing else.",
+                ),
+            ]
+    raise JudgeValidationError("repair 재시도 초과")
@@ -0,0 +1,308 @@
+"""마크다운 보고서 구조 검사 (Judge 호출 없음).
+
+헤더 라벨, 섹션 개수, 섹션별 불릿 수처럼 문서 구조만 보는 조건을 LLM Judge 대신
+결정적으로 검사한다. 출력은 케이스당 한 번만 파싱되며(CaseArtifact.markdown),
+규칙은 config.yaml rule_based 블록과 expected.json 케이스별 structure에 선언한다.
+
+    - type: rule_based
+      checks: [keyword_inclusion, forbidden_word_check, markdown_structure]
+      markdown_structure:
+        headers: [컨디션, 핵심 주제]   # 본문 앞 "라벨: 값" 줄 (이 순서, 값 필수)
+        sections:
+          style: numbered              # numbered ("1. 제목") | heading ("## 제목")
+          min: 1
+          max: 5
+          sequential: true             # 번호가 1부터 빠짐없이 증가
+        bullets:
+          marker: "•"                  # 다른 불릿 기호(-, *) 사용 시 실패
+          min: 1                       # 섹션당 불릿 수
+          max: 4
+        blank_lines: true              # 헤더와 본문 사이, 섹션 사이 빈 줄
+        required_sections: []          # 제목에 포함되어야 하는 섹션
+        forbidden_sections: []         # 있으면 안 되는 섹션
+
+    # expected.json (required_sections/forbidden_sections는 합치고, 나머지 키는 덮어씀)
+    "case_id": {"structure": {"required_sections": ["멤버 요청 사항"]}}
+
+점수는 만족한 규칙의 비율이다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+
+SECTION_STYLES = ["numbered", "heading"]
+STRUCTURE_OPTIONS = [
+    "headers",
+    "sections",
+    "bullets",
+    "blank_lines",
+    "required_sections",
+    "forbidden_sections",
+]
+# expected.json structure에서 config.yaml 목록에 합쳐지는 키 (나머지는 덮어씀)
+_MERGED_OPTIONS = ("required_sections", "forbidden_sections")
+
+BULLET_MARKERS = "•·-*"
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*$")
+_NUMBERED_RE = re.compile(r"^(\d+)[.)]\s+(.+)$")
+_BULLET_RE = re.compile(rf"^\s*([{re.escape(BULLET_MARKERS)}])\s+(.*)$")
+_FIELD_RE = re.compile(r"^([^:：\d#\s][^:：]{0,30})\s*[:：]\s*(.*)$")
+
+
+@dataclass
+class Section:
+    """본문 섹션 하나 (번호 섹션 또는 마크다운 헤딩)."""
+
+    title: str
+    number: int | None
+    line: int
+    bullets: list[str] = field(default_factory=list)
+    markers: set[str] = field(default_factory=set)
+    blank_before: bool = True
+
+
+@dataclass
+class MarkdownDocument:
+    """출력 텍스트를 한 번 훑어 만든 구조 요약.
+
+    Attributes:
+        headers: 첫 섹션 앞 "라벨: 값" 줄 [(라벨, 값), ...] (등장 순서)
+        blank_after_headers: 헤더 블록과 첫 섹션 사이에 빈 줄이 있는지
+        numbered: "1. 제목" 형식 섹션
+        headings: "# 제목" 형식 섹션 (level은 title에 포함하지 않음)
+        loose_bullets: 어떤 섹션에도 속하지 않는 불릿 수
+    """
+
+    headers: list[tuple[str, str]] = field(default_factory=list)
+    blank_after_headers: bool = True
+    numbered: list[Section] = field(default_factory=list)
+    headings: list[Section] = field(default_factory=list)
+    loose_bullets: int = 0
+
+    def sections(self, style: str = "numbered") -> list[Section]:
+        return self.headings if style == "heading" else self.numbered
+
+    def summary(self, style: str = "numbered") -> dict[str, Any]:
+        """실험 결과에 남길 구조 요약."""
+        return {
+            "headers": [label for label, _ in self.headers],
+            "sections": [
+                {"title": section.title, "bullets": len(section.bullets)}
+                for section in self.sections(style)
+            ],
+        }
+
+
+def parse_markdown(text: str) -> MarkdownDocument:
+    """헤더, 섹션, 불릿을 한 번에 파싱.
+
+    번호 섹션과 헤딩 섹션은 각각 따로 모으며, 불릿은 바로 앞 섹션(번호/헤딩 각각)에 속한다.
+    """
+    doc = MarkdownDocument()
+    current: dict[str, Section | None] = {"numbered": None, "heading": None}
+    in_header_block = True
+    previous_blank = True
+
+    for index, line in enumerate(text.strip().splitlines()):
+        stripped = line.strip()
+        if not stripped:
+            previous_blank = True
+            continue
+
+        heading = _HEADING_RE.match(stripped)
+        numbered = None if heading else _NUMBERED_RE.match(stripped)
+        bullet = None if heading or numbered else _BULLET_RE.match(line)
+
+        if heading:
+            section = Section(heading.group(2), None, index, blank_before=previous_blank)
+            doc.headings.append(section)
+            current["heading"] = section
+        elif numbered:
+            section = Section(
+                numbered.group(2).strip(),
+                int(numbered.group(1)),
+                index,
+                blank_before=previous_blank,
+            )
+            doc.numbered.append(section)
+            current["numbered"] = section
+        elif bullet:
+            owners = [s for s in current.values() if s is not None]
+            for section in owners:
+                section.bullets.append(bullet.group(2).strip())
+                section.markers.add(bullet.group(1))
+            if not owners:
+                doc.loose_bullets += 1
+        elif in_header_block:
+            match = _FIELD_RE.match(stripped)
+            if match:
+                doc.headers.append((match.group(1).strip(), match.group(2).strip()))
+
+        if in_header_block and (heading or numbered or bullet):
+            in_header_block = False
+            doc.blank_after_headers = not doc.headers or previous_blank
+        previous_blank = False
+
+    return doc
+
+
+def get_structure_rules(
+    options: dict[str, Any] | None, expected: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """config.yaml 옵션과 케이스별 structure 병합 (섹션 목록은 합치고 나머지는 케이스 값 우선)."""
+    rules = dict(options or {})
+    for key, value in ((expected or {}).get("structure") or {}).items():
+        if key in _MERGED_OPTIONS:
+            rules[key] = list(rules.get(key) or []) + list(value or [])
+        else:
+            rules[key] = value
+    return rules
+
+
+def _find_section(sections: list[Section], name: str) -> Section | None:
+    return next((section for section in sections if name in section.title), None)
+
+
+def _range_reason(count: int, low: int, high: int | None) -> str | None:
+    if count < low or (high is not None and count > high):
+        return f"{count} not in [{low}, {high if high is not None else '∞'}]"
+    return None
+
+
+def _check_rules(doc: MarkdownDocument, rules: dict[str, Any]) -> list[tuple[str, str | None]]:
+    """규칙별 (이름, 실패 사유 또는 None) 목록."""
+    results = []
+    section_rules = rules.get("sections") or {}
+    style = section_rules.get("style", "numbered")
+    sections = doc.sections(style)
+
+    headers = rules.get("headers") or []
+    if headers:
+        found = {label: value for label, value in doc.headers}
+        for label in headers:
+            if label not in found:
+                results.append((f"header '{label}'", "missing"))
+            elif not found[label]:
+                results.append((f"header '{label}'", "empty value"))
+            else:
+                results.append((f"header '{label}'", None))
+        order = [label for label, _ in doc.headers if label in headers]
+        expected_order = [label for label in headers if label in found]
+        results.append(
+            ("header order", None if order == expected_order else f"{order}")
+        )
+
+    if section_rules:
+        results.append(
+            (
+                "section count",
+                _range_reason(
+                    len(sections), section_rules.get("min", 0), section_rules.get("max")
+                ),
+            )
+        )
+        if style == "numbered" and section_rules.get("sequential", False):
+            numbers = [section.number for section in sections]
+            expected_numbers = list(range(1, len(sections) + 1))
+            results.append(
+                ("section numbering", None if numbers == expected_numbers else f"{numbers}")
+            )
+
+    bullet_rules = rules.get("bullets") or {}
+    if bullet_rules and sections:
+        out_of_range = [
+            f"'{section.title}' ({len(section.bullets)})"
+            for section in sections
+            if _range_reason(
+                len(section.bullets), bullet_rules.get("min", 0), bullet_rules.get("max")
+            )
+        ]
+        results.append(
+            ("bullets per section", ", ".join(out_of_range) if out_of_range else None)
+        )
+        marker = bullet_rules.get("marker")
+        if marker:
+            others = sorted(set().union(*(s.markers for s in sections)) - {marker})
+            results.append(
+                ("bullet marker", f"uses {others}" if others else None)
+            )
+
+    if rules.get("blank_lines", False):
+        missing = []
+        if not doc.blank_after_headers:
+            missing.append("after headers")
+        missing.extend(
+            f"before '{section.title}'" for section in sections[1:] if not section.blank_before
+        )
+        results.append(("blank lines", ", ".join(missing) if missing else None))
+
+    for name in rules.get("required_sections") or []:
+        found = _find_section(sections, name)
+        results.append((f"required section '{name}'", None if found else "missing"))
+    for name in rules.get("forbidden_sections") or []:
+        found = _find_section(sections, name)
+        results.append((f"forbidden section '{name}'", "present" if found else None))
+
+    return results
+
+
+def markdown_structure(
+    output: str | CaseArtifact, rules: dict[str, Any]
+) -> dict[str, Any]:
+    """출력의 마크다운 구조가 규칙을 만족하는지 검사.
+
+    Args:
+        output: LLM 출력 텍스트 또는 CaseArtifact (캐시된 파싱 결과 사용)
+        rules: get_structure_rules() 결과
+
+    Returns:
+        {
+            "score": float (만족한 규칙 비율),
+            "passed": bool,
+            "failures": [{"rule": str, "reason": str}, ...],
+            "structure": {"headers": [...], "sections": [{"title", "bullets"}, ...]},
+            "details": str
+        }
+    """
+    doc = CaseArtifact.of(output).markdown
+    style = (rules.get("sections") or {}).get("style", "numbered")
+    checked = _check_rules(doc, rules)
+    if not checked:
+        return {
+            "score": 1.0,
+            "passed": True,
+            "failures": [],
+            "structure": doc.summary(style),
+            "details": "No structure rules to check",
+        }
+
+    failures = [{"rule": rule, "reason": reason} for rule, reason in checked if reason]
+    total = len(checked)
+    if failures:
+        shown = "; ".join(f"{f['rule']}: {f['reason']}" for f in failures)
+        details = f"{len(failures)}/{total} structure rules failed: {shown}"
+    else:
+        details = f"All {total} structure rules satisfied"
+    return {
+        "score": (total - len(failures)) / total,
+        "passed": not failures,
+        "failures": failures,
+        "structure": doc.summary(style),
+        "details": details,
+    }
+
+
+def create_markdown_structure_check(options: dict[str, Any], eval_config: dict[str, Any]):
+    """registry 팩토리."""
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any] | None:
+        rules = get_structure_rules(options, expected)
+        if not rules:
+            return None
+        return markdown_structure(artifact, rules)
+
+    return check
@@ -0,0 +1,117 @@
+"""한국어 형태소 단위 키워드 매칭 (경량 어절 분석기).
+
+부분 문자열 매칭은 짧은 한국어 키워드가 더 긴 단어 안에 들어 있어도 포함으로 보고
+(예: "사" ⊂ "회사"), 키워드 자체를 다른 형태로 쓴 경우는 활용형을 놓친다
+(예: "퇴사하다" ↔ "퇴사하고"). config.yaml rule_based 블록에 match: morpheme을 지정하면
+출력과 키워드를 어절 단위로 나누고 조사/어미를 떼어 낸 어간 후보끼리 비교한다.
+
+    - type: rule_based
+      match: morpheme
+
+분석은 사전 없이 규칙으로만 한다:
+    - 어절 끝의 조사 (은/는/이/가/을/를/에서/으로/까지 ...) 제거
+    - 명사 + 하다/되다/시키다 활용 (퇴사하고, 퇴사했습니다, 결정된) → 명사
+떼어 낸 뒤 남는 어간은 MORPHEME_MIN_STEM 음절 이상이어야 한다 ("나이" → "나" 방지).
+불규칙 용언 활용, 합성어 분해는 하지 않는다.
+
+출력별 어간 색인(MorphemeIndex)은 텍스트마다 한 번만 만들어 캐시하며,
+같은 출력의 키워드/금지어 검사와 Judge 선행 검사가 함께 사용한다.
+"""
+
+import re
+from functools import lru_cache
+
+from prompt_evaluator.config import MORPHEME_INDEX_CACHE_SIZE, MORPHEME_MIN_STEM
+
+_TOKEN_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+# 어절 끝 조사 (긴 것부터 매칭)
+_JOSA = sorted(
+    [
+        "은", "는", "이", "가", "을", "를", "의", "에", "도", "만", "와", "과",
+        "로", "으로", "에서", "에게", "께", "께서", "한테", "에게서", "한테서",
+        "까지", "부터", "보다", "처럼", "마다", "조차", "마저", "밖에",
+        "이나", "나", "이랑", "랑", "이며", "며", "이라", "라", "이란", "란",
+        "이다", "입니다", "이에요", "예요", "이고", "이었다", "였다",
+        "에는", "에서는", "으로는", "로는", "과는", "와는", "에도", "에서도",
+        "으로도", "로도", "까지는", "부터는", "만은", "만을", "만이", "이라도", "라도",
+    ],
+    key=len,
+    reverse=True,
+)
+
+# 명사 뒤 경동사 (하다/되다/시키다)와 축약형: 뒤에 어떤 어미가 붙어도 명사를 어간 후보로 본다
+_LIGHT_VERBS = (
+    "하", "해", "했", "한", "할", "함", "합",
+    "되", "돼", "됐", "된", "될", "됨", "됩",
+    "시키", "시켜", "시켰", "시킨", "시킬", "시킴",
+)
+
+
+@lru_cache(maxsize=16384)
+def analyze_word(word: str) -> frozenset[str]:
+    """어절 하나의 어간 후보 (원형 포함).
+
+    Example:
+        analyze_word("퇴사하고") → {"퇴사하고", "퇴사"}
+        analyze_word("회사가") → {"회사가", "회사"}
+    """
+    candidates = {word}
+    if not _HANGUL_RE.fullmatch(word):
+        return frozenset(candidates)
+
+    for josa in _JOSA:
+        if word.endswith(josa) and len(word) - len(josa) >= MORPHEME_MIN_STEM:
+            candidates.add(word[: -len(josa)])
+            break
+
+    for i in range(MORPHEME_MIN_STEM, len(word)):
+        if word.startswith(_LIGHT_VERBS, i):
+            candidates.add(word[:i])
+    return frozenset(candidates)
+
+
+class MorphemeIndex:
+    """텍스트 하나의 어절별 어간 후보 색인.
+
+    Args:
+        text: 분석할 텍스트 (대소문자/정규화는 호출 측에서 적용)
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.words = _TOKEN_RE.findall(text)
+        self.candidates = [analyze_word(word) for word in self.words]
+        self._positions: dict[str, list[int]] = {}
+        for position, stems in enumerate(self.candidates):
+            for stem in stems:
+                self._positions.setdefault(stem, []).append(position)
+
+    def contains(self, term: str) -> bool:
+        """term의 어절들이 연속된 어절로 나타나는지 (어절마다 어간 후보가 하나 이상 겹치면 일치).
+
+        어절로 나눌 수 없는 term(문장부호만 등)은 부분 문자열로 비교한다.
+        """
+        term_words = _TOKEN_RE.findall(term)
+        if not term_words:
+            return term in self.text
+
+        first, rest = analyze_word(term_words[0]), term_words[1:]
+        starts = {p for stem in first for p in self._positions.get(stem, ())}
+        for start in sorted(starts):
+            end = start + len(rest)
+            if end >= len(self.words):
+                continue
+            if all(
+                analyze_word(word) & self.candidates[start + offset]
+                for offset, word in enumerate(rest, start=1)
+            ):
+                return True
+        return False
+
+
+@lru_cache(maxsize=MORPHEME_INDEX_CACHE_SIZE)
+def get_morpheme_index(text: str) -> MorphemeIndex:
+    """텍스트별 어간 색인 (같은 텍스트는 한 번만 분석)."""
+    return MorphemeIndex(text)
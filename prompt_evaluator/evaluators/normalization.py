@@ -0,0 +1,163 @@
+"""rule-based 평가/출력 지문용 텍스트 정규화 파이프라인.
+
+한국어 출력이 NFD(자모 분리)로 오거나 전각/반각 문자가 섞이면 키워드 포함 검사가
+같은 글자를 놓친다. config.yaml의 rule_based 블록에 normalize 단계를 지정하면
+출력과 키워드/금지어에 같은 정규화를 적용한 뒤 비교한다.
+
+    - type: rule_based
+      normalize: [nfc, width, jamo, punctuation, whitespace]
+
+단계 (지정 순서와 무관하게 NORMALIZATION_STEPS 순서로 적용):
+    nfc: 유니코드 NFC 정규화
+    width: 전각/반각 통일 (ＡＢＣ → ABC, 반각 한글 자모 → 한글 자모, 전각 공백 → 공백)
+    jamo: 자모 조합 (NFD 자모열과 호환 자모열 ㅎㅏㄴ → 한)
+    casefold: 유니코드 case folding
+    punctuation: 문장부호를 공백으로
+    whitespace: 연속 공백/줄바꿈을 공백 하나로, 앞뒤 공백 제거
+
+정규화기는 단계 조합별로 한 번만 만들고, 각 정규화기는 텍스트별 결과를 캐시한다
+(같은 출력/키워드를 여러 평가자·Judge 선행 검사에서 반복 정규화하지 않음).
+"""
+
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Iterable
+
+from prompt_evaluator.config import NORMALIZATION_CACHE_SIZE
+
+NORMALIZATION_STEPS = ["nfc", "width", "jamo", "casefold", "punctuation", "whitespace"]
+
+# 호환 자모 (U+3131~) → 초성/중성/종성 인덱스
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = "ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_HANGUL_BASE = 0xAC00
+
+_COMPAT_JAMO_RE = re.compile(
+    f"([{_CHOSEONG}])([{_JUNGSEONG}])(?:([{_JONGSEONG}])(?![{_JUNGSEONG}]))?"
+)
+
+
+def _compose_compat_jamo(match: re.Match) -> str:
+    lead = _CHOSEONG.index(match.group(1))
+    vowel = _JUNGSEONG.index(match.group(2))
+    tail = _JONGSEONG.index(match.group(3)) + 1 if match.group(3) else 0
+    return chr(_HANGUL_BASE + (lead * 21 + vowel) * 28 + tail)
+
+
+@lru_cache(maxsize=1)
+def _width_table() -> dict[int, str]:
+    """전각/반각 형태(U+FF00~U+FFEF)와 전각 공백의 NFKC 매핑."""
+    table = {0x3000: " "}
+    for cp in range(0xFF00, 0xFFF0):
+        mapped = unicodedata.normalize("NFKC", chr(cp))
+        if mapped != chr(cp):
+            table[cp] = mapped
+    return table
+
+
+@lru_cache(maxsize=1)
+def _punctuation_table() -> dict[int, str]:
+    """모든 유니코드 문장부호(P*) → 공백."""
+    return {
+        cp: " "
+        for cp in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(cp)).startswith("P")
+    }
+
+
+def _nfc(text: str) -> str:
+    return unicodedata.normalize("NFC", text)
+
+
+def _width(text: str) -> str:
+    return text.translate(_width_table())
+
+
+def _jamo(text: str) -> str:
+    return _COMPAT_JAMO_RE.sub(_compose_compat_jamo, unicodedata.normalize("NFC", text))
+
+
+def _casefold(text: str) -> str:
+    return text.casefold()
+
+
+def _punctuation(text: str) -> str:
+    return text.translate(_punctuation_table())
+
+
+def _whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+_STEP_FUNCTIONS: dict[str, Callable[[str], str]] = {
+    "nfc": _nfc,
+    "width": _width,
+    "jamo": _jamo,
+    "casefold": _casefold,
+    "punctuation": _punctuation,
+    "whitespace": _whitespace,
+}
+
+
+class TextNormalizer:
+    """정규화 단계 조합 하나 (텍스트별 결과 캐시).
+
+    Args:
+        steps: NORMALIZATION_STEPS 순서로 정렬된 단계 이름
+    """
+
+    def __init__(self, steps: tuple[str, ...]):
+        self.steps = steps
+        functions = [_STEP_FUNCTIONS[step] for step in steps]
+
+        @lru_cache(maxsize=NORMALIZATION_CACHE_SIZE)
+        def apply(text: str) -> str:
+            for fn in functions:
+                text = fn(text)
+            return text
+
+        self._apply = apply
+
+    def __call__(self, text: str) -> str:
+        if not self.steps:
+            return text
+        return self._apply(text)
+
+    def cache_info(self):
+        return self._apply.cache_info()
+
+
+def canonical_steps(steps: Iterable[str] | None) -> tuple[str, ...]:
+    """단계 목록 검증 후 적용 순서로 정렬.
+
+    Raises:
+        ValueError: 알 수 없는 단계가 포함된 경우
+    """
+    steps = set(steps or [])
+    unknown = steps - set(NORMALIZATION_STEPS)
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 normalize 단계: {sorted(unknown)} (허용: {NORMALIZATION_STEPS})"
+        )
+    return tuple(step for step in NORMALIZATION_STEPS if step in steps)
+
+
+@lru_cache(maxsize=None)
+def _compile(steps: tuple[str, ...]) -> TextNormalizer:
+    return TextNormalizer(steps)
+
+
+def get_normalizer(steps: Iterable[str] | None) -> TextNormalizer:
+    """단계 조합별 정규화기 (같은 조합은 한 번만 생성)."""
+    return _compile(canonical_steps(steps))
+
+
+def get_normalize_steps(eval_config: dict | None) -> tuple[str, ...]:
+    """config.yaml rule_based 블록의 normalize 단계 (미지정 시 빈 튜플)."""
+    for evaluator in (eval_config or {}).get("evaluators", []):
+        if evaluator.get("type") == "rule_based":
+            return canonical_steps(evaluator.get("normalize"))
+    return ()
@@ -0,0 +1,286 @@
+"""Pairwise A/B Judge.
+
+같은 입력에 대한 두 프롬프트 버전(A/B)의 출력을 Judge가 직접 비교한다.
+Judge의 위치 편향(먼저 제시된 응답 선호)을 상쇄하기 위해 케이스마다
+A→B, B→A 두 순서로 호출하고, 두 판정을 평균하여 케이스 점수로 사용한다.
+
+케이스 점수 (B 기준): B 승 = 1.0, 무승부 = 0.5, A 승 = 0.0
+"""
+
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import logging
+
+from prompt_evaluator.config import (
+    DEFAULT_CONFIDENCE_Z,
+    DEFAULT_JUDGE_REPAIR_RETRIES,
+    DEFAULT_PAIRWISE_MAX_WORKERS,
+)
+from prompt_evaluator.evaluators.llm_judge import (
+    JudgeValidationError,
+    extract_usage,
+    record_judge_usage,
+)
+from prompt_evaluator.models import get_judge_llm
+
+logger = logging.getLogger(__name__)
+
+PAIRWISE_SYSTEM_PROMPT = (
+    "You are an impartial evaluator comparing two responses to the same input. "
+    "Judge which response better accomplishes the task. Do not let the order of the "
+    "responses, their length, or their style influence your decision. "
+    "Respond with valid JSON only."
+)
+
+PAIRWISE_DEFAULT_CRITERIA = (
+    "- Follows the instructions and constraints of the task\n"
+    "- Accurate and grounded in the given input\n"
+    "- Complete, well-organized, and appropriate in tone"
+)
+
+PAIRWISE_VERDICT_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "pairwise_verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "reasoning": {"type": "string"},
+                "winner": {"type": "string", "enum": ["1", "2", "tie"]},
+            },
+            "required": ["reasoning", "winner"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# 판정별 B 점수
+_B_POINTS = {"A": 0.0, "tie": 0.5, "B": 1.0}
+
+
+def build_pairwise_messages(
+    input_text: str,
+    first: str,
+    second: str,
+    criteria: str | None = None,
+) -> list[tuple[str, str]]:
+    """Pairwise Judge 메시지 구성 (prefix 캐싱을 위해 공통 부분을 앞에 배치).
+
+    Args:
+        input_text: 케이스 입력 (JSON 문자열)
+        first: Response 1로 제시할 출력
+        second: Response 2로 제시할 출력
+        criteria: 비교 기준 (None이면 기본 기준)
+    """
+    return [
+        ("system", PAIRWISE_SYSTEM_PROMPT),
+        ("user", f"## Evaluation Criteria\n{criteria or PAIRWISE_DEFAULT_CRITERIA}"),
+        (
+            "user",
+            f"## Input\n{input_text}\n\n"
+            f"## Response 1\n{first}\n\n"
+            f"## Response 2\n{second}",
+        ),
+    ]
+
+
+def parse_pairwise_verdict(content: str) -> dict:
+    """Pairwise Judge 응답 파싱 및 검증.
+
+    Returns:
+        {"winner": "1" | "2" | "tie", "reasoning": str}
+
+    Raises:
+        JudgeValidationError: JSON 파싱 또는 winner 값 검증 실패
+    """
+    try:
+        result = json.loads(content)
+    except (json.JSONDecodeError, TypeError) as e:
+        raise JudgeValidationError(f"JSON 파싱 실패: {e}") from e
+
+    if not isinstance(result, dict):
+        raise JudgeValidationError("응답이 JSON object가 아닙니다.")
+    winner = str(result.get("winner", "")).strip().lower()
+    if winner not in ("1", "2", "tie"):
+        raise JudgeValidationError(f"winner는 '1', '2', 'tie' 중 하나여야 합니다: {winner!r}")
+    return {"winner": winner, "reasoning": result.get("reasoning", "")}
+
+
+def _judge_once(
+    judge,
+    messages: list[tuple[str, str]],
+    max_repair_retries: int,
+) -> dict:
+    """Pairwise Judge 1회 호출 (검증 실패 시 repair 재요청)."""
+    attempt_messages = list(messages)
+    for attempt in range(max_repair_retries + 1):
+        response = judge.invoke(attempt_messages)
+        record_judge_usage(extract_usage(response))
+        try:
+            return parse_pairwise_verdict(response.content)
+        except JudgeValidationError as e:
+            if attempt >= max_repair_retries:
+                raise
+            attempt_messages = list(messages) + [
+                ("assistant", response.content or ""),
+                (
+                    "user",
+                    f"Your previous response was invalid: {e}. "
+                    "Respond again with JSON that strictly follows the required schema.",
+                ),
+            ]
+    raise JudgeValidationError("repair 재시도 초과")
+
+
+def run_pairwise_judgements(
+    cases: list[dict],
+    criteria: str | None = None,
+    llm=None,
+    max_workers: int = DEFAULT_PAIRWISE_MAX_WORKERS,
+    max_repair_retries: int = DEFAULT_JUDGE_REPAIR_RETRIES,
+) -> list[dict]:
+    """모든 케이스에 대해 두 제시 순서의 pairwise Judge를 병렬 호출.
+
+    Args:
+        cases: [{"id", "input", "output_a", "output_b"}, ...]
+        criteria: 비교 기준 텍스트 (None이면 기본 기준)
+        llm: Judge LLM (None이면 기본 Judge)
+        max_workers: 동시 Judge 호출 수
+        max_repair_retries: 호출별 repair 재요청 횟수
+
+    Returns:
+        케이스별 결과 리스트
+        [{"id", "verdict": "A"|"B"|"tie"|None, "score_b", "orders": {"ab", "ba"},
+          "consistent": bool, "error"?}, ...]
+    """
+    judge = (llm or get_judge_llm()).bind(response_format=PAIRWISE_VERDICT_SCHEMA)
+
+    def call(job: tuple[int, str]) -> dict:
+        idx, order = job
+        case = cases[idx]
+        input_text = json.dumps(case["input"], ensure_ascii=False, indent=2)
+        if order == "ab":
+            messages = build_pairwise_messages(
+                input_text, case["output_a"], case["output_b"], criteria
+            )
+        else:
+            messages = build_pairwise_messages(
+                input_text, case["output_b"], case["output_a"], criteria
+            )
+        try:
+            verdict = _judge_once(judge, messages, max_repair_retries)
+        except Exception as e:
+            logger.warning(f"  ⚠ pairwise Judge 실패 ({case['id']}, {order}): {e}")
+            return {"error": str(e)}
+        # 제시 순서를 A/B 라벨로 환원
+        if verdict["winner"] == "tie":
+            winner = "tie"
+        elif (verdict["winner"] == "1") == (order == "ab"):
+            winner = "A"
+        else:
+            winner = "B"
+        return {"winner": winner, "reasoning": verdict["reasoning"]}
+
+    jobs = [(idx, order) for idx in range(len(cases)) for order in ("ab", "ba")]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        outcomes = list(executor.map(call, jobs))
+
+    results = []
+    for idx, case in enumerate(cases):
+        orders = {"ab": outcomes[2 * idx], "ba": outcomes[2 * idx + 1]}
+        results.append(_combine_orders(case["id"], orders))
+    return results
+
+
+def _combine_orders(case_id: str, orders: dict[str, dict]) -> dict:
+    """두 제시 순서의 판정을 평균하여 케이스 판정 산출."""
+    result: dict[str, Any] = {"id": case_id, "orders": orders}
+    winners = [o["winner"] for o in orders.values() if "winner" in o]
+
+    if not winners:
+        result.update(
+            verdict=None,
+            score_b=None,
+            consistent=False,
+            error="; ".join(o.get("error", "") for o in orders.values()),
+        )
+        return result
+
+    score_b = sum(_B_POINTS[w] for w in winners) / len(winners)
+    if score_b > 0.5:
+        verdict = "B"
+    elif score_b < 0.5:
+        verdict = "A"
+    else:
+        verdict = "tie"
+    result.update(
+        verdict=verdict,
+        score_b=score_b,
+        consistent=len(winners) == 2 and winners[0] == winners[1],
+    )
+    return result
+
+
+def wilson_interval(
+    successes: float, n: int, z: float = DEFAULT_CONFIDENCE_Z
+) -> tuple[float, float]:
+    """승률에 대한 Wilson score 신뢰구간.
+
+    Args:
+        successes: 성공 수 (무승부는 0.5로 합산 가능)
+        n: 시행 수
+        z: 정규분포 분위수 (1.96 = 95%)
+
+    Returns:
+        (하한, 상한). n이 0이면 (0.0, 1.0)
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def summarize_pairwise(results: list[dict], z: float = DEFAULT_CONFIDENCE_Z) -> dict:
+    """케이스별 pairwise 결과를 승률/신뢰구간으로 집계.
+
+    Returns:
+        {"total", "judged", "wins_a", "wins_b", "ties", "errors",
+         "win_rate_a", "win_rate_b", "ci_b": [low, high],
+         "position_consistency", "preferred"}
+        win_rate_b는 케이스 점수 평균 (무승부 0.5 반영).
+        preferred는 신뢰구간이 0.5를 벗어난 경우에만 "A"/"B", 아니면 None.
+    """
+    judged = [r for r in results if r.get("score_b") is not None]
+    n = len(judged)
+    points_b = sum(r["score_b"] for r in judged)
+    win_rate_b = points_b / n if n else 0.0
+    low, high = wilson_interval(points_b, n, z)
+
+    preferred = None
+    if n and low > 0.5:
+        preferred = "B"
+    elif n and high < 0.5:
+        preferred = "A"
+
+    return {
+        "total": len(results),
+        "judged": n,
+        "wins_a": sum(1 for r in judged if r["verdict"] == "A"),
+        "wins_b": sum(1 for r in judged if r["verdict"] == "B"),
+        "ties": sum(1 for r in judged if r["verdict"] == "tie"),
+        "errors": len(results) - n,
+        "win_rate_a": 1.0 - win_rate_b if n else 0.0,
+        "win_rate_b": win_rate_b,
+        "ci_b": [low, high],
+        "position_consistency": (
+            sum(1 for r in judged if r["consistent"]) / n if n else 0.0
+        ),
+        "preferred": preferred,
+    }
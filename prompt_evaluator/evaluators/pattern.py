@@ -0,0 +1,155 @@
+"""정규식 패턴 검사 (Judge 호출 없음).
+
+헤더 형식, 섹션 개수처럼 정규식으로 확인할 수 있는 구조 조건을 rule-based 단계에서 검사한다.
+패턴은 타겟 config.yaml의 rule_based 블록과 expected.json 케이스별 patterns에 선언하며,
+두 곳의 규칙을 합쳐서 검사한다.
+
+    - type: rule_based
+      checks: [keyword_inclusion, forbidden_word_check, pattern]
+      pattern:
+        required: ['^컨디션: .+', '^핵심 주제: .+']   # 한 번 이상 나타나야 함
+        forbidden: ['^#{1,6} ']                          # 나타나면 안 됨
+        count:                                           # 나타나는 횟수 범위
+          - regex: '^\\d+\\. '
+            min: 2
+            max: 3
+        ignore_case: false
+
+    # expected.json
+    "case_id": {"patterns": {"required": ["멤버 요청 사항"]}}
+
+모든 패턴은 줄 단위 앵커(re.MULTILINE)로 컴파일되며, 컴파일 결과는 프로세스당 한 번만 만들어
+캐시한다 (PATTERN_CACHE_SIZE).
+"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from prompt_evaluator.config import PATTERN_CACHE_SIZE
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+
+PATTERN_RULE_KINDS = ["required", "forbidden", "count"]
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(regex: str, ignore_case: bool = False) -> re.Pattern:
+    """정규식 컴파일 (같은 패턴/플래그는 한 번만 컴파일).
+
+    Raises:
+        ValueError: 정규식 문법 오류
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    try:
+        return re.compile(regex, flags)
+    except re.error as e:
+        raise ValueError(f"잘못된 정규식 '{regex}': {e}") from e
+
+
+def get_pattern_rules(
+    options: dict[str, Any] | None, expected: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """타겟 옵션과 케이스별 patterns를 합쳐 (regex, min, max) 규칙 목록으로 변환.
+
+    Args:
+        options: config.yaml rule_based 블록의 pattern 옵션
+        expected: expected.json의 해당 케이스 데이터 (patterns 키 사용)
+
+    Returns:
+        [{"kind": str, "regex": str, "min": int, "max": int | None}, ...]
+    """
+    rules = []
+    for source in (options or {}, (expected or {}).get("patterns") or {}):
+        for regex in source.get("required") or []:
+            rules.append({"kind": "required", "regex": regex, "min": 1, "max": None})
+        for regex in source.get("forbidden") or []:
+            rules.append({"kind": "forbidden", "regex": regex, "min": 0, "max": 0})
+        for item in source.get("count") or []:
+            rules.append(
+                {
+                    "kind": "count",
+                    "regex": item["regex"],
+                    "min": item.get("min", 0),
+                    "max": item.get("max"),
+                }
+            )
+    return rules
+
+
+def _count_matches(pattern: re.Pattern, text: str, limit: int | None) -> int:
+    """매치 수 (limit를 넘으면 limit + 1에서 중단)."""
+    count = 0
+    for _ in pattern.finditer(text):
+        count += 1
+        if limit is not None and count > limit:
+            break
+    return count
+
+
+def pattern_check(
+    output: str,
+    rules: list[dict[str, Any]],
+    ignore_case: bool = False,
+) -> dict[str, Any]:
+    """출력이 패턴 규칙을 모두 만족하는지 검사.
+
+    Args:
+        output: LLM 출력 텍스트
+        rules: get_pattern_rules() 결과
+        ignore_case: 대소문자 무시 여부
+
+    Returns:
+        {
+            "score": float (만족한 규칙 비율),
+            "passed": bool (모든 규칙 만족),
+            "failures": [{"kind", "regex", "count", "min", "max"}, ...],
+            "details": str
+        }
+    """
+    if not rules:
+        return {
+            "score": 1.0,
+            "passed": True,
+            "failures": [],
+            "details": "No patterns to check",
+        }
+
+    failures = []
+    for rule in rules:
+        pattern = compile_pattern(rule["regex"], ignore_case)
+        if rule["kind"] == "required":
+            count = 1 if pattern.search(output) else 0
+        else:
+            count = _count_matches(pattern, output, rule["max"])
+        if count < rule["min"] or (rule["max"] is not None and count > rule["max"]):
+            failures.append({**rule, "count": count})
+
+    score = (len(rules) - len(failures)) / len(rules)
+    if failures:
+        shown = "; ".join(
+            f"{f['kind']} '{f['regex']}' (count {f['count']})" for f in failures
+        )
+        details = f"{len(failures)}/{len(rules)} patterns failed: {shown}"
+    else:
+        details = f"All {len(rules)} patterns satisfied"
+    return {
+        "score": score,
+        "passed": not failures,
+        "failures": failures,
+        "details": details,
+    }
+
+
+def create_pattern_check(options: dict[str, Any], eval_config: dict[str, Any]):
+    """registry 팩토리. config.yaml 패턴은 실험 시작 시 컴파일해 정규식 오류를 먼저 드러낸다."""
+    ignore_case = bool(options.get("ignore_case", False))
+    for rule in get_pattern_rules(options):
+        compile_pattern(rule["regex"], ignore_case)
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any] | None:
+        rules = get_pattern_rules(options, expected)
+        if not rules:
+            return None
+        return pattern_check(artifact.raw, rules, ignore_case=ignore_case)
+
+    return check
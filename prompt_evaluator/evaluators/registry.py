@@ -0,0 +1,222 @@
+"""rule-based 검사 레지스트리 (내장 검사 + entry point 플러그인).
+
+검사는 "모듈:팩토리" 경로로 등록되며, 타겟 config.yaml이 참조할 때만 모듈을 import한다.
+팩토리는 실험(검사 목록 + 설정 조합)당 한 번만 호출되어 케이스별 검사 함수를 만든다.
+
+    factory(options, eval_config) -> check(artifact, expected) -> dict | None
+
+    - options: config.yaml rule_based 블록의 검사 이름 키 값 (없으면 {})
+    - check 반환값: {"score": float, "passed": bool, "details": str, ...}
+      (케이스에 검사할 내용이 없으면 None → 점수를 남기지 않음)
+
+패키지를 수정하지 않고 검사를 추가하려면 별도 패키지에서 entry point로 등록한다.
+
+    # pyproject.toml (플러그인 패키지)
+    [tool.poetry.plugins."prompt_evaluator.rule_checks"]
+    no_emoji = "my_checks.emoji:create_no_emoji_check"
+
+    # config.yaml
+    - type: rule_based
+      checks: [keyword_inclusion, no_emoji]
+      no_emoji: {max: 0}
+
+내장 검사와 이름이 같은 플러그인은 무시된다.
+"""
+
+import importlib
+import json
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable
+
+from prompt_evaluator.config import RULE_CHECK_ENTRY_POINT_GROUP
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+from prompt_evaluator.evaluators.scoring import fingerprint_output
+
+logger = logging.getLogger(__name__)
+
+RuleCheck = Callable[[CaseArtifact, dict[str, Any]], "dict[str, Any] | None"]
+RuleCheckFactory = Callable[[Any, dict[str, Any]], RuleCheck]
+
+# 내장 검사 (등록 순서 = 허용 목록 표시 순서)
+BUILTIN_RULE_CHECKS = {
+    "keyword_inclusion": "prompt_evaluator.evaluators.rule_based:create_keyword_inclusion_check",
+    "forbidden_word_check": "prompt_evaluator.evaluators.rule_based:create_forbidden_word_check",
+    "length_compliance": "prompt_evaluator.evaluators.rule_based:create_length_compliance_check",
+    "exact_match": "prompt_evaluator.evaluators.rule_based:create_exact_match_check",
+    "string_similarity": "prompt_evaluator.evaluators.rule_based:create_string_similarity_check",
+    "schema_compliance": "prompt_evaluator.evaluators.schema_compliance:create_schema_compliance_check",
+    "pattern": "prompt_evaluator.evaluators.pattern:create_pattern_check",
+    "json_assertions": "prompt_evaluator.evaluators.json_assertions:create_json_assertions_check",
+    "markdown_structure": "prompt_evaluator.evaluators.markdown_structure:create_markdown_structure_check",
+}
+
+# config.yaml evaluators 블록 type (플랫폼별 어댑터 연결은 pipeline.py)
+EVALUATOR_TYPES = [
+    "rule_based",
+    "llm_judge",
+    "semantic_similarity",
+    "criteria_reference",
+]
+
+_RESULT_KEYS = ("score", "passed", "details")
+
+
+@lru_cache(maxsize=1)
+def _plugin_entry_points() -> dict:
+    """설치된 패키지의 rule_checks entry point (이름 → EntryPoint, 로드하지 않음)."""
+    from importlib.metadata import entry_points
+
+    plugins = {}
+    for entry_point in entry_points(group=RULE_CHECK_ENTRY_POINT_GROUP):
+        if entry_point.name in BUILTIN_RULE_CHECKS:
+            logger.warning(
+                "내장 검사와 이름이 같은 플러그인 무시: %s (%s)",
+                entry_point.name,
+                entry_point.value,
+            )
+            continue
+        plugins[entry_point.name] = entry_point
+    return plugins
+
+
+def available_rule_checks() -> list[str]:
+    """사용 가능한 검사 이름 (내장 + 플러그인, 모듈은 import하지 않음)."""
+    return list(BUILTIN_RULE_CHECKS) + sorted(_plugin_entry_points())
+
+
+@lru_cache(maxsize=None)
+def load_rule_check(name: str) -> RuleCheckFactory:
+    """검사 팩토리 로드 (처음 참조될 때 모듈 import).
+
+    Raises:
+        ValueError: 알 수 없는 검사이거나 플러그인을 로드할 수 없는 경우
+    """
+    if name in BUILTIN_RULE_CHECKS:
+        module_name, attr = BUILTIN_RULE_CHECKS[name].split(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+    entry_point = _plugin_entry_points().get(name)
+    if entry_point is None:
+        raise ValueError(
+            f"알 수 없는 rule-based 검사: {name} (허용: {available_rule_checks()})"
+        )
+    try:
+        return entry_point.load()
+    except Exception as e:
+        raise ValueError(
+            f"rule-based 검사 플러그인 로드 실패 ({name} = {entry_point.value}): {e}"
+        ) from e
+
+
+class RuleSuite:
+    """실험 하나의 rule-based 검사 묶음 (검사별 팩토리를 한 번씩 호출해 둔 상태).
+
+    Args:
+        checks: 실행할 검사 이름 (결과도 이 순서)
+        eval_config: config.yaml 설정
+    """
+
+    def __init__(self, checks: list[str], eval_config: dict[str, Any]):
+        from prompt_evaluator.evaluators.rule_based import get_rule_options
+
+        self.checks = list(checks)
+        self._evaluators = {
+            name: load_rule_check(name)(get_rule_options(eval_config, name), eval_config)
+            for name in self.checks
+        }
+
+    def run(
+        self, output: str | CaseArtifact, expected: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """케이스 하나에 모든 검사 실행 (출력 정규화/파싱은 CaseArtifact로 공유)."""
+        artifact = CaseArtifact.of(output)
+        results = {}
+        for name, evaluate in self._evaluators.items():
+            result = evaluate(artifact, expected)
+            if result is None:
+                continue
+            missing = [key for key in _RESULT_KEYS if key not in result]
+            if missing:
+                raise ValueError(f"rule-based 검사 '{name}' 결과에 {missing} 없음")
+            results[name] = result
+        return results
+
+
+@lru_cache(maxsize=32)
+def _build_suite(checks: tuple[str, ...], config_json: str) -> RuleSuite:
+    return RuleSuite(list(checks), json.loads(config_json))
+
+
+def get_rule_suite(
+    eval_config: dict[str, Any] | None, checks: list[str]
+) -> RuleSuite:
+    """검사 목록 + 설정 조합별 RuleSuite (같은 조합은 한 번만 생성).
+
+    Raises:
+        ValueError: 알 수 없는 검사가 포함된 경우
+    """
+    config_json = json.dumps(
+        eval_config or {}, ensure_ascii=False, sort_keys=True, default=str
+    )
+    return _build_suite(tuple(checks), config_json)
+
+
+class _CaseEntry:
+    """CaseResultCache 항목 (케이스 출력 하나의 artifact와 실행된 검사 결과)."""
+
+    def __init__(self, artifact: CaseArtifact):
+        self.artifact = artifact
+        self.results: dict[str, dict[str, Any]] = {}
+        self.done: set[str] = set()
+        self.lock = threading.Lock()
+
+
+class CaseResultCache:
+    """실험 하나의 케이스별 CaseArtifact와 rule-based 검사 결과 캐시.
+
+    rule-based 평가자, Judge depends_on 게이트, criteria_reference 평가자/집계가
+    (case_id, 출력 지문) 키로 같은 파싱 결과와 검사 결과를 공유하여
+    케이스 출력마다 파싱과 각 검사를 한 번만 실행한다 (평가자 병렬 실행 시에도 동일).
+
+    Args:
+        expected_all: expected.json 전체 ({case_id: 케이스 데이터})
+        eval_config: config.yaml 설정
+    """
+
+    def __init__(self, expected_all: dict[str, Any], eval_config: dict[str, Any] | None):
+        self.expected_all = expected_all or {}
+        self.eval_config = eval_config or {}
+        self._entries: dict[tuple[str, str], _CaseEntry] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, case_id: str, output: str) -> _CaseEntry:
+        key = (case_id, fingerprint_output(output))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _CaseEntry(CaseArtifact(output))
+            return entry
+
+    def artifact(self, case_id: str, output: str) -> CaseArtifact:
+        """케이스 출력의 CaseArtifact (정규화/JSON/마크다운 파싱 결과 공유)."""
+        return self._entry(case_id, output).artifact
+
+    def run(self, case_id: str, output: str, checks: list[str]) -> dict[str, dict[str, Any]]:
+        """검사 결과 (checks 순서, 이미 실행한 검사는 재사용, 결과가 None인 검사는 제외).
+
+        Raises:
+            ValueError: 알 수 없는 검사가 포함된 경우
+        """
+        entry = self._entry(case_id, output)
+        with entry.lock:
+            missing = [name for name in checks if name not in entry.done]
+            if missing:
+                entry.results.update(
+                    get_rule_suite(self.eval_config, missing).run(
+                        entry.artifact, self.expected_all.get(case_id, {})
+                    )
+                )
+                entry.done.update(missing)
+            return {name: entry.results[name] for name in checks if name in entry.results}
@@ -1,21 +1,49 @@
 """규칙 기반 평가자 (키워드, 금지어, 포맷 등)."""
 
 import json
-import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+from prompt_evaluator.config import (
+    DEFAULT_KEYWORD_THRESHOLD,
+    DEFAULT_MAX_LENGTH,
+    DEFAULT_MIN_LENGTH,
+    DEFAULT_STRING_SIMILARITY_THRESHOLD,
+)
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+from prompt_evaluator.evaluators.keyword_matcher import get_match_mode, match_terms
+from prompt_evaluator.evaluators.normalization import get_normalize_steps
+from prompt_evaluator.evaluators.scoring import ScoringPolicy
+from prompt_evaluator.evaluators.registry import (
+    RuleCheck,
+    available_rule_checks,
+    get_rule_suite,
+)
+
+STRING_SIMILARITY_METHODS = ["token_set", "edit_distance"]
+
 
 def keyword_inclusion(
-    output: str,
+    output: str | CaseArtifact,
     expected_keywords: list[str],
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    normalize: tuple[str, ...] = (),
+    mode: str = "substring",
+    threshold: float = DEFAULT_KEYWORD_THRESHOLD,
 ) -> dict[str, Any]:
     """출력에 기대 키워드가 포함되어 있는지 검사.
 
     Args:
-        output: LLM 출력 텍스트
+        output: LLM 출력 텍스트 (또는 CaseArtifact)
         expected_keywords: 포함되어야 할 키워드 목록
         case_sensitive: 대소문자 구분 여부
+        normalize: 출력과 키워드에 함께 적용할 정규화 단계 (normalization.py)
+        mode: 매칭 방식 ("substring" | "morpheme", keyword_matcher.MATCH_MODES)
+        threshold: 통과 기준 포함 비율 (config.yaml thresholds.keyword)
 
     Returns:
         {
@@ -35,22 +63,16 @@ def keyword_inclusion(
             "details": "No keywords to check"
         }
 
-    check_output = output if case_sensitive else output.lower()
-    found = []
-    missing = []
-
-    for keyword in expected_keywords:
-        check_keyword = keyword if case_sensitive else keyword.lower()
-        if check_keyword in check_output:
-            found.append(keyword)
-        else:
-            missing.append(keyword)
+    matched = match_terms(
+        output, expected_keywords, [], case_sensitive, normalize, mode
+    )
+    found, missing = matched["found"], matched["missing"]
 
     score = len(found) / len(expected_keywords) if expected_keywords else 1.0
 
     return {
         "score": score,
-        "passed": score >= 0.5,  # 절반 이상 포함 시 통과
+        "passed": score >= threshold,
         "found": found,
         "missing": missing,
         "details": f"Found {len(found)}/{len(expected_keywords)} keywords"
@@ -58,16 +80,20 @@ def keyword_inclusion(
 
 
 def forbidden_word_check(
-    output: str,
+    output: str | CaseArtifact,
     forbidden_words: list[str],
-    case_sensitive: bool = False
+    case_sensitive: bool = False,
+    normalize: tuple[str, ...] = (),
+    mode: str = "substring",
 ) -> dict[str, Any]:
     """출력에 금지 단어가 포함되어 있는지 검사.
 
     Args:
-        output: LLM 출력 텍스트
+        output: LLM 출력 텍스트 (또는 CaseArtifact)
         forbidden_words: 포함되면 안 되는 단어 목록
         case_sensitive: 대소문자 구분 여부
+        normalize: 출력과 금지어에 함께 적용할 정규화 단계 (normalization.py)
+        mode: 매칭 방식 ("substring" | "morpheme", keyword_matcher.MATCH_MODES)
 
     Returns:
         {
@@ -85,13 +111,9 @@ def forbidden_word_check(
             "details": "No forbidden words to check"
         }
 
-    check_output = output if case_sensitive else output.lower()
-    violations = []
-
-    for word in forbidden_words:
-        check_word = word if case_sensitive else word.lower()
-        if check_word in check_output:
-            violations.append(word)
+    violations = match_terms(
+        output, [], forbidden_words, case_sensitive, normalize, mode
+    )["violations"]
 
     passed = len(violations) == 0
 
@@ -104,7 +126,7 @@ def forbidden_word_check(
 
 
 def length_compliance(
-    output: str,
+    output: str | CaseArtifact,
     min_length: int | None = None,
     max_length: int | None = None,
     unit: str = "chars"  # "chars" or "words"
@@ -125,10 +147,11 @@ def length_compliance(
             "details": str
         }
     """
+    artifact = CaseArtifact.of(output)
     if unit == "words":
-        actual_length = len(output.split())
+        actual_length = len(artifact.tokens)
     else:
-        actual_length = len(output)
+        actual_length = len(artifact.raw)
 
     passed = True
     issues = []
@@ -150,7 +173,7 @@ def length_compliance(
 
 
 def exact_match(
-    output: str,
+    output: str | CaseArtifact,
     reference: str,
     normalize: bool = True
 ) -> dict[str, Any]:
@@ -168,12 +191,13 @@ def exact_match(
             "details": str
         }
     """
+    artifact = CaseArtifact.of(output)
     if normalize:
         # 공백 정규화: 연속 공백 → 단일 공백, 앞뒤 공백 제거
-        norm_output = " ".join(output.split())
+        norm_output = artifact.collapsed
         norm_reference = " ".join(reference.split())
     else:
-        norm_output = output
+        norm_output = artifact.raw
         norm_reference = reference
 
     passed = norm_output == norm_reference
@@ -185,22 +209,370 @@ def exact_match(
     }
 
 
+def get_reference_text(expected: dict[str, Any]) -> str | None:
+    """expected.json 케이스에서 비교 기준 텍스트 추출 (reference 우선, 없으면 expected_output)."""
+    reference = expected.get("reference")
+    if reference is None:
+        reference = expected.get("expected_output")
+    if reference is None or reference == "":
+        return None
+    if isinstance(reference, str):
+        return reference
+    return json.dumps(reference, ensure_ascii=False, sort_keys=True)
+
+
+def _normalize_for_similarity(text: str, decompose_hangul: bool = False) -> str:
+    """유사도 비교용 정규화: 유니코드 정규화, 소문자화, 연속 공백 축소.
+
+    decompose_hangul=True면 한글 음절을 자모로 분해(NFD)하여
+    "했다"/"한다"처럼 받침만 다른 경우에도 부분 점수를 준다.
+    """
+    text = unicodedata.normalize("NFD" if decompose_hangul else "NFC", text)
+    return " ".join(text.lower().split())
+
+
+def levenshtein_distance(
+    a: str,
+    b: str,
+    max_distance: int | None = None,
+    b_peq: dict[str, int] | None = None,
+) -> int:
+    """문자 단위 Levenshtein 거리 (bit-parallel Myers/Hyyrö 알고리즘).
+
+    공통 접두/접미사를 잘라낸 뒤, 문자 빈도 차이(bag distance) 하한으로 band 폭을 정해
+    대각선 주변 band만 비트 벡터로 계산한다. band 안에서 거리가 확정되지 않으면
+    band를 넓혀 재계산하고, band가 패턴 전체를 덮으면 전체 비트 벡터로 계산한다.
+    max_distance를 넘는 것이 확정되면 즉시 중단하고 max_distance보다 큰 값을 반환한다.
+
+    Args:
+        a: 첫 번째 문자열
+        b: 두 번째 문자열
+        max_distance: 거리 상한 (None이면 정확한 거리 계산)
+        b_peq: build_peq(b)로 미리 만든 b의 문자별 위치 비트마스크
+            (같은 참조와 여러 번 비교할 때 재사용, b가 패턴이 되면 잘라낸 구간만 이동해서 사용)
+
+    Returns:
+        편집 거리 (max_distance 초과 시 max_distance보다 큰 값)
+    """
+    # 공통 접두/접미사 제거
+    start = 0
+    limit = min(len(a), len(b))
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    full_b_len = len(b)
+    a, b = a[start:end_a], b[start:end_b]
+
+    # 길이가 같으면 미리 만든 b의 Peq를 쓰도록 b를 패턴으로 둠
+    pattern_peq = None
+    if len(a) > len(b) or (b_peq is not None and len(a) == len(b)):
+        a, b = b, a
+        if b_peq is not None:
+            pattern_peq = _slice_peq(b_peq, start, end_b, full_b_len)
+    m, n = len(a), len(b)
+    if max_distance is not None and n - m > max_distance:
+        return n - m
+    if m == 0:
+        return n
+
+    lower = _bag_distance(a, b)
+    if max_distance is not None and lower > max_distance:
+        return lower
+
+    peq = pattern_peq if pattern_peq is not None else build_peq(a)
+
+    band = max(_MIN_BAND, 2 * lower, n - m)
+    while True:
+        if max_distance is not None:
+            band = min(band, max_distance)
+        if 2 * band + 1 >= m:
+            return _myers_distance(peq, m, b, max_distance)
+        distance = _myers_banded_distance(peq, m, b, band)
+        if distance <= band:
+            return distance
+        if max_distance is not None and band >= max_distance:
+            return max_distance + 1
+        band *= 4
+
+
+_MIN_BAND = 64
+
+
+def build_peq(text: str) -> dict[str, int]:
+    """Myers 알고리즘용 문자별 위치 비트마스크 (비트 i = text[i]가 해당 문자)."""
+    peq: dict[str, int] = {}
+    for i, ch in enumerate(text):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq
+
+
+def _slice_peq(
+    peq: dict[str, int], start: int, end: int, length: int
+) -> dict[str, int]:
+    """전체 문자열의 Peq에서 [start, end) 구간의 Peq를 추출."""
+    if start == 0 and end == length:
+        return peq
+    mask = (1 << (end - start)) - 1
+    sliced = {}
+    for ch, bits in peq.items():
+        bits = (bits >> start) & mask
+        if bits:
+            sliced[ch] = bits
+    return sliced
+
+
+def _bag_distance(a: str, b: str) -> int:
+    """문자 빈도 차이 기반 편집 거리 하한."""
+    count_a, count_b = Counter(a), Counter(b)
+    return max(sum((count_a - count_b).values()), sum((count_b - count_a).values()))
+
+
+def _myers_distance(
+    peq: dict[str, int], m: int, b: str, max_distance: int | None
+) -> int:
+    """패턴 전체(m비트)를 비트 벡터로 두고 b를 한 글자씩 처리하는 Myers 알고리즘."""
+    n = len(b)
+    mask = (1 << m) - 1
+    last = m - 1
+    pv, mv, score = mask, 0, m
+
+    for j, ch in enumerate(b):
+        eq = peq.get(ch, 0)
+        x = eq | mv
+        d0 = (((x & pv) + pv) ^ pv) | x
+        hp = mv | ~(d0 | pv)
+        hn = pv & d0
+        if (hp >> last) & 1:
+            score += 1
+        elif (hn >> last) & 1:
+            score -= 1
+        x = (hp << 1) | 1
+        mv = x & d0
+        pv = ((hn << 1) | ~(d0 | x)) & mask
+
+        if max_distance is not None:
+            # 남은 문자로 줄일 수 있는 거리는 최대 (n - j - 1)
+            lower_bound = score - (n - j - 1)
+            if lower_bound > max_distance:
+                return lower_bound
+
+    return score
+
+
+def _myers_banded_distance(peq: dict[str, int], m: int, b: str, band: int) -> int:
+    """대각선 ±band 행만 (2*band+1)비트 벡터로 계산하는 banded Myers 알고리즘.
+
+    band 밖 셀은 실제 경로의 상한값으로 채워지므로, 결과가 band 이하면 정확한 거리이고
+    band를 넘으면 실제 거리도 band를 넘는다. (m <= len(b), len(b) - m <= band 전제)
+    어떤 열에서 band 내 모든 셀이 band를 넘으면 그 즉시 band + 1을 반환한다.
+
+    비트 t는 열 j에서 행 j - band + t를 나타내며, 매 열마다 윈도우가 한 행씩 내려간다.
+    0행 이하는 D[r][j] = j - r인 가상 행으로 두어 경계 조건을 맞춘다.
+    """
+    n = len(b)
+    width = 2 * band + 1
+    window = (1 << width) - 1
+    top = 1 << (width - 1)
+
+    # 열 0: 0행 이하의 세로 차이는 -1, 1행 이상은 +1
+    mv = (1 << (band + 1)) - 1
+    pv = window ^ mv
+    bottom = band  # 윈도우 맨 아래 행(-band)의 값
+
+    for j in range(1, n + 1):
+        shift = j - 2 - band
+        p = peq.get(b[j - 1], 0)
+        eq = ((p >> shift) if shift >= 0 else (p << -shift)) & window
+        x = eq | mv
+        d0 = (((x & pv) + pv) ^ pv) | x
+        hp = (mv | ~(d0 | pv)) & window
+        hn = pv & d0
+        bottom += (hp & 1) - (hn & 1)
+        x = (hp << 1) | 1
+        mv = x & d0 & window
+        pv = ((hn << 1) | ~(d0 | x)) & window
+        # 윈도우를 한 행 내리고, 새 맨 위 행은 세로 차이 +1 (상한)
+        bottom += ((pv >> 1) & 1) - ((mv >> 1) & 1)
+        pv = (pv >> 1) | top
+        mv >>= 1
+        # 윈도우 최솟값 하한 = 맨 아래 값 - (세로 -1 개수)
+        if bottom - mv.bit_count() > band:
+            return band + 1
+
+    # 마지막 열의 윈도우 맨 아래 행은 n - band, m행은 비트 (m - n + band)
+    offset = m - n + band
+    rows = ((1 << (offset + 1)) - 1) ^ 1
+    return bottom + (pv & rows).bit_count() - (mv & rows).bit_count()
+
+
+def _edit_similarity(
+    a: str,
+    b: str,
+    min_score: float | None = None,
+    b_peq: dict[str, int] | None = None,
+) -> tuple[float, bool]:
+    """정규화된 편집 거리 유사도 (1 - distance / max_len).
+
+    Returns:
+        (유사도, 조기 종료 여부). 조기 종료 시 유사도는 실제 값의 상한이며 min_score 미만.
+    """
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0, False
+    max_distance = None
+    if min_score is not None:
+        max_distance = int((1.0 - min_score) * longest)
+    distance = levenshtein_distance(a, b, max_distance, b_peq)
+    bounded = max_distance is not None and distance > max_distance
+    return 1.0 - distance / longest, bounded
+
+
+def _token_set_similarity(a: str, b: str) -> float:
+    """토큰 집합 유사도: 공통 토큰과 각자 남은 토큰을 정렬해 조합한 문자열 간 최대 유사도.
+
+    어순 변화와 한쪽에만 있는 부가 토큰에 관대하다.
+    """
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if not tokens_a and not tokens_b:
+        return 1.0
+    common = " ".join(sorted(tokens_a & tokens_b))
+    only_a = " ".join(sorted(tokens_a - tokens_b))
+    only_b = " ".join(sorted(tokens_b - tokens_a))
+    if common and (not only_a or not only_b):
+        return 1.0
+
+    combined_a = f"{common} {only_a}".strip()
+    combined_b = f"{common} {only_b}".strip()
+    candidates = [_edit_similarity(combined_a, combined_b)[0]]
+    if common:
+        candidates.append(_edit_similarity(common, combined_a)[0])
+        candidates.append(_edit_similarity(common, combined_b)[0])
+    return max(candidates)
+
+
+def string_similarity_batch(
+    outputs: list[str | CaseArtifact],
+    references: list[str],
+    method: str = "edit_distance",
+    threshold: float = DEFAULT_STRING_SIMILARITY_THRESHOLD,
+    decompose_hangul: bool = False,
+) -> list[dict[str, Any]]:
+    """출력/참조 쌍 목록의 문자열 유사도를 한 번에 계산.
+
+    Args:
+        outputs: LLM 출력 목록
+        references: 같은 순서의 참조 텍스트 목록
+        method: "edit_distance" (문자 단위 정규화 편집 거리) 또는 "token_set" (토큰 집합 비율)
+        threshold: 통과 기준 유사도. edit_distance는 이 기준으로 거리 상한을 정해
+            기준 미달이 확정되면 계산을 중단한다 (대용량 출력 대비).
+        decompose_hangul: 한글 자모 단위 비교 여부
+
+    같은 참조 텍스트는 정규화와 Myers 비트마스크(Peq)를 한 번만 만들어 재사용한다.
+
+    Returns:
+        [{"score": float, "passed": bool, "details": str}, ...]
+    """
+    if method not in STRING_SIMILARITY_METHODS:
+        raise ValueError(
+            f"알 수 없는 string_similarity method: {method} (허용: {STRING_SIMILARITY_METHODS})"
+        )
+    if len(outputs) != len(references):
+        raise ValueError("outputs와 references의 길이가 다릅니다.")
+
+    # 참조 텍스트별 (정규화 텍스트, Peq) 캐시
+    prepared: dict[str, tuple[str, dict[str, int] | None]] = {}
+    results = []
+    for output, reference in zip(outputs, references):
+        artifact = CaseArtifact.of(output)
+        if decompose_hangul:
+            a = _normalize_for_similarity(artifact.raw, decompose_hangul)
+        else:
+            a = artifact.normalized
+        if reference not in prepared:
+            b = _normalize_for_similarity(reference, decompose_hangul)
+            prepared[reference] = (
+                b,
+                build_peq(b) if method == "edit_distance" else None,
+            )
+        b, b_peq = prepared[reference]
+        bounded = False
+        if method == "token_set":
+            score = _token_set_similarity(a, b)
+        else:
+            score, bounded = _edit_similarity(a, b, min_score=threshold, b_peq=b_peq)
+        score = max(0.0, score)
+        details = f"{method} similarity {'< ' if bounded else ''}{score:.3f}"
+        results.append(
+            {
+                "score": score,
+                "passed": score >= threshold,
+                "details": f"{details} (threshold {threshold})",
+            }
+        )
+    return results
+
+
+def string_similarity(
+    output: str | CaseArtifact,
+    reference: str,
+    method: str = "edit_distance",
+    threshold: float = DEFAULT_STRING_SIMILARITY_THRESHOLD,
+    decompose_hangul: bool = False,
+) -> dict[str, Any]:
+    """출력과 참조 텍스트의 문자열 유사도 검사 (구조화 출력 회귀 확인용).
+
+    Returns:
+        {
+            "score": float (0.0 ~ 1.0),
+            "passed": bool,
+            "details": str
+        }
+    """
+    return string_similarity_batch(
+        [output], [reference], method, threshold, decompose_hangul
+    )[0]
+
+
+def get_rule_options(eval_config: dict[str, Any], check: str) -> dict[str, Any]:
+    """config.yaml의 rule_based 평가자 블록에서 검사별 옵션 조회 (예: string_similarity)."""
+    for evaluator in eval_config.get("evaluators", []):
+        if evaluator.get("type") == "rule_based":
+            return evaluator.get(check) or {}
+    return {}
+
+
+def get_rule_checks(eval_config: dict[str, Any] | None) -> list[str]:
+    """실험에서 실행할 rule-based 검사 목록 (keyword/forbidden은 항상 포함, 설정 순서 유지)."""
+    checks = ["keyword_inclusion", "forbidden_word_check"]
+    for evaluator in (eval_config or {}).get("evaluators", []):
+        if evaluator.get("type") == "rule_based":
+            checks.extend(evaluator.get("checks") or [])
+            break
+    available = available_rule_checks()
+    return [check for check in dict.fromkeys(checks) if check in available]
+
+
 def run_rule_evaluators(
-    output: str,
+    output: str | CaseArtifact,
     expected: dict[str, Any],
     checks: list[str] | None = None,
     eval_config: dict[str, Any] | None = None
 ) -> dict[str, dict[str, Any]]:
-    """여러 rule-based 평가자를 한 번에 실행.
+    """여러 rule-based 평가자를 한 번에 실행 (출력 정규화는 CaseArtifact로 한 번만 계산).
+
+    검사는 registry.py에서 조회하며, 검사 목록 + 설정 조합별로 한 번만 만들어 재사용한다.
 
     Args:
-        output: LLM 출력 텍스트
+        output: LLM 출력 텍스트 (또는 CaseArtifact)
         expected: expected.json의 해당 케이스 데이터
             - keywords: list[str]
             - forbidden: list[str]
             - reference: dict (선택)
-        checks: 실행할 평가자 목록 (None이면 모두 실행)
-        eval_config: configs/{name}.yaml의 설정 (output_schema 등)
+        checks: 실행할 평가자 목록 (None이면 keyword/forbidden)
+        eval_config: configs/{name}.yaml의 설정 (normalize, match, string_similarity 옵션 등)
 
     Returns:
         {
@@ -211,33 +583,171 @@ def run_rule_evaluators(
     """
     default_checks = ["keyword_inclusion", "forbidden_word_check"]
     checks = checks or default_checks
-    eval_config = eval_config or {}
+    return get_rule_suite(eval_config, checks).run(output, expected)
 
-    results = {}
 
-    if "keyword_inclusion" in checks:
-        results["keyword_inclusion"] = keyword_inclusion(
-            output=output,
-            expected_keywords=expected.get("keywords", [])
-        )
+# =============================================================================
+# 검사 팩토리 (registry.BUILTIN_RULE_CHECKS)
+# =============================================================================
 
-    if "forbidden_word_check" in checks:
-        results["forbidden_word_check"] = forbidden_word_check(
-            output=output,
-            forbidden_words=expected.get("forbidden", [])
-        )
 
-    if "length_compliance" in checks:
-        results["length_compliance"] = length_compliance(
-            output=output,
-            min_length=10,
-            max_length=5000
+def create_keyword_inclusion_check(options: dict, eval_config: dict) -> RuleCheck:
+    normalize = get_normalize_steps(eval_config)
+    mode = get_match_mode(eval_config)
+    # 케이스 판정(ScoringPolicy)과 같은 기준 → depends_on 게이트, RuleBatchResult.passed 일치
+    threshold = ScoringPolicy.from_config(eval_config).keyword_threshold
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any]:
+        return keyword_inclusion(
+            artifact,
+            expected.get("keywords", []),
+            normalize=normalize,
+            mode=mode,
+            threshold=threshold,
         )
 
-    if "exact_match" in checks and "reference" in expected:
-        results["exact_match"] = exact_match(
-            output=output,
-            reference=json.dumps(expected["reference"], ensure_ascii=False)
+    return check
+
+
+def create_forbidden_word_check(options: dict, eval_config: dict) -> RuleCheck:
+    normalize = get_normalize_steps(eval_config)
+    mode = get_match_mode(eval_config)
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any]:
+        return forbidden_word_check(
+            artifact, expected.get("forbidden", []), normalize=normalize, mode=mode
         )
 
-    return results
+    return check
+
+
+def create_length_compliance_check(options: dict, eval_config: dict) -> RuleCheck:
+    min_length = options.get("min_length", DEFAULT_MIN_LENGTH)
+    max_length = options.get("max_length", DEFAULT_MAX_LENGTH)
+    unit = options.get("unit", "chars")
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any]:
+        return length_compliance(artifact, min_length, max_length, unit)
+
+    return check
+
+
+def create_exact_match_check(options: dict, eval_config: dict) -> RuleCheck:
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any] | None:
+        if "reference" not in expected:
+            return None
+        reference = expected["reference"]
+        if isinstance(reference, str):
+            return exact_match(artifact, reference)
+
+        from prompt_evaluator.evaluators.json_assertions import json_exact_match
+
+        return json_exact_match(artifact, reference)
+
+    return check
+
+
+def create_string_similarity_check(options: dict, eval_config: dict) -> RuleCheck:
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any] | None:
+        reference = get_reference_text(expected)
+        if reference is None:
+            return None
+        return string_similarity(artifact, reference, **options)
+
+    return check
+
+
+@dataclass
+class RuleBatchResult:
+    """run_rule_evaluators_batch 결과 (케이스 × 검사 열 단위).
+
+    Attributes:
+        checks: 열 순서의 검사 이름
+        scores: (케이스 수, 검사 수) 점수 (케이스에 적용되지 않은 검사는 NaN)
+        passed: (케이스 수, 검사 수) 통과 여부 (NaN 칸은 False)
+        details: 케이스별 {검사 이름: run_rule_evaluators 결과 항목}
+    """
+
+    checks: list[str]
+    scores: np.ndarray
+    passed: np.ndarray
+    details: list[dict[str, dict[str, Any]]]
+
+    def column(self, check: str) -> np.ndarray:
+        """검사 하나의 케이스별 점수 (n,)."""
+        return self.scores[:, self.checks.index(check)]
+
+    def score_dicts(self) -> list[dict[str, float]]:
+        """케이스별 {검사 이름: 점수} (NaN 제외, 실험 결과 scores 형식)."""
+        return [
+            {
+                check: float(value)
+                for check, value in zip(self.checks, row.tolist())
+                if not np.isnan(value)
+            }
+            for row in self.scores
+        ]
+
+
+def run_rule_evaluators_batch(
+    outputs: list[str | CaseArtifact],
+    expected_list: list[dict[str, Any]],
+    checks: list[str] | None = None,
+    eval_config: dict[str, Any] | None = None,
+) -> RuleBatchResult:
+    """출력 전체에 rule-based 검사를 한 번에 실행 (LLM 백엔드 없이 재채점용).
+
+    케이스별 출력 정규화(CaseArtifact)와 스키마 검증기는 한 번씩만 만들고,
+    string_similarity는 string_similarity_batch로 전체 케이스를 한 번에 계산한다.
+
+    Args:
+        outputs: LLM 출력 목록
+        expected_list: 같은 순서의 expected.json 케이스 데이터 목록
+        checks: 실행할 검사 목록 (None이면 get_rule_checks(eval_config))
+        eval_config: config.yaml 설정
+
+    Returns:
+        RuleBatchResult
+    """
+    if len(outputs) != len(expected_list):
+        raise ValueError("outputs와 expected_list의 길이가 다릅니다.")
+
+    eval_config = eval_config or {}
+    checks = list(checks or get_rule_checks(eval_config))
+    artifacts = [CaseArtifact.of(output) for output in outputs]
+
+    per_case_checks = [check for check in checks if check != "string_similarity"]
+    details = [
+        run_rule_evaluators(artifact, expected, per_case_checks, eval_config)
+        if per_case_checks
+        else {}
+        for artifact, expected in zip(artifacts, expected_list)
+    ]
+
+    if "string_similarity" in checks:
+        references = [get_reference_text(expected) for expected in expected_list]
+        indices = [i for i, reference in enumerate(references) if reference is not None]
+        similarity = string_similarity_batch(
+            [artifacts[i] for i in indices],
+            [references[i] for i in indices],
+            **get_rule_options(eval_config, "string_similarity"),
+        )
+        for i, result in zip(indices, similarity):
+            details[i]["string_similarity"] = result
+
+    n = len(outputs)
+    scores = np.full((n, len(checks)), np.nan)
+    passed = np.zeros((n, len(checks)), dtype=bool)
+    for i, case_details in enumerate(details):
+        for j, check in enumerate(checks):
+            result = case_details.get(check)
+            if result is not None:
+                scores[i, j] = result["score"]
+                passed[i, j] = result["passed"]
+
+    # 케이스별 결과를 checks 순서로 정렬
+    details = [
+        {check: case_details[check] for check in checks if check in case_details}
+        for case_details in details
+    ]
+    return RuleBatchResult(checks=checks, scores=scores, passed=passed, details=details)
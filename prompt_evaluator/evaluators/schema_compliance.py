@@ -0,0 +1,183 @@
+"""Pydantic 스키마 준수 검사 (Judge 호출 없음).
+
+targets/{name}/schemas.py의 Pydantic 모델로 JSON 출력을 검증한다. config.yaml의
+rule_based 블록에서 스키마를 지정하며, 검증기(TypeAdapter)는 스키마별로 한 번만 만들어
+실험 내 모든 케이스가 재사용한다.
+
+    - type: rule_based
+      checks: [schema_compliance]
+      schema_compliance:
+        schema: ScoringResult                              # schemas.py의 클래스
+        # schema: "list[QuestionContext]"                  # 타입 표현식
+        # schema: {question_context: "list[QuestionContext]"}  # 필드 → 타입 (최상위 객체)
+        strict: false                                      # 선택. 타입 강제 변환 금지
+
+Judge 앞 단계 게이트로 쓰려면 llm_judge depends_on에 schema_compliance를 추가한다.
+"""
+
+import hashlib
+import importlib.util
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from prompt_evaluator.config import SCHEMA_MAX_REPORTED_ERRORS
+from prompt_evaluator.evaluators.case_artifact import CaseArtifact
+
+
+class SchemaResolutionError(ValueError):
+    """schemas.py 또는 지정한 스키마를 찾거나 해석할 수 없는 경우."""
+
+
+def get_schemas_path(prompt_name: str) -> Path:
+    from prompt_evaluator.context import get_context
+
+    return get_context().targets_dir / prompt_name / "schemas.py"
+
+
+def load_schemas_module(path: str | Path):
+    """schemas.py를 타겟별 고유 모듈 이름으로 로드 (같은 내용이면 재사용)."""
+    path = Path(path)
+    if not path.exists():
+        raise SchemaResolutionError(f"schemas.py 없음: {path}")
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+    module_name = f"_prompt_eval_schemas_{path.parent.name}_{digest}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        del sys.modules[module_name]
+        raise SchemaResolutionError(f"schemas.py 로드 실패 ({path}): {e}") from e
+    return module
+
+
+def _resolve_type(expression: str, namespace: dict[str, Any]):
+    """'ScoringResult', 'list[QuestionContext]' 같은 타입 표현식을 schemas.py 네임스페이스에서 해석."""
+    try:
+        return eval(expression, {"__builtins__": {}}, namespace)  # noqa: S307 (타겟 config)
+    except Exception as e:
+        raise SchemaResolutionError(f"스키마 '{expression}' 해석 실패: {e}") from e
+
+
+@lru_cache(maxsize=64)
+def _build_validator(path: str, spec_json: str, strict: bool):
+    from pydantic import TypeAdapter, create_model
+
+    module = load_schemas_module(path)
+    namespace = {
+        "list": list,
+        "dict": dict,
+        "str": str,
+        "int": int,
+        "float": float,
+        "bool": bool,
+        **vars(module),
+    }
+    spec = json.loads(spec_json)
+    if isinstance(spec, dict):
+        fields = {
+            name: (_resolve_type(expression, namespace), ...)
+            for name, expression in spec.items()
+        }
+        schema_type = create_model("OutputSchema", **fields)
+    else:
+        schema_type = _resolve_type(spec, namespace)
+
+    try:
+        adapter = TypeAdapter(schema_type)
+    except Exception as e:
+        raise SchemaResolutionError(f"스키마 '{spec}'로 검증기 생성 실패: {e}") from e
+    return adapter, strict
+
+
+def get_schema_validator(prompt_name: str, options: dict[str, Any]):
+    """config.yaml schema_compliance 옵션으로 검증기 조회 (스키마별로 한 번만 생성).
+
+    Returns:
+        (TypeAdapter, strict)
+
+    Raises:
+        SchemaResolutionError: schemas.py가 없거나 스키마를 해석할 수 없는 경우
+    """
+    spec = options.get("schema")
+    if not spec or not isinstance(spec, (str, dict)):
+        raise SchemaResolutionError("schema_compliance.schema가 지정되지 않았습니다.")
+    return _build_validator(
+        str(get_schemas_path(prompt_name).resolve()),
+        json.dumps(spec, ensure_ascii=False, sort_keys=True),
+        bool(options.get("strict", False)),
+    )
+
+
+def _format_loc(loc: tuple) -> str:
+    return ".".join(str(part) for part in loc) or "(root)"
+
+
+def schema_compliance(output: str | CaseArtifact, validator) -> dict[str, Any]:
+    """출력 JSON을 스키마로 검증.
+
+    Args:
+        output: LLM 출력 텍스트 (코드 펜스 허용) 또는 CaseArtifact (캐시된 파싱 결과 사용)
+        validator: get_schema_validator() 결과
+
+    Returns:
+        {
+            "score": float (0.0 or 1.0),
+            "passed": bool,
+            "errors": [{"loc": str, "msg": str, "type": str}, ...],
+            "details": str
+        }
+    """
+    from pydantic import ValidationError
+
+    adapter, strict = validator
+    artifact = CaseArtifact.of(output)
+    errors = []
+    if artifact.json_error is not None:
+        errors = [
+            {
+                "loc": "(root)",
+                "msg": f"Invalid JSON: {artifact.json_error}",
+                "type": "json_invalid",
+            }
+        ]
+    else:
+        try:
+            adapter.validate_python(artifact.json_value, strict=strict)
+        except ValidationError as e:
+            errors = [
+                {"loc": _format_loc(err["loc"]), "msg": err["msg"], "type": err["type"]}
+                for err in e.errors(include_url=False)
+            ]
+
+    if errors:
+        shown = "; ".join(
+            f"{err['loc']}: {err['msg']}" for err in errors[:SCHEMA_MAX_REPORTED_ERRORS]
+        )
+        more = len(errors) - SCHEMA_MAX_REPORTED_ERRORS
+        return {
+            "score": 0.0,
+            "passed": False,
+            "errors": errors,
+            "details": f"{len(errors)} schema errors: {shown}"
+            + (f" (+{more} more)" if more > 0 else ""),
+        }
+
+    return {"score": 1.0, "passed": True, "errors": [], "details": "Schema valid"}
+
+
+def create_schema_compliance_check(options: dict[str, Any], eval_config: dict[str, Any]):
+    """registry 팩토리. 검증기를 실험 시작 시 만들어 스키마 오류를 첫 케이스 전에 드러낸다."""
+    validator = get_schema_validator(eval_config.get("name", ""), options)
+
+    def check(artifact: CaseArtifact, expected: dict[str, Any]) -> dict[str, Any]:
+        return schema_compliance(artifact, validator)
+
+    return check
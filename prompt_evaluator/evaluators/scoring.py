@@ -1,17 +1,239 @@
 """pass/fail 판정 공통 로직.
 
 pipeline.py, baseline.py 등에서 공유하는 점수 계산 및 통과 판정 함수.
+
+전체 케이스의 점수를 (케이스 × Judge 기준) 행렬로 만든 뒤, 타겟 config.yaml의
+weights/thresholds(ScoringPolicy)로 가중 평균과 통과 여부를 한 번에 계산한다.
+같은 행렬에 정책만 바꿔 재채점할 수 있어, 과거 실험 전체를 새 가중치로 다시 집계하는 데
+Judge 호출이 필요 없다.
 """
 
+import hashlib
+import math
+from dataclasses import dataclass, field
+
+import numpy as np
+
 from prompt_evaluator.config import DEFAULT_KEYWORD_THRESHOLD, DEFAULT_PASS_THRESHOLD
 
+# 실제 점수 대신 기록되는 상태값 (평균/통과 판정에서 제외)
+SKIPPED = "skipped"  # 선행 검사 실패로 Judge 생략
+ERROR = "error"  # Judge 호출/응답 검증 실패 (0점과 구분)
+
+JUDGE_SCORE_PREFIX = "llm_judge_"
+
+# sanity 판정에 쓰이는 rule-based 검사 (실패 시 Judge 점수와 무관하게 케이스 실패)
+# llm_judge depends_on은 이 검사만 허용 (그 외 검사 실패로 Judge를 생략하면 미채점 케이스가 통과됨)
+SANITY_CHECKS = ("keyword_inclusion", "forbidden_word_check", "schema_compliance")
+
+# Judge 기준을 대체하는 결정적 평가 점수 (Judge 점수와 함께 가중 평균에 포함)
+REFERENCE_SCORE_NAMES = (
+    "criteria_reference",
+    "pattern",
+    "json_assertions",
+    "markdown_structure",
+)
+
+
+def is_numeric_score(value) -> bool:
+    """집계 대상이 되는 실제 점수인지 확인 (skipped 등 상태값 제외)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def fingerprint_output(output: str, normalize: tuple[str, ...] = ()) -> str:
+    """출력 텍스트 지문 (기준선 점수 재사용 시 동일 여부 판정용).
+
+    normalize 단계가 없으면 byte 단위 비교, 있으면 정규화 후 비교
+    (예: NFC/NFD 차이나 공백만 다른 출력을 같은 출력으로 취급).
+    """
+    if normalize:
+        from prompt_evaluator.evaluators.normalization import get_normalizer
+
+        output = get_normalizer(normalize)(output)
+    return hashlib.sha256(output.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ScoringPolicy:
+    """타겟별 점수 집계 정책 (config.yaml의 weights, thresholds).
+
+    Attributes:
+        weights: Judge 기준별 가중치 ('domain/name', 'llm_judge_domain/name' 또는
+            REFERENCE_SCORE_NAMES의 결정적 점수 이름, 기본 1.0)
+        keyword_threshold: keyword_inclusion 통과 기준 (thresholds.keyword)
+        min_score: 케이스 통과 기준 가중 평균 Judge 점수 (thresholds.min_score)
+        pass_rate: 실험 통과 기준 케이스 통과율 (thresholds.pass_rate, 없으면 판정 안 함)
+    """
+
+    weights: dict[str, float] = field(default_factory=dict)
+    keyword_threshold: float = DEFAULT_KEYWORD_THRESHOLD
+    min_score: float = DEFAULT_PASS_THRESHOLD
+    pass_rate: float | None = None
+
+    @classmethod
+    def from_config(cls, eval_config: dict | None) -> "ScoringPolicy":
+        """config.yaml dict에서 정책 생성 (thresholds 없으면 전역 기본값)."""
+        eval_config = eval_config or {}
+        thresholds = eval_config.get("thresholds") or {}
+        pass_rate = thresholds.get("pass_rate")
+        return cls(
+            weights={
+                str(k): float(v) for k, v in (eval_config.get("weights") or {}).items()
+            },
+            keyword_threshold=float(
+                thresholds.get("keyword", DEFAULT_KEYWORD_THRESHOLD)
+            ),
+            min_score=float(thresholds.get("min_score", DEFAULT_PASS_THRESHOLD)),
+            pass_rate=float(pass_rate) if pass_rate is not None else None,
+        )
+
+    def weight(self, score_name: str) -> float:
+        criterion = score_name.removeprefix(JUDGE_SCORE_PREFIX)
+        return self.weights.get(score_name, self.weights.get(criterion, 1.0))
+
+
+@dataclass
+class ScoreMatrix:
+    """케이스별 점수 딕셔너리를 행렬로 변환한 것.
+
+    Attributes:
+        judge_names: Judge 점수 이름 (열 순서, REFERENCE_SCORE_NAMES 포함)
+        judge: (케이스 수, 기준 수) Judge 점수. 없음/skipped/error는 NaN
+        keyword: (케이스 수,) keyword_inclusion 점수 (없으면 1.0)
+        forbidden: (케이스 수,) forbidden_word_check 점수 (없으면 1.0)
+        schema: (케이스 수,) schema_compliance 점수 (없으면 1.0)
+        judge_errors: 케이스별 error 상태인 점수 이름
+        judge_expected: (케이스 수,) Judge 점수 키(skipped/error 포함)가 있는 케이스.
+            Judge가 설정되지 않은 케이스만 overall_score NaN으로 통과할 수 있음
+    """
+
+    judge_names: list[str]
+    judge: np.ndarray
+    keyword: np.ndarray
+    forbidden: np.ndarray
+    schema: np.ndarray
+    judge_errors: list[list[str]]
+    judge_expected: np.ndarray
+
+
+def build_score_matrix(score_dicts: list[dict]) -> ScoreMatrix:
+    """케이스별 점수 딕셔너리 목록을 ScoreMatrix로 변환."""
+    judge_names = list(
+        dict.fromkeys(
+            name
+            for scores in score_dicts
+            for name in scores
+            if name.startswith(JUDGE_SCORE_PREFIX) or name in REFERENCE_SCORE_NAMES
+        )
+    )
+    column = {name: j for j, name in enumerate(judge_names)}
+    n = len(score_dicts)
+    judge = np.full((n, len(judge_names)), np.nan)
+    keyword = np.ones(n)
+    forbidden = np.ones(n)
+    schema = np.ones(n)
+    judge_expected = np.zeros(n, dtype=bool)
+
+    for i, scores in enumerate(score_dicts):
+        for name, value in scores.items():
+            if name in column:
+                judge_expected[i] = True
+            if not is_numeric_score(value):
+                continue
+            if name in column:
+                judge[i, column[name]] = value
+            elif name == "keyword_inclusion":
+                keyword[i] = value
+            elif name == "forbidden_word_check":
+                forbidden[i] = value
+            elif name == "schema_compliance":
+                schema[i] = value
+
+    return ScoreMatrix(
+        judge_names=judge_names,
+        judge=judge,
+        keyword=keyword,
+        forbidden=forbidden,
+        schema=schema,
+        judge_errors=[
+            [name for name, value in scores.items() if value == ERROR]
+            for scores in score_dicts
+        ],
+        judge_expected=judge_expected,
+    )
+
+
+def score_matrix(matrix: ScoreMatrix, policy: ScoringPolicy) -> dict[str, np.ndarray]:
+    """ScoreMatrix 전체에 정책을 적용하여 케이스별 점수/통과 여부를 벡터 연산으로 계산.
+
+    Returns:
+        {"overall_score": (n,) 가중 평균 (Judge 점수 없으면 NaN),
+         "sanity_passed": (n,) bool, "passed": (n,) bool}
+    """
+    weights = np.array([policy.weight(name) for name in matrix.judge_names])
+    present = ~np.isnan(matrix.judge)
+    weight_sum = (present * weights).sum(axis=1)
+    weighted = np.where(present, matrix.judge, 0.0) @ weights
+    overall = np.divide(
+        weighted,
+        weight_sum,
+        out=np.full(len(weight_sum), np.nan),
+        where=weight_sum > 0,
+    )
+
+    sanity_passed = (
+        (matrix.keyword >= policy.keyword_threshold)
+        & (matrix.forbidden == 1.0)
+        & (matrix.schema == 1.0)
+    )
+    # Judge가 설정됐는데 숫자 점수가 하나도 없으면(전부 skipped/error) 미채점으로 보고 실패
+    # (가중치가 모두 0이라 NaN인 경우는 채점된 것이므로 통과 가능)
+    unjudged = matrix.judge_expected & ~present.any(axis=1)
+    passed = (
+        sanity_passed
+        & ~unjudged
+        & (np.isnan(overall) | (overall >= policy.min_score))
+    )
+    return {
+        "overall_score": overall,
+        "sanity_passed": sanity_passed,
+        "passed": passed,
+    }
+
+
+def compute_pass_results(
+    score_dicts: list[dict], policy: ScoringPolicy | None = None
+) -> list[dict]:
+    """여러 케이스의 점수 딕셔너리를 한 번에 판정.
+
+    Returns:
+        케이스별 {"overall_score": float|None, "sanity_passed": bool, "passed": bool,
+                  "judge_errors": list[str]}
+    """
+    matrix = build_score_matrix(score_dicts)
+    scored = score_matrix(matrix, policy or ScoringPolicy())
+    return [
+        {
+            "overall_score": None if math.isnan(overall) else float(overall),
+            "sanity_passed": bool(sanity),
+            "passed": bool(passed),
+            "judge_errors": errors,
+        }
+        for overall, sanity, passed, errors in zip(
+            scored["overall_score"].tolist(),
+            scored["sanity_passed"].tolist(),
+            scored["passed"].tolist(),
+            matrix.judge_errors,
+        )
+    ]
+
 
 def compute_pass_result(
     scores: dict,
     keyword_threshold: float = DEFAULT_KEYWORD_THRESHOLD,
     pass_threshold: float = DEFAULT_PASS_THRESHOLD,
 ) -> dict:
-    """점수 딕셔너리에서 overall_score, sanity_passed, passed를 계산.
+    """점수 딕셔너리에서 overall_score, sanity_passed, passed를 계산 (단일 케이스, 가중치 없음).
 
     Args:
         scores: 평가 점수 딕셔너리 (keyword_inclusion, forbidden_word_check, llm_judge_* 등)
@@ -19,25 +241,38 @@ def compute_pass_result(
         pass_threshold: 전체 점수 통과 기준 (기본값: config.DEFAULT_PASS_THRESHOLD)
 
     Returns:
-        {"overall_score": float|None, "sanity_passed": bool, "passed": bool}
+        {"overall_score": float|None, "sanity_passed": bool, "passed": bool,
+         "judge_errors": list[str]}
     """
-    llm_judge_scores = {k: v for k, v in scores.items() if k.startswith("llm_judge_")}
-    overall_score = (
-        sum(llm_judge_scores.values()) / len(llm_judge_scores)
-        if llm_judge_scores
-        else None
-    )
+    policy = ScoringPolicy(keyword_threshold=keyword_threshold, min_score=pass_threshold)
+    return compute_pass_results([scores], policy)[0]
 
-    keyword_score = scores.get("keyword_inclusion", 1.0)
-    forbidden_score = scores.get("forbidden_word_check", 1.0)
-    sanity_passed = keyword_score >= keyword_threshold and forbidden_score == 1.0
 
-    passed = sanity_passed and (
-        overall_score is None or overall_score >= pass_threshold
-    )
+def rescore_results(results: list[dict], policy: ScoringPolicy) -> list[dict]:
+    """케이스 결과 목록의 overall_score/passed를 정책으로 다시 계산 (원본은 변경하지 않음)."""
+    pass_results = compute_pass_results([r.get("scores", {}) for r in results], policy)
+    return [
+        {**result, "overall_score": pr["overall_score"], "passed": pr["passed"]}
+        for result, pr in zip(results, pass_results)
+    ]
 
-    return {
-        "overall_score": overall_score,
-        "sanity_passed": sanity_passed,
-        "passed": passed,
+
+def summarize_pass_results(results: list[dict], policy: ScoringPolicy) -> dict:
+    """케이스 결과 목록의 통과율/평균 점수 요약 (thresholds.pass_rate 판정 포함)."""
+    total = len(results)
+    passed_count = sum(1 for r in results if r.get("passed", False))
+    all_scores = [
+        r["overall_score"] for r in results if r.get("overall_score") is not None
+    ]
+    pass_rate = passed_count / total if total > 0 else 0.0
+    summary = {
+        "total": total,
+        "passed": passed_count,
+        "failed": total - passed_count,
+        "pass_rate": pass_rate,
+        "avg_score": sum(all_scores) / len(all_scores) if all_scores else None,
     }
+    if policy.pass_rate is not None:
+        summary["pass_rate_threshold"] = policy.pass_rate
+        summary["meets_pass_rate"] = pass_rate >= policy.pass_rate
+    return summary
@@ -0,0 +1,173 @@
+"""임베딩 기반 의미 유사도 평가자.
+
+출력과 expected.json의 reference(없으면 expected_output)를 임베딩하여
+코사인 유사도로 점수화한다. Judge 호출 없이 얻는 저비용 품질 신호.
+
+- 임베딩은 텍스트 해시 키로 디스크 캐시(sqlite)에 저장하여 재실행 시 재사용
+- 캐시에 없는 텍스트만 모아 EMBEDDING_BATCH_SIZE 단위로 일괄 요청
+- 유사도는 정규화된 행렬 간 행 단위 내적 한 번으로 계산
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import logging
+
+import numpy as np
+
+from prompt_evaluator.config import DEFAULT_EMBEDDING_THRESHOLD, EMBEDDING_BATCH_SIZE
+from prompt_evaluator.models import get_embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """텍스트 해시 → 임베딩 벡터 디스크 캐시 (sqlite, float32 BLOB).
+
+    Args:
+        path: sqlite 파일 경로
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """캐시에 있는 키의 벡터만 반환."""
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            # sqlite 변수 개수 제한을 피하기 위해 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [
+                    (key, np.asarray(vec, dtype=np.float32).tobytes())
+                    for key, vec in items.items()
+                ],
+            )
+            self._conn.commit()
+
+
+_default_cache: EmbeddingCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """results/cache/embeddings.sqlite 기본 캐시 반환."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            from prompt_evaluator.context import get_context
+
+            _default_cache = EmbeddingCache(
+                get_context().results_dir / "cache" / "embeddings.sqlite"
+            )
+        return _default_cache
+
+
+def _model_id(embeddings) -> str:
+    return str(
+        getattr(embeddings, "model", None)
+        or getattr(embeddings, "model_name", None)
+        or type(embeddings).__name__
+    )
+
+
+def embed_texts(
+    texts: list[str],
+    embeddings=None,
+    cache: EmbeddingCache | None = None,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+) -> np.ndarray:
+    """텍스트 목록을 L2 정규화된 임베딩 행렬 (len(texts), dim)로 변환.
+
+    중복 텍스트는 한 번만, 캐시에 없는 텍스트만 batch_size 단위로 요청한다.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    embeddings = embeddings or get_embeddings()
+    cache = cache or get_embedding_cache()
+    model = _model_id(embeddings)
+
+    keys = [EmbeddingCache.make_key(model, text) for text in texts]
+    unique = dict(zip(keys, texts))
+    vectors = cache.get_many(list(unique))
+
+    missing = [key for key in unique if key not in vectors]
+    if missing:
+        logger.debug(f"  임베딩 요청: {len(missing)}건 (캐시 {len(vectors)}건)")
+        fresh: dict[str, np.ndarray] = {}
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            result = embeddings.embed_documents([unique[key] for key in chunk])
+            for key, vec in zip(chunk, result):
+                fresh[key] = np.asarray(vec, dtype=np.float32)
+        cache.put_many(fresh)
+        vectors.update(fresh)
+
+    matrix = np.stack([vectors[key] for key in keys])
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def semantic_similarity_batch(
+    outputs: list[str],
+    references: list[str],
+    threshold: float = DEFAULT_EMBEDDING_THRESHOLD,
+    embeddings=None,
+    cache: EmbeddingCache | None = None,
+) -> list[dict[str, Any]]:
+    """출력/참조 쌍 목록의 코사인 유사도를 한 번에 계산.
+
+    Args:
+        outputs: LLM 출력 목록
+        references: 같은 순서의 참조 텍스트 목록
+        threshold: 통과 기준 유사도
+
+    Returns:
+        [{"score": float, "passed": bool, "details": str}, ...]
+    """
+    if len(outputs) != len(references):
+        raise ValueError("outputs와 references의 길이가 다릅니다.")
+    if not outputs:
+        return []
+
+    matrix = embed_texts(list(outputs) + list(references), embeddings, cache)
+    n = len(outputs)
+    similarities = np.einsum("ij,ij->i", matrix[:n], matrix[n:])
+    scores = np.clip(similarities, 0.0, 1.0)
+
+    return [
+        {
+            "score": float(score),
+            "passed": bool(score >= threshold),
+            "details": f"Cosine similarity {float(sim):.3f} (threshold {threshold})",
+        }
+        for score, sim in zip(scores, similarities)
+    ]
@@ -0,0 +1,132 @@
+"""Judge verdict 보관소.
+
+Judge의 체크리스트/피드백 전문을 실험 JSON 대신 별도 sqlite 파일에 압축 저장하고,
+실험 결과에는 verdict ID만 남긴다. 실패 원인 분석 시 Judge를 다시 호출하지 않고
+필요한 verdict만 ID로 조회한다.
+
+- ID는 verdict 내용의 해시 → 같은 verdict는 한 번만 저장 (중복 제거)
+- 본문은 정렬된 JSON을 zlib으로 압축한 BLOB
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+
+VERDICT_ID_LENGTH = 16
+
+# criterion 결과 중 보관할 필드 (usage 등 실행 부가 정보는 제외)
+_VERDICT_FIELDS = (
+    "score",
+    "checklist",
+    "feedback",
+    "samples",
+    "agreement",
+    "mode",
+    "repaired",
+)
+
+
+class VerdictStore:
+    """verdict ID → 압축 verdict JSON 저장소 (sqlite).
+
+    Args:
+        path: sqlite 파일 경로
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (id TEXT PRIMARY KEY, data BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def encode(verdict: dict) -> tuple[str, bytes]:
+        """verdict를 (ID, 압축 본문)으로 변환."""
+        payload = json.dumps(
+            verdict, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")
+        verdict_id = hashlib.sha256(payload).hexdigest()[:VERDICT_ID_LENGTH]
+        return verdict_id, zlib.compress(payload)
+
+    def put(self, verdict: dict) -> str:
+        """verdict 저장 후 ID 반환 (이미 있으면 저장 생략)."""
+        verdict_id, blob = self.encode(verdict)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO verdicts (id, data) VALUES (?, ?)",
+                (verdict_id, blob),
+            )
+            self._conn.commit()
+        return verdict_id
+
+    def get(self, verdict_id: str) -> dict | None:
+        """ID로 verdict 1건 로드 (없으면 None)."""
+        return self.get_many([verdict_id]).get(verdict_id)
+
+    def get_many(self, verdict_ids: list[str]) -> dict[str, dict]:
+        """여러 ID의 verdict를 한 번에 로드 (없는 ID는 제외)."""
+        found: dict[str, dict] = {}
+        ids = list(dict.fromkeys(verdict_ids))
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT id, data FROM verdicts WHERE id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for verdict_id, blob in rows:
+                    found[verdict_id] = json.loads(zlib.decompress(blob))
+        return found
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+
+_default_store: VerdictStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_verdict_store() -> VerdictStore:
+    """results/verdicts.sqlite 기본 보관소 반환."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            from prompt_evaluator.context import get_context
+
+            _default_store = VerdictStore(get_context().results_dir / "verdicts.sqlite")
+        return _default_store
+
+
+def store_verdict(criterion: str, criterion_result: dict) -> str | None:
+    """Judge 기준 결과를 보관하고 verdict ID 반환.
+
+    보관에 실패해도 평가는 계속되어야 하므로 예외 대신 None을 반환한다.
+    """
+    verdict: dict[str, Any] = {"criterion": criterion}
+    verdict.update(
+        {key: criterion_result[key] for key in _VERDICT_FIELDS if key in criterion_result}
+    )
+    try:
+        return get_verdict_store().put(verdict)
+    except sqlite3.Error:
+        return None
+
+
+def collect_verdict_ids(experiment_result: dict) -> dict[str, dict[str, str]]:
+    """실험 결과 JSON에서 {case_id: {score_name: verdict_id}} 추출."""
+    index: dict[str, dict[str, str]] = {}
+    for case in experiment_result.get("results", []):
+        for name, meta in (case.get("score_metadata") or {}).items():
+            if meta.get("verdict_id"):
+                index.setdefault(case.get("case_id", ""), {})[name] = meta["verdict_id"]
+    return index
@@ -5,8 +5,16 @@ CLI의 init 등 LLM이 필요 없는 명령어에서 API 키 에러를 방지.
 """
 
 from prompt_evaluator.config import (
-    DEFAULT_MODEL,
-    DEFAULT_LLM_JUDGE_MODEL,
+    DEFAULT_EMBEDDING_PROVIDER,
+    EXECUTION_API_KEY,
+    EXECUTION_BASE_URL,
+    EXECUTION_MODEL,
+    JUDGE_API_KEY,
+    JUDGE_BASE_URL,
+    JUDGE_MODEL,
+    LOCAL_API_KEY_PLACEHOLDER,
+    OPENAI_EMBEDDING_MODEL,
+    VERTEX_EMBEDDING_MODEL,
     DEFAULT_TEMPERATURE,
     GEMINI_MODEL,
     GEMINI_MAX_TOKENS,
@@ -22,13 +30,34 @@ from prompt_evaluator.config import (
 
 _execution_llm = None
 _judge_llm = None
+_embeddings = None
+
+
+def _openai_compatible_chat(model: str, base_url: str | None, api_key: str | None):
+    """OpenAI 호환 ChatOpenAI 생성 (base_url 미지정 시 OpenAI API)."""
+    from langchain_openai import ChatOpenAI
+
+    kwargs = {"model": model, "temperature": DEFAULT_TEMPERATURE}
+    if base_url:
+        kwargs["base_url"] = base_url
+        kwargs["api_key"] = api_key or LOCAL_API_KEY_PLACEHOLDER
+    elif api_key:
+        kwargs["api_key"] = api_key
+    return ChatOpenAI(**kwargs)
 
 
 def get_execution_llm():
-    """프롬프트 실행용 LLM 인스턴스 반환."""
+    """프롬프트 실행용 LLM 인스턴스 반환.
+
+    EXECUTION_BASE_URL > GOOGLE_CLOUD_PROJECT (Gemini) > OpenAI 순으로 선택.
+    """
     global _execution_llm
     if _execution_llm is None:
-        if GOOGLE_CLOUD_PROJECT:
+        if EXECUTION_BASE_URL:
+            _execution_llm = _openai_compatible_chat(
+                EXECUTION_MODEL, EXECUTION_BASE_URL, EXECUTION_API_KEY
+            )
+        elif GOOGLE_CLOUD_PROJECT:
             from langchain_google_vertexai import ChatVertexAI
 
             _execution_llm = ChatVertexAI(
@@ -40,23 +69,34 @@ def get_execution_llm():
                 thinking_budget=GEMINI_THINKING_BUDGET,
             )
         else:
-            from langchain_openai import ChatOpenAI
-
-            _execution_llm = ChatOpenAI(
-                model=DEFAULT_MODEL,
-                temperature=DEFAULT_TEMPERATURE,
+            _execution_llm = _openai_compatible_chat(
+                EXECUTION_MODEL, None, EXECUTION_API_KEY
             )
     return _execution_llm
 
 
 def get_judge_llm():
-    """LLM Judge 평가용 LLM 인스턴스 반환 (OpenAI 고정)."""
+    """LLM Judge 평가용 LLM 인스턴스 반환 (OpenAI 또는 JUDGE_BASE_URL의 호환 서버)."""
     global _judge_llm
     if _judge_llm is None:
-        from langchain_openai import ChatOpenAI
-
-        _judge_llm = ChatOpenAI(
-            model=DEFAULT_LLM_JUDGE_MODEL,
-            temperature=DEFAULT_TEMPERATURE,
-        )
+        _judge_llm = _openai_compatible_chat(JUDGE_MODEL, JUDGE_BASE_URL, JUDGE_API_KEY)
     return _judge_llm
+
+
+def get_embeddings():
+    """의미 유사도 평가용 임베딩 모델 인스턴스 반환 (DEFAULT_EMBEDDING_PROVIDER 기준)."""
+    global _embeddings
+    if _embeddings is None:
+        if DEFAULT_EMBEDDING_PROVIDER == "vertex":
+            from langchain_google_vertexai import VertexAIEmbeddings
+
+            _embeddings = VertexAIEmbeddings(
+                model_name=VERTEX_EMBEDDING_MODEL,
+                project=GOOGLE_CLOUD_PROJECT,
+                location=GOOGLE_CLOUD_LOCATION,
+            )
+        else:
+            from langchain_openai import OpenAIEmbeddings
+
+            _embeddings = OpenAIEmbeddings(model=OPENAI_EMBEDDING_MODEL)
+    return _embeddings
@@ -0,0 +1,228 @@
+"""Pairwise A/B 비교 파이프라인
+
+두 프롬프트 버전을 같은 테스트 케이스로 실행(또는 캐시된 출력 재사용)하고,
+pairwise Judge로 직접 비교하여 케이스별/전체 승률과 신뢰구간을 산출합니다.
+
+버전 지정:
+    "local"  → 현재 로컬 프롬프트 파일
+    "v1.2"   → .metadata.yaml의 langfuse_version으로 Langfuse에서 조회
+               (메타데이터에 없으면 메이저 번호를 Langfuse 버전으로 사용)
+"""
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import logging
+
+from prompt_evaluator.config import DEFAULT_PAIRWISE_MAX_WORKERS
+from prompt_evaluator.context import get_context
+from prompt_evaluator.evaluators.llm_judge import get_judge_usage, reset_judge_usage
+from prompt_evaluator.evaluators.pairwise import (
+    run_pairwise_judgements,
+    summarize_pairwise,
+)
+from prompt_evaluator.loaders import load_evaluation_set
+from prompt_evaluator.models import get_execution_llm
+from prompt_evaluator.pipelines.pipeline import execute_prompt
+from prompt_evaluator.utils.prompt_sync import get_prompt
+from prompt_evaluator.versioning.prompt_metadata import load_metadata
+
+logger = logging.getLogger(__name__)
+
+LOCAL_VERSION = "local"
+
+
+def resolve_prompt_version(
+    prompt_name: str,
+    version: str,
+    local_template: str,
+    targets_dir: Path,
+) -> str:
+    """버전 문자열을 프롬프트 템플릿으로 변환.
+
+    Args:
+        prompt_name: 프롬프트 이름
+        version: "local" 또는 버전 태그 (예: v1.2)
+        local_template: 로컬 프롬프트 템플릿
+        targets_dir: 타겟 폴더 경로
+
+    Returns:
+        프롬프트 템플릿 문자열
+    """
+    if version == LOCAL_VERSION:
+        return local_template
+
+    metadata = load_metadata(prompt_name, targets_dir) or {}
+    langfuse_version = (
+        metadata.get("versions", {}).get(version, {}).get("langfuse_version")
+    )
+    if langfuse_version is None:
+        langfuse_version = int(version.lstrip("v").split(".")[0])
+
+    logger.info(f"  {version} → Langfuse 프롬프트 버전 {langfuse_version}")
+    prompt_obj = get_prompt(prompt_name, backend="langfuse", version=langfuse_version)
+    return prompt_obj.compile()
+
+
+def _outputs_cache_path(prompt_name: str, version: str, template: str) -> Path:
+    """버전별 출력 캐시 경로 (템플릿 + 실행 모델 해시로 구분)."""
+    model_name = getattr(get_execution_llm(), "model_name", "")
+    digest = hashlib.sha256(f"{model_name}\n{template}".encode("utf-8")).hexdigest()
+    safe_version = version.replace("/", "_")
+    return (
+        get_context().comparisons_dir
+        / prompt_name
+        / "outputs"
+        / f"{safe_version}-{digest[:12]}.json"
+    )
+
+
+def _case_cache_key(case: dict) -> str:
+    """출력 캐시 항목 키 (case_id + 입력 해시, 같은 id라도 입력이 바뀌면 다시 실행)."""
+    payload = json.dumps(case["inputs"], ensure_ascii=False, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{case['id']}#{digest[:12]}"
+
+
+def collect_outputs(
+    prompt_name: str,
+    version: str,
+    template: str,
+    test_cases: list[dict],
+    use_cache: bool = True,
+    max_workers: int = DEFAULT_PAIRWISE_MAX_WORKERS,
+) -> dict[str, str]:
+    """버전의 케이스별 출력 수집 (캐시에 없는 케이스만 병렬 실행).
+
+    캐시는 템플릿/모델별 파일에 (case_id + 입력 해시) 키로 저장되며,
+    입력이 바뀐 케이스는 다시 실행하고 이전 항목은 저장 시 정리한다.
+
+    Returns:
+        {case_id: output}
+    """
+    cache_path = _outputs_cache_path(prompt_name, version, template)
+    keys = {case["id"]: _case_cache_key(case) for case in test_cases}
+    cached: dict[str, str] = {}
+    if use_cache and cache_path.exists():
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    outputs = {
+        case_id: cached[key] for case_id, key in keys.items() if key in cached
+    }
+
+    pending = [case for case in test_cases if case["id"] not in outputs]
+    logger.info(
+        f"  [{version}] 캐시 재사용 {len(test_cases) - len(pending)}건 / 실행 {len(pending)}건"
+    )
+    if pending:
+
+        def run(case: dict) -> str:
+            return execute_prompt(template, case["inputs"])
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for case, output in zip(pending, executor.map(run, pending)):
+                outputs[case["id"]] = output
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {keys[case_id]: output for case_id, output in outputs.items()},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    return outputs
+
+
+def run_pairwise_comparison(
+    prompt_name: str,
+    version_a: str,
+    version_b: str,
+    use_cache: bool = True,
+    max_workers: int = DEFAULT_PAIRWISE_MAX_WORKERS,
+) -> dict[str, Any]:
+    """두 프롬프트 버전을 pairwise Judge로 비교.
+
+    Args:
+        prompt_name: 평가 세트 이름
+        version_a: A 버전 ("local" 또는 버전 태그)
+        version_b: B 버전 ("local" 또는 버전 태그)
+        use_cache: 버전별 캐시된 출력 재사용 여부
+        max_workers: 동시 실행/Judge 호출 수
+
+    Returns:
+        {"prompt_name", "version_a", "version_b", "timestamp",
+         "results", "summary", "judge_usage"}
+    """
+    ctx = get_context()
+    data = load_evaluation_set(
+        prompt_name,
+        targets_dir=ctx.targets_dir,
+        datasets_dir=ctx.datasets_dir,
+    )
+    eval_config = data["eval_config"] or {}
+    if isinstance(eval_config.get("pipeline"), dict):
+        raise ValueError(
+            "파이프라인 모드 타겟은 프롬프트 버전 비교를 지원하지 않습니다."
+        )
+
+    test_cases = data["test_cases"]
+    criteria = (eval_config.get("pairwise") or {}).get("criteria")
+
+    logger.info(f"Pairwise 비교 시작: {prompt_name} ({version_a} vs {version_b})")
+    logger.info(f"  Cases: {len(test_cases)}")
+
+    template_a = resolve_prompt_version(
+        prompt_name, version_a, data["template"], ctx.targets_dir
+    )
+    template_b = resolve_prompt_version(
+        prompt_name, version_b, data["template"], ctx.targets_dir
+    )
+
+    outputs_a = collect_outputs(
+        prompt_name, version_a, template_a, test_cases, use_cache, max_workers
+    )
+    outputs_b = collect_outputs(
+        prompt_name, version_b, template_b, test_cases, use_cache, max_workers
+    )
+
+    cases = [
+        {
+            "id": case["id"],
+            "input": case["inputs"],
+            "output_a": outputs_a[case["id"]],
+            "output_b": outputs_b[case["id"]],
+        }
+        for case in test_cases
+    ]
+
+    logger.info(f"  Pairwise Judge 호출 중... ({len(cases) * 2}회)")
+    reset_judge_usage()
+    results = run_pairwise_judgements(cases, criteria=criteria, max_workers=max_workers)
+
+    return {
+        "prompt_name": prompt_name,
+        "version_a": version_a,
+        "version_b": version_b,
+        "timestamp": datetime.now().isoformat(),
+        "results": results,
+        "summary": summarize_pairwise(results),
+        "judge_usage": get_judge_usage(),
+    }
+
+
+def save_comparison_result(result: dict) -> Path:
+    """비교 결과를 results/comparisons/{name}/ 에 저장."""
+    result_dir = get_context().comparisons_dir / result["prompt_name"]
+    result_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    name = f"{result['version_a']}-vs-{result['version_b']}-{stamp}".replace("/", "_")
+    path = result_dir / f"{name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return path
@@ -29,15 +29,34 @@ logger = logging.getLogger(__name__)
 from prompt_evaluator.loaders import load_evaluation_set
 from prompt_evaluator.utils.dataset_sync import upload_dataset, get_dataset
 from prompt_evaluator.evaluators.adapters import (
+    create_langfuse_criteria_reference_evaluator,
+    create_langfuse_criteria_reference_run_evaluator,
     create_langfuse_evaluator,
-    create_langfuse_forbidden_evaluator,
-    create_langfuse_keyword_evaluator,
+    create_langfuse_rule_evaluator,
+    create_langfuse_semantic_run_evaluator,
+    create_langsmith_criteria_reference_evaluator,
+    create_langsmith_criteria_reference_summary_evaluator,
     create_langsmith_evaluator,
-    create_langsmith_forbidden_evaluator,
-    create_langsmith_keyword_evaluator,
+    create_langsmith_rule_evaluator,
+    create_langsmith_semantic_summary_evaluator,
+)
+from prompt_evaluator.evaluators.dependencies import get_judge_dependencies
+from prompt_evaluator.evaluators.llm_judge import get_judge_usage, reset_judge_usage
+from prompt_evaluator.evaluators.normalization import get_normalize_steps
+from prompt_evaluator.evaluators.registry import CaseResultCache
+from prompt_evaluator.evaluators.scoring import (
+    ERROR,
+    SKIPPED,
+    ScoringPolicy,
+    rescore_results,
+    summarize_pass_results,
 )
-from prompt_evaluator.evaluators.scoring import compute_pass_result
 from prompt_evaluator.models import get_execution_llm
+from prompt_evaluator.regression.canary import (
+    JudgeCanaryGate,
+    finish_judge_canary,
+    start_judge_canary,
+)
 from prompt_evaluator.utils.prompt_sync import get_prompt
 
 RunMode = Literal["quick", "full"]
@@ -92,6 +111,9 @@ def run_langsmith_experiment(
     mode: RunMode = "full",
     experiment_prefix: str | None = None,
     prompt_version: str | None = None,
+    reuse_baseline: str | None = None,
+    canary_block: bool = False,
+    canary_refresh: bool = False,
 ) -> str:
     """LangSmith Experiment로 평가 실행.
 
@@ -103,6 +125,9 @@ def run_langsmith_experiment(
         mode: 실행 모드 (quick/full)
         experiment_prefix: 실험 이름 접두사
         prompt_version: LangSmith 프롬프트 버전 태그 (None이면 로컬 파일 사용)
+        reuse_baseline: 기준선 버전 (지정 시 출력이 동일한 케이스는 기준선 Judge 점수 상속)
+        canary_block: Judge 카나리아 drift가 임계값을 넘으면 JudgeDriftError 발생
+        canary_refresh: 카나리아 기준 점수를 이번 채점 결과로 다시 기록
 
     Returns:
         실험 URL
@@ -168,12 +193,36 @@ def run_langsmith_experiment(
             return {"output": output}
 
     # 4. 평가자 구성
-    evaluators = [
-        create_langsmith_keyword_evaluator(expected_all),
-        create_langsmith_forbidden_evaluator(expected_all),
-    ]
+    # 케이스별 출력 파싱/rule-based 결과를 평가자 간 공유 (depends_on, criteria_reference)
+    case_cache = CaseResultCache(expected_all, eval_config)
+    evaluators = [create_langsmith_rule_evaluator(expected_all, eval_config, case_cache)]
+    summary_evaluators = []
+
+    semantic_config = _find_evaluator_config(eval_config, "semantic_similarity")
+    if semantic_config and semantic_config.get("enabled", True):
+        threshold = semantic_config.get("threshold")
+        logger.info("  임베딩 유사도 평가자 추가")
+        summary_evaluators.append(
+            create_langsmith_semantic_summary_evaluator(expected_all, threshold)
+        )
+
+    reference_config = _find_evaluator_config(eval_config, "criteria_reference")
+    if reference_config and reference_config.get("enabled", True):
+        logger.info("  기준 코드 참조 평가자 추가")
+        evaluators.append(
+            create_langsmith_criteria_reference_evaluator(
+                expected_all, reference_config.get("threshold"), case_cache
+            )
+        )
+        summary_evaluators.append(
+            create_langsmith_criteria_reference_summary_evaluator(expected_all, case_cache)
+        )
 
     # 5. LLM Judge 평가자 추가 (full 모드 또는 eval_config에 설정된 경우)
+    # 카나리아는 Judge 평가자보다 먼저 시작 (--canary-block이면 Judge 호출 전에 drift 확인)
+    reset_judge_usage()
+    canary = start_judge_canary(refresh=canary_refresh) if mode == "full" else None
+    canary_gate = JudgeCanaryGate(canary) if canary_block else None
     llm_judge_config = None
     for evaluator in eval_config.get("evaluators", []):
         if evaluator.get("type") == "llm_judge":
@@ -183,9 +232,26 @@ def run_langsmith_experiment(
     if llm_judge_config and llm_judge_config.get("enabled", True):
         criteria = llm_judge_config.get("criteria", [])
         if mode == "full" or criteria:
+            depends_on = get_judge_dependencies(llm_judge_config)
             logger.info(f"  LLM Judge 평가자 추가: {criteria}")
+            if depends_on:
+                logger.info(f"  LLM Judge 선행 검사: {depends_on}")
+            criterion_options = llm_judge_config.get("criterion_options") or {}
+            inherited = _load_inherited_scores(prompt_name, reuse_baseline, eval_config)
             for criterion in criteria:
-                evaluators.append(create_langsmith_evaluator(criterion, template))
+                evaluators.append(
+                    create_langsmith_evaluator(
+                        criterion,
+                        template,
+                        expected_all=expected_all,
+                        depends_on=depends_on,
+                        options=criterion_options.get(criterion),
+                        inherited=inherited,
+                        eval_config=eval_config,
+                        cache=case_cache,
+                        canary=canary_gate,
+                    )
+                )
 
     # 7. 실험 이름 설정
     if experiment_prefix is None:
@@ -201,12 +267,15 @@ def run_langsmith_experiment(
         target,
         data=dataset_name,
         evaluators=evaluators,
+        summary_evaluators=summary_evaluators or None,
         experiment_prefix=experiment_prefix,
     )
 
     # 9. 결과 URL 반환
     experiment_url = "https://smith.langchain.com/datasets"
     logger.info("✅ Experiment 완료!")
+    finish_judge_canary(canary, block=canary_block)
+    _log_judge_usage(get_judge_usage())
     logger.info(f"  결과 확인: {experiment_url}")
 
     return experiment_url
@@ -222,6 +291,9 @@ def run_langfuse_experiment(
     mode: RunMode = "full",
     experiment_prefix: str | None = None,
     prompt_version: str | None = None,
+    reuse_baseline: str | None = None,
+    canary_block: bool = False,
+    canary_refresh: bool = False,
 ) -> dict[str, Any]:
     """Langfuse 기반 실험 실행.
 
@@ -233,6 +305,9 @@ def run_langfuse_experiment(
         mode: 실행 모드 (quick/full)
         experiment_prefix: 실험 이름 접두사
         prompt_version: Langfuse 프롬프트 버전 (None이면 로컬 파일 사용)
+        reuse_baseline: 기준선 버전 (지정 시 출력이 동일한 케이스는 기준선 Judge 점수 상속)
+        canary_block: Judge 카나리아 drift가 임계값을 넘으면 JudgeDriftError 발생
+        canary_refresh: 카나리아 기준 점수를 이번 채점 결과로 다시 기록
 
     Returns:
         실험 결과 딕셔너리
@@ -313,9 +388,12 @@ def run_langfuse_experiment(
         mode == "full" and llm_judge_config and llm_judge_config.get("enabled", True)
     )
     criteria = llm_judge_config.get("criteria", []) if llm_judge_config else []
+    depends_on = get_judge_dependencies(llm_judge_config)
 
     if use_llm_judge:
         logger.info(f"  LLM Judge 평가자: {criteria}")
+        if depends_on:
+            logger.info(f"  LLM Judge 선행 검사: {depends_on}")
 
     # 5. Task 함수 정의
     if pipeline_mode:
@@ -333,15 +411,56 @@ def run_langfuse_experiment(
             return {"output": output}
 
     # 6. 평가자 구성
-    evaluators = [
-        create_langfuse_keyword_evaluator(expected_all),
-        create_langfuse_forbidden_evaluator(expected_all),
-    ]
+    # 케이스별 출력 파싱/rule-based 결과를 평가자 간 공유 (depends_on, criteria_reference)
+    case_cache = CaseResultCache(expected_all, eval_config)
+    evaluators = [create_langfuse_rule_evaluator(expected_all, eval_config, case_cache)]
+    run_evaluators = []
+    semantic_scores: dict[str, dict] = {}  # trace_id → 케이스 임베딩 유사도 (run evaluator가 채움)
+
+    semantic_config = _find_evaluator_config(eval_config, "semantic_similarity")
+    if semantic_config and semantic_config.get("enabled", True):
+        threshold = semantic_config.get("threshold")
+        logger.info("  임베딩 유사도 평가자 추가")
+        run_evaluators.append(
+            create_langfuse_semantic_run_evaluator(
+                expected_all, threshold, case_results=semantic_scores
+            )
+        )
+
+    reference_config = _find_evaluator_config(eval_config, "criteria_reference")
+    if reference_config and reference_config.get("enabled", True):
+        logger.info("  기준 코드 참조 평가자 추가")
+        evaluators.append(
+            create_langfuse_criteria_reference_evaluator(
+                expected_all, reference_config.get("threshold"), case_cache
+            )
+        )
+        run_evaluators.append(
+            create_langfuse_criteria_reference_run_evaluator(expected_all, case_cache)
+        )
 
     # LLM Judge 평가자 추가 (full 모드)
+    # 카나리아는 Judge 평가자보다 먼저 시작 (--canary-block이면 Judge 호출 전에 drift 확인)
+    reset_judge_usage()
+    canary = start_judge_canary(refresh=canary_refresh) if mode == "full" else None
+    canary_gate = JudgeCanaryGate(canary) if canary_block else None
     if use_llm_judge:
+        criterion_options = llm_judge_config.get("criterion_options") or {}
+        inherited = _load_inherited_scores(prompt_name, reuse_baseline, eval_config)
         for criterion in criteria:
-            evaluators.append(create_langfuse_evaluator(criterion, template))
+            evaluators.append(
+                create_langfuse_evaluator(
+                    criterion,
+                    template,
+                    expected_all=expected_all,
+                    depends_on=depends_on,
+                    options=criterion_options.get(criterion),
+                    inherited=inherited,
+                    eval_config=eval_config,
+                    cache=case_cache,
+                    canary=canary_gate,
+                )
+            )
 
     # 8. Langfuse 내장 run_experiment 실행
     logger.info("  실험 실행 중...")
@@ -350,6 +469,7 @@ def run_langfuse_experiment(
         data=dataset.items,
         task=task,
         evaluators=evaluators,
+        run_evaluators=run_evaluators,
         metadata={"mode": mode, "model": model_display},
     )
 
@@ -364,24 +484,22 @@ def run_langfuse_experiment(
 
         # 점수 추출 (evaluations 리스트에서)
         scores = {}
+        score_metadata = {}
         for evaluation in item_result.evaluations:
             # evaluation이 dict일 수도 있고 Evaluation 객체일 수도 있음
             if isinstance(evaluation, dict):
                 name = evaluation.get("name", "unknown")
                 value = evaluation.get("value", 0.0)
+                metadata = evaluation.get("metadata")
             else:
                 name = evaluation.name
                 value = evaluation.value
+                metadata = getattr(evaluation, "metadata", None)
             scores[name] = value
-
-        # pass/fail 판정
-        pass_result = compute_pass_result(scores)
-        overall_score = pass_result["overall_score"]
-        passed = pass_result["passed"]
-
-        status = "✓" if passed else "✗"
-        score_str = f"{overall_score:.2f}" if overall_score is not None else "-"
-        logger.info(f"  [{case_id}] {status} ({score_str})")
+            if metadata:
+                score_metadata[name] = metadata
+        if item_result.trace_id in semantic_scores:
+            scores["semantic_similarity"] = semantic_scores[item_result.trace_id]["score"]
 
         output_text = ""
         if item_result.output:
@@ -395,31 +513,81 @@ def run_langfuse_experiment(
                 "case_id": case_id,
                 "output": output_text,
                 "scores": scores,
-                "overall_score": overall_score,
-                "passed": passed,
                 "trace_id": item_result.trace_id,
             }
         )
+        if score_metadata:
+            results[-1]["score_metadata"] = score_metadata
+
+    # pass/fail 판정 (전체 케이스를 점수 행렬로 한 번에, config.yaml weights/thresholds 적용)
+    scoring_policy = ScoringPolicy.from_config(eval_config)
+    results = rescore_results(results, scoring_policy)
+    for result in results:
+        skipped = [name for name, value in result["scores"].items() if value == SKIPPED]
+        inherited_names = [
+            name
+            for name, meta in result.get("score_metadata", {}).items()
+            if meta.get("inherited")
+        ]
+
+        status = "✓" if result["passed"] else "✗"
+        overall_score = result["overall_score"]
+        score_str = f"{overall_score:.2f}" if overall_score is not None else "-"
+        skip_str = f", Judge {len(skipped)}개 skipped" if skipped else ""
+        if inherited_names:
+            skip_str += f", Judge {len(inherited_names)}개 기준선 상속"
+        logger.info(f"  [{result['case_id']}] {status} ({score_str}{skip_str})")
 
     # 10. 요약
-    total = len(results)
-    passed_count = sum(1 for r in results if r.get("passed", False))
-    all_scores = [
-        r["overall_score"] for r in results if r.get("overall_score") is not None
-    ]
+    canary_report = finish_judge_canary(canary, block=canary_block)
+    skipped_count = sum(
+        1 for r in results for value in r["scores"].values() if value == SKIPPED
+    )
+    error_count = sum(
+        1 for r in results for value in r["scores"].values() if value == ERROR
+    )
+    inherited_count = sum(
+        1
+        for r in results
+        for meta in r.get("score_metadata", {}).values()
+        if meta.get("inherited")
+    )
 
     summary = {
-        "total": total,
-        "passed": passed_count,
-        "failed": total - passed_count,
-        "pass_rate": passed_count / total if total > 0 else 0.0,
-        "avg_score": sum(all_scores) / len(all_scores) if all_scores else None,
+        **summarize_pass_results(results, scoring_policy),
+        "skipped_judge_calls": skipped_count,
+        "judge_errors": error_count,
+        "inherited_judge_scores": inherited_count,
+        "judge_usage": get_judge_usage(),
+    }
+    run_scores = {
+        evaluation.name: evaluation.value
+        for evaluation in getattr(experiment_result, "run_evaluations", None) or []
     }
+    if run_scores:
+        summary["run_scores"] = run_scores
+    if canary_report:
+        summary["judge_canary"] = canary_report
 
     logger.info("✅ Langfuse Experiment 완료!")
-    logger.info(f"  결과: {passed_count}/{total} 통과 ({summary['pass_rate']:.1%})")
+    logger.info(
+        f"  결과: {summary['passed']}/{summary['total']} 통과 ({summary['pass_rate']:.1%})"
+    )
+    if "meets_pass_rate" in summary and not summary["meets_pass_rate"]:
+        logger.warning(
+            f"  ⚠ 통과율이 기준({summary['pass_rate_threshold']:.0%})에 미달합니다."
+        )
     if summary["avg_score"] is not None:
         logger.info(f"  평균 점수: {summary['avg_score']:.3f}")
+    if skipped_count:
+        logger.info(f"  선행 검사 실패로 생략된 Judge 호출: {skipped_count}개")
+    if inherited_count:
+        logger.info(f"  기준선에서 상속한 Judge 점수 (출력 동일): {inherited_count}개")
+    if error_count:
+        logger.warning(f"  ⚠ Judge 오류 (점수 집계 제외): {error_count}개")
+    for name, value in run_scores.items():
+        logger.info(f"  {name}: {value:.3f}")
+    _log_judge_usage(summary["judge_usage"])
     logger.info("  확인: http://localhost:3000")
 
     return {
@@ -433,6 +601,47 @@ def run_langfuse_experiment(
     }
 
 
+def _load_inherited_scores(
+    prompt_name: str, reuse_baseline: str | None, eval_config: dict | None = None
+) -> dict[str, dict] | None:
+    """기준선에서 Judge 점수 상속 인덱스 로드 (reuse_baseline 미지정 시 None)."""
+    if not reuse_baseline:
+        return None
+    from prompt_evaluator.regression.baseline import (
+        build_inherited_scores,
+        load_baseline,
+    )
+
+    baseline = load_baseline(prompt_name, reuse_baseline)
+    if baseline is None:
+        logger.warning(f"  ⚠ 기준선 없음 ({reuse_baseline}) → 점수 재사용 없이 실행")
+        return None
+    inherited = build_inherited_scores(baseline, get_normalize_steps(eval_config))
+    logger.info(f"  기준선 점수 재사용: {reuse_baseline} ({len(inherited)}개 케이스)")
+    return inherited
+
+
+def _find_evaluator_config(eval_config: dict, evaluator_type: str) -> dict | None:
+    """config.yaml evaluators 목록에서 해당 type의 첫 설정 반환."""
+    for evaluator in eval_config.get("evaluators", []):
+        if evaluator.get("type") == evaluator_type:
+            return evaluator
+    return None
+
+
+def _log_judge_usage(usage: dict) -> None:
+    """Judge 토큰 사용량 및 prompt cache 적중률 로그 출력."""
+    if not usage.get("calls"):
+        return
+    logger.info(
+        f"  Judge 토큰: 입력 {usage['input_tokens']:,} "
+        f"(캐시 {usage['cached_tokens']:,}, {usage['cache_hit_rate']:.1%}) / "
+        f"출력 {usage['output_tokens']:,} ({usage['calls']}회 호출)"
+    )
+    for criterion, saved in (usage.get("input_tokens_saved") or {}).items():
+        logger.info(f"    입력 투영 절약 [{criterion}]: {saved:,} 토큰")
+
+
 # ============================================================
 # 통합 Experiment 함수
 # ============================================================
@@ -444,6 +653,9 @@ def run_experiment(
     experiment_prefix: str | None = None,
     prompt_version: str | None = None,
     backend: Backend = "langfuse",
+    reuse_baseline: str | None = None,
+    canary_block: bool = False,
+    canary_refresh: bool = False,
 ) -> str | dict[str, Any]:
     """평가 실험 실행 (통합 인터페이스).
 
@@ -455,6 +667,9 @@ def run_experiment(
         experiment_prefix: 실험 이름 접두사
         prompt_version: 프롬프트 버전 태그
         backend: 실험 백엔드 ("langsmith" | "langfuse")
+        reuse_baseline: 기준선 버전 (출력이 동일한 케이스는 기준선 Judge 점수 상속)
+        canary_block: full 모드에서 Judge 카나리아 drift가 임계값을 넘으면 JudgeDriftError 발생
+        canary_refresh: 카나리아 기준 점수를 이번 채점 결과로 다시 기록
 
     Returns:
         LangSmith: 실험 URL (str)
@@ -466,6 +681,9 @@ def run_experiment(
             mode=mode,
             experiment_prefix=experiment_prefix,
             prompt_version=prompt_version,
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
         )
     elif backend == "langfuse":
         return run_langfuse_experiment(
@@ -473,6 +691,9 @@ def run_experiment(
             mode=mode,
             experiment_prefix=experiment_prefix,
             prompt_version=prompt_version,
+            reuse_baseline=reuse_baseline,
+            canary_block=canary_block,
+            canary_refresh=canary_refresh,
         )
     else:
         raise ValueError(f"Unknown backend: {backend}. Use 'langsmith' or 'langfuse'.")
@@ -10,13 +10,22 @@ from typing import Optional
 
 import logging
 
+import yaml
 from langsmith import Client
 
 logger = logging.getLogger(__name__)
 
 from prompt_evaluator.config import DEFAULT_PASS_THRESHOLD
 from prompt_evaluator.context import get_context
-from prompt_evaluator.evaluators.scoring import compute_pass_result
+from prompt_evaluator.evaluators.scoring import (
+    JUDGE_SCORE_PREFIX,
+    SKIPPED,
+    ScoringPolicy,
+    fingerprint_output,
+    is_numeric_score,
+    rescore_results,
+    summarize_pass_results,
+)
 
 
 def get_baseline_path(prompt_name: str, version: Optional[str] = None) -> Path:
@@ -89,6 +98,46 @@ def load_baseline(
         return json.load(f)
 
 
+def build_inherited_scores(
+    baseline: dict, normalize: tuple[str, ...] = ()
+) -> dict[str, dict]:
+    """기준선 케이스에서 케이스별 출력 지문과 Judge 점수 인덱스 생성.
+
+    출력이 기준선과 byte 단위로(normalize 지정 시 정규화 후) 동일한 케이스는
+    Judge를 다시 호출하지 않고 이 점수를 그대로 상속한다. case_id가 없거나
+    숫자 점수가 아닌 항목(skipped/error)은 제외한다.
+
+    Args:
+        baseline: load_baseline()으로 로드한 기준선 데이터
+        normalize: 지문 계산 전 적용할 정규화 단계 (config.yaml rule_based.normalize)
+
+    Returns:
+        {case_id: {"fingerprint": str, "normalize": list[str], "scores": {criterion: float}}}
+        criterion은 llm_judge_ 접두사를 뗀 'domain/name'
+    """
+    index: dict[str, dict] = {}
+    for case in baseline.get("results", {}).get("cases", []):
+        case_id = case.get("case_id")
+        outputs = case.get("outputs") or {}
+        output = outputs.get("output") if isinstance(outputs, dict) else None
+        if not case_id or not isinstance(output, str):
+            continue
+
+        scores = {}
+        for name, stats in (case.get("feedback_stats") or {}).items():
+            value = stats.get("avg") if isinstance(stats, dict) else stats
+            if is_numeric_score(value):
+                scores[name.removeprefix("llm_judge_")] = value
+
+        if scores:
+            index[case_id] = {
+                "fingerprint": fingerprint_output(output, normalize),
+                "normalize": list(normalize),
+                "scores": scores,
+            }
+    return index
+
+
 def set_as_baseline(
     prompt_name: str,
     experiment_name: str,
@@ -111,15 +160,16 @@ def set_as_baseline(
     # LangSmith에서 실험 결과 가져오기
     project = client.read_project(project_name=experiment_name)
 
-    # 실험 실행 결과 수집
-    runs = list(client.list_runs(project_name=experiment_name))
+    # 실험 실행 결과 수집 (케이스 단위 root run만, 하위 LLM/평가자 run 제외)
+    runs = list(client.list_runs(project_name=experiment_name, is_root=True))
+    case_ids = _load_case_ids(client, runs)
 
     results = {
         "experiment_name": experiment_name,
         "project_id": str(project.id),
         "total_runs": len(runs),
         "summary": _compute_summary_from_runs(runs),
-        "cases": _extract_case_results(runs),
+        "cases": _extract_case_results(runs, case_ids),
     }
 
     return save_baseline(prompt_name, results, version, metadata)
@@ -135,7 +185,7 @@ def _compute_summary_from_runs(runs: list) -> dict:
     for run in runs:
         if run.feedback_stats:
             for key, stats in run.feedback_stats.items():
-                if "avg" in stats:
+                if is_numeric_score(stats.get("avg")):
                     scores.append(stats["avg"])
 
     total = len(runs)
@@ -156,16 +206,35 @@ def _is_run_passed(run, threshold: float = DEFAULT_PASS_THRESHOLD) -> bool:
         return True  # 피드백 없으면 통과로 간주
 
     for key, stats in run.feedback_stats.items():
-        if "avg" in stats and stats["avg"] < threshold:
+        if is_numeric_score(stats.get("avg")) and stats["avg"] < threshold:
             return False
     return True
 
 
-def _extract_case_results(runs: list) -> list[dict]:
-    """실행 결과에서 케이스별 결과 추출"""
+def _load_case_ids(client: Client, runs: list) -> dict[str, str]:
+    """run이 참조하는 데이터셋 example id → case_id (example metadata)."""
+    example_ids = list(
+        {run.reference_example_id for run in runs if run.reference_example_id}
+    )
+    if not example_ids:
+        return {}
+    return {
+        str(example.id): (example.metadata or {}).get("case_id", "")
+        for example in client.list_examples(example_ids=example_ids)
+    }
+
+
+def _extract_case_results(runs: list, case_ids: dict[str, str] | None = None) -> list[dict]:
+    """실행 결과에서 케이스별 결과 추출
+
+    case_id(example metadata), 출력, 기준별 피드백 점수를 함께 저장하여
+    --reuse-baseline 점수 상속(build_inherited_scores)에 사용할 수 있게 한다.
+    """
+    case_ids = case_ids or {}
     case_results = []
     for run in runs:
         case_data = {
+            "case_id": case_ids.get(str(run.reference_example_id), ""),
             "run_id": str(run.id),
             "inputs": run.inputs,
             "outputs": run.outputs,
@@ -238,6 +307,7 @@ def save_experiment_result(
     prompt_name: str,
     experiment_result: dict,
     experiment_name: Optional[str] = None,
+    update_latest: bool = True,
 ) -> Path:
     """실험 결과를 로컬에 저장
 
@@ -245,6 +315,7 @@ def save_experiment_result(
         prompt_name: 프롬프트 이름
         experiment_result: 실험 결과 딕셔너리
         experiment_name: 실험 이름 (None이면 결과에서 추출)
+        update_latest: latest.json도 갱신할지 여부
 
     Returns:
         저장된 파일 경로
@@ -260,9 +331,10 @@ def save_experiment_result(
         json.dump(experiment_result, f, ensure_ascii=False, indent=2)
 
     # latest.json도 동시 저장
-    latest_path = result_dir / "latest.json"
-    with open(latest_path, "w", encoding="utf-8") as f:
-        json.dump(experiment_result, f, ensure_ascii=False, indent=2)
+    if update_latest:
+        latest_path = result_dir / "latest.json"
+        with open(latest_path, "w", encoding="utf-8") as f:
+            json.dump(experiment_result, f, ensure_ascii=False, indent=2)
 
     return result_path
 
@@ -370,20 +442,13 @@ def fetch_langfuse_experiment(
             scores = {}
             if trace.scores:
                 for score in trace.scores:
-                    scores[score.name] = score.value
-
-            # pass/fail 판정
-            pass_result = compute_pass_result(scores)
-            overall_score = pass_result["overall_score"]
-            passed = pass_result["passed"]
+                    scores[score.name] = _get_score_value(score)
 
             results.append(
                 {
                     "case_id": case_id,
                     "output": output_text,
                     "scores": scores,
-                    "overall_score": overall_score,
-                    "passed": passed,
                     "trace_id": run_item.trace_id,
                 }
             )
@@ -393,25 +458,169 @@ def fetch_langfuse_experiment(
             )
             continue
 
-    # 3. summary 계산
-    total = len(results)
-    passed_count = sum(1 for r in results if r.get("passed", False))
-    all_scores = [
-        r["overall_score"] for r in results if r.get("overall_score") is not None
-    ]
+    # 3. pass/fail 판정 및 summary 계산 (전체 케이스 일괄, 타겟 weights/thresholds 적용)
+    policy = load_scoring_policy(prompt_name)
+    results = rescore_results(results, policy)
 
     return {
         "experiment_name": dataset_run.name,
         "prompt_name": prompt_name,
         "results": results,
-        "summary": {
-            "total": total,
-            "passed": passed_count,
-            "failed": total - passed_count,
-            "pass_rate": passed_count / total if total > 0 else 0.0,
-            "avg_score": sum(all_scores) / len(all_scores) if all_scores else None,
-        },
+        "summary": summarize_pass_results(results, policy),
+    }
+
+
+def load_scoring_policy(prompt_name: str) -> ScoringPolicy:
+    """타겟 config.yaml의 weights/thresholds로 집계 정책 생성 (config 없으면 기본값)."""
+    config_file = get_context().targets_dir / prompt_name / "config.yaml"
+    if not config_file.exists():
+        return ScoringPolicy()
+    with open(config_file, "r", encoding="utf-8") as f:
+        return ScoringPolicy.from_config(yaml.safe_load(f))
+
+
+def rescore_experiment(experiment_result: dict, policy: ScoringPolicy) -> dict:
+    """저장된 실험 결과를 새 정책으로 재채점 (Judge 호출 없이 점수 행렬만 재계산).
+
+    Args:
+        experiment_result: 실험 결과 (results[].scores 포함)
+        policy: 적용할 집계 정책
+
+    Returns:
+        overall_score/passed/summary가 갱신된 새 실험 결과 딕셔너리
+    """
+    results = rescore_results(experiment_result.get("results", []), policy)
+    summary = {
+        **experiment_result.get("summary", {}),
+        **summarize_pass_results(results, policy),
     }
+    return {**experiment_result, "results": results, "summary": summary}
+
+
+def list_experiment_results(prompt_name: str) -> list[Path]:
+    """로컬에 저장된 실험 결과 파일 목록 (latest.json 제외, 이름순)."""
+    result_dir = get_context().experiments_dir / prompt_name
+    if not result_dir.exists():
+        return []
+    return sorted(p for p in result_dir.glob("*.json") if p.name != "latest.json")
+
+
+def rescore_rule_checks(prompt_name: str, experiment_result: dict) -> dict:
+    """저장된 실험 출력에 현재 expected.json/config.yaml로 rule-based 검사를 다시 실행.
+
+    LLM 백엔드/Judge 호출 없이 rule-based 점수만 교체한 뒤 rescore_experiment로
+    overall_score/passed/summary를 다시 계산한다. expected.json에 없는 케이스는
+    기존 점수를 유지한다.
+
+    llm_judge depends_on도 다시 판정한다. 선행 검사가 이제 실패하는 케이스의 Judge 점수는
+    skipped로 바꾸고, 이제 통과하지만 Judge 점수가 skipped/없는 케이스는 점수를 채우지 않고
+    needs_judge로 보고한다 (experiment 재실행 필요).
+
+    Args:
+        prompt_name: 프롬프트 이름
+        experiment_result: 실험 결과 (results[].output, scores 포함)
+
+    Returns:
+        rule-based 점수와 판정이 갱신된 새 실험 결과 딕셔너리
+        (rescored: {"checks", "cases", "missing_cases", "newly_skipped", "needs_judge",
+        "rescored_at"} 포함, needs_judge는 [{"case_id", "criteria"}])
+    """
+    from prompt_evaluator.evaluators.dependencies import (
+        get_failed_checks,
+        get_judge_dependencies,
+    )
+    from prompt_evaluator.evaluators.rule_based import (
+        get_rule_checks,
+        run_rule_evaluators_batch,
+    )
+
+    ctx = get_context()
+    config_file = ctx.targets_dir / prompt_name / "config.yaml"
+    expected_file = ctx.datasets_dir / prompt_name / "expected.json"
+    for path in (config_file, expected_file):
+        if not path.exists():
+            raise FileNotFoundError(f"파일 없음: {path}")
+    with open(config_file, "r", encoding="utf-8") as f:
+        eval_config = yaml.safe_load(f)
+    with open(expected_file, "r", encoding="utf-8") as f:
+        expected_all = json.load(f)
+
+    judge_config = next(
+        (
+            evaluator
+            for evaluator in eval_config.get("evaluators", [])
+            if evaluator.get("type") == "llm_judge"
+        ),
+        None,
+    )
+    depends_on = get_judge_dependencies(judge_config)
+    judge_names = [
+        f"{JUDGE_SCORE_PREFIX}{criterion}"
+        for criterion in (judge_config or {}).get("criteria", [])
+    ]
+
+    results = experiment_result.get("results", [])
+    indices = [i for i, r in enumerate(results) if r.get("case_id") in expected_all]
+    checks = get_rule_checks(eval_config)
+    batch = run_rule_evaluators_batch(
+        [results[i].get("output", "") for i in indices],
+        [expected_all[results[i]["case_id"]] for i in indices],
+        checks + [name for name in depends_on if name not in checks],
+        eval_config,
+    )
+
+    updated = list(results)
+    newly_skipped, needs_judge = [], []
+    for i, rule_scores, details in zip(indices, batch.score_dicts(), batch.details):
+        scores = {
+            name: value
+            for name, value in results[i].get("scores", {}).items()
+            if name not in checks
+        }
+        scores.update(
+            {name: value for name, value in rule_scores.items() if name in checks}
+        )
+        case_id = results[i]["case_id"]
+        if depends_on and judge_names:
+            failed = get_failed_checks(
+                {name: details[name] for name in depends_on if name in details}
+            )
+            if failed:
+                if any(scores.get(name) != SKIPPED for name in judge_names):
+                    newly_skipped.append(case_id)
+                scores.update({name: SKIPPED for name in judge_names})
+            else:
+                pending = [
+                    name.removeprefix(JUDGE_SCORE_PREFIX)
+                    for name in judge_names
+                    if scores.get(name) in (None, SKIPPED)
+                ]
+                if pending:
+                    needs_judge.append({"case_id": case_id, "criteria": pending})
+        updated[i] = {**results[i], "scores": scores}
+
+    rescored = rescore_experiment(
+        {**experiment_result, "results": updated},
+        ScoringPolicy.from_config(eval_config),
+    )
+    rescored["rescored"] = {
+        "checks": checks,
+        "cases": len(indices),
+        "missing_cases": [
+            r.get("case_id", "") for r in results if r.get("case_id") not in expected_all
+        ],
+        "newly_skipped": newly_skipped,
+        "needs_judge": needs_judge,
+        "rescored_at": datetime.now().isoformat(),
+    }
+    return rescored
+
+
+def _get_score_value(score):
+    """Langfuse score에서 값 추출 (CATEGORICAL은 문자열 값, 예: skipped)."""
+    if getattr(score, "data_type", None) == "CATEGORICAL":
+        return getattr(score, "string_value", None) or score.value
+    return score.value
 
 
 def normalize_experiment_to_baseline(experiment_result: dict) -> dict:
@@ -0,0 +1,281 @@
+"""Judge drift 카나리아 모듈
+
+고정된 (출력, 평가 기준) 쌍으로 이루어진 작은 카나리아 세트를 full 실행마다 다시 채점하여,
+로컬에 캐시된 기준 점수와 비교합니다. Judge 모델의 조용한 동작 변화로 인한 점수 변동을
+프롬프트 변경에 의한 회귀와 구분하기 위한 장치입니다.
+
+- 카나리아 세트: eval_prompts/canary.json
+    [{"id", "criterion", "output", "input"?: dict, "prompt"?: str}, ...]
+- 기준 점수: results/canary/reference.json (Judge 모델별)
+    기준 점수가 없거나 케이스(출력/기준 파일)가 바뀐 경우 이번 점수를 기준으로 기록
+- 실험 실행과 병렬로 백그라운드 스레드에서 채점하고, 실험 종료 후 drift를 보고
+- --canary-block이면 Judge 평가자가 호출 전에 카나리아 결과를 확인하여(JudgeCanaryGate)
+  drift가 임계값을 넘은 실행에서는 Judge를 호출하지 않음
+- 카나리아 Judge 토큰은 실험 judge_usage와 따로 집계 (report["judge_usage"])
+"""
+
+import hashlib
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import logging
+
+from prompt_evaluator.config import (
+    CANARY_MAX_CASES,
+    CANARY_MAX_WORKERS,
+    DEFAULT_CANARY_DRIFT_THRESHOLD,
+)
+from prompt_evaluator.context import get_context
+
+logger = logging.getLogger(__name__)
+
+# 카나리아 Judge 호출의 사용량 집계 범위 (llm_judge.judge_usage_scope)
+CANARY_USAGE_SCOPE = "canary"
+
+
+class JudgeDriftError(RuntimeError):
+    """카나리아 drift가 임계값을 넘어 실행을 차단한 경우."""
+
+    def __init__(self, report: dict):
+        self.report = report
+        super().__init__(
+            f"Judge drift {report['max_drift']:.3f} > 임계값 {report['threshold']:.3f} "
+            f"(drift 케이스: {report['drifted']})"
+        )
+
+
+def get_canary_path() -> Path:
+    return get_context().eval_prompts_dir / "canary.json"
+
+
+def get_reference_path() -> Path:
+    return get_context().results_dir / "canary" / "reference.json"
+
+
+def load_canary_cases(path: str | Path | None = None) -> list[dict]:
+    """카나리아 세트 로드 (파일이 없으면 빈 리스트)."""
+    path = Path(path) if path else get_canary_path()
+    if not path.exists():
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    if len(cases) > CANARY_MAX_CASES:
+        logger.warning(
+            f"  ⚠ 카나리아 케이스 {len(cases)}개 → 앞의 {CANARY_MAX_CASES}개만 사용"
+        )
+    return cases[:CANARY_MAX_CASES]
+
+
+def canary_fingerprint(case: dict) -> str:
+    """케이스 내용 + 평가 기준 파일 내용 해시 (바뀌면 기준 점수를 새로 기록)."""
+    criterion_file = get_context().eval_prompts_dir / f"{case['criterion']}.txt"
+    criterion_text = (
+        criterion_file.read_text(encoding="utf-8") if criterion_file.exists() else ""
+    )
+    payload = json.dumps(
+        [
+            case.get("output", ""),
+            case.get("input", {}),
+            case.get("prompt", ""),
+            criterion_text,
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def judge_model_id(llm=None) -> str:
+    from prompt_evaluator.models import get_judge_llm
+
+    llm = llm or get_judge_llm()
+    return str(getattr(llm, "model_name", None) or getattr(llm, "model", "judge"))
+
+
+def score_canary_cases(
+    cases: list[dict], llm=None, max_workers: int = CANARY_MAX_WORKERS
+) -> dict[str, float | None]:
+    """카나리아 케이스를 병렬로 채점.
+
+    Returns:
+        {case_id: score} (Judge 실패 시 None)
+    """
+    from prompt_evaluator.evaluators.llm_judge import (
+        judge_usage_scope,
+        run_checklist_evaluation,
+    )
+
+    def score(case: dict) -> float | None:
+        with judge_usage_scope(CANARY_USAGE_SCOPE):
+            result = run_checklist_evaluation(
+                output=case.get("output", ""),
+                inputs=case.get("input", {}),
+                prompt_template=case.get("prompt", ""),
+                criteria=[case["criterion"]],
+                llm=llm,
+            )
+        return result.get(case["criterion"], {}).get("score")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return dict(zip((c["id"] for c in cases), executor.map(score, cases)))
+
+
+def load_reference_scores(model: str) -> dict[str, dict]:
+    path = get_reference_path()
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get(model, {})
+
+
+def save_reference_scores(model: str, references: dict[str, dict]) -> Path:
+    path = get_reference_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    data[model] = references
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def check_judge_drift(
+    threshold: float = DEFAULT_CANARY_DRIFT_THRESHOLD,
+    refresh: bool = False,
+    llm=None,
+) -> dict[str, Any] | None:
+    """카나리아 세트를 다시 채점하고 기준 점수 대비 drift 계산.
+
+    Args:
+        threshold: 케이스별 허용 drift (|점수 - 기준 점수|)
+        refresh: True면 비교 없이 이번 점수를 기준으로 다시 기록
+        llm: Judge LLM (None이면 기본 Judge)
+
+    Returns:
+        카나리아 세트가 없으면 None, 있으면
+        {"model", "threshold", "cases": [{"id", "criterion", "score", "reference", "drift"}],
+         "compared", "recorded", "mean_drift", "max_drift", "drifted", "exceeded", "judge_usage"}
+    """
+    from prompt_evaluator.evaluators.llm_judge import get_judge_usage
+
+    cases = load_canary_cases()
+    if not cases:
+        return None
+
+    model = judge_model_id(llm)
+    scores = score_canary_cases(cases, llm=llm)
+    references = {} if refresh else load_reference_scores(model)
+
+    rows = []
+    updated = dict(references)
+    recorded = 0
+    for case in cases:
+        fingerprint = canary_fingerprint(case)
+        score = scores.get(case["id"])
+        ref = references.get(case["id"])
+        row = {"id": case["id"], "criterion": case["criterion"], "score": score}
+        if ref and ref["fingerprint"] == fingerprint and score is not None:
+            row["reference"] = ref["score"]
+            row["drift"] = abs(score - ref["score"])
+        elif score is not None:
+            updated[case["id"]] = {"fingerprint": fingerprint, "score": score}
+            recorded += 1
+        rows.append(row)
+
+    if recorded:
+        save_reference_scores(model, updated)
+
+    drifts = [row["drift"] for row in rows if "drift" in row]
+    drifted = [row["id"] for row in rows if row.get("drift", 0.0) > threshold]
+    return {
+        "model": model,
+        "threshold": threshold,
+        "cases": rows,
+        "compared": len(drifts),
+        "recorded": recorded,
+        "mean_drift": sum(drifts) / len(drifts) if drifts else 0.0,
+        "max_drift": max(drifts) if drifts else 0.0,
+        "drifted": drifted,
+        "exceeded": bool(drifted),
+        "judge_usage": get_judge_usage(CANARY_USAGE_SCOPE),
+    }
+
+
+def start_judge_canary(
+    threshold: float = DEFAULT_CANARY_DRIFT_THRESHOLD,
+    refresh: bool = False,
+) -> Future | None:
+    """실험 실행과 병렬로 카나리아 채점을 백그라운드에서 시작 (세트가 없으면 None)."""
+    if not get_canary_path().exists():
+        return None
+    logger.info("  Judge 카나리아 채점 시작 (백그라운드)")
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="judge-canary")
+    future = executor.submit(check_judge_drift, threshold, refresh)
+    executor.shutdown(wait=False)
+    return future
+
+
+class JudgeCanaryGate:
+    """--canary-block 실행에서 Judge 평가자가 호출 전에 확인하는 drift 게이트.
+
+    처음 확인할 때 카나리아 채점이 끝나기를 기다리고(이후에는 즉시 반환),
+    drift가 임계값을 넘었으면 Judge를 호출하지 않게 하여 차단될 실행의 Judge 비용을 막는다.
+
+    Args:
+        future: start_judge_canary() 결과 (None이면 항상 통과)
+    """
+
+    def __init__(self, future: Future | None):
+        self._future = future
+
+    def drift_exceeded(self) -> bool:
+        if self._future is None:
+            return False
+        try:
+            report = self._future.result()
+        except Exception:
+            return False  # 실패는 finish_judge_canary에서 보고
+        return bool(report and report["exceeded"])
+
+
+def finish_judge_canary(future: Future | None, block: bool = False) -> dict | None:
+    """카나리아 결과를 기다려 drift를 보고.
+
+    Raises:
+        JudgeDriftError: block=True이고 drift가 임계값을 넘은 경우
+    """
+    if future is None:
+        return None
+    try:
+        report = future.result()
+    except Exception as e:
+        logger.warning(f"  ⚠ Judge 카나리아 실패: {e}")
+        return None
+    if report is None:
+        return None
+
+    if report["compared"]:
+        logger.info(
+            f"  Judge 카나리아: {report['compared']}개 비교, "
+            f"평균 drift {report['mean_drift']:.3f} / 최대 {report['max_drift']:.3f}"
+        )
+    if report["recorded"]:
+        logger.info(f"  Judge 카나리아 기준 점수 기록: {report['recorded']}개")
+    usage = report.get("judge_usage") or {}
+    if usage.get("calls"):
+        logger.info(
+            f"  Judge 카나리아 사용량 (실험과 별도): {usage['calls']}회, "
+            f"입력 {usage['input_tokens']:,} / 출력 {usage['output_tokens']:,} 토큰"
+        )
+    if report["exceeded"]:
+        logger.warning(
+            f"  ⚠ Judge drift 임계값({report['threshold']}) 초과: {report['drifted']} "
+            "→ 점수 변화가 프롬프트가 아닌 Judge 때문일 수 있습니다."
+        )
+        if block:
+            raise JudgeDriftError(report)
+    return report
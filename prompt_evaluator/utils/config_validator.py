@@ -3,11 +3,18 @@
 config yaml 파일의 유효성을 검증합니다.
 """
 
+import json
 from pathlib import Path
 from typing import NamedTuple
 
 import yaml
 
+from prompt_evaluator.evaluators.keyword_matcher import MATCH_MODES
+from prompt_evaluator.evaluators.llm_judge import JUDGE_MODES, parse_criterion_file
+from prompt_evaluator.evaluators.normalization import NORMALIZATION_STEPS
+from prompt_evaluator.evaluators.registry import EVALUATOR_TYPES, available_rule_checks
+from prompt_evaluator.evaluators.scoring import REFERENCE_SCORE_NAMES, SANITY_CHECKS
+from prompt_evaluator.evaluators.rule_based import STRING_SIMILARITY_METHODS
 from prompt_evaluator.loaders import SUPPORTED_EXTENSIONS
 
 
@@ -25,7 +32,6 @@ REQUIRED_FIELDS = ["name", "evaluators"]
 # 허용 값
 VALID_OUTPUT_FORMATS = ["text", "json"]
 VALID_RUN_MODES = ["quick", "full"]
-VALID_EVALUATOR_TYPES = ["rule_based", "llm_judge"]
 
 
 def validate_config(
@@ -129,14 +135,271 @@ def validate_config(
                 criterion_file = eval_prompts_dir / f"{criterion}.txt"
                 if not criterion_file.exists():
                     warnings.append(f"eval_prompt 파일 없음: {criterion_file}")
+                    continue
+                errors.extend(_validate_criterion_front_matter(criterion_file))
 
     # 8. evaluators 구조 확인
     for i, evaluator in enumerate(config.get("evaluators", [])):
         eval_type = evaluator.get("type")
         if not eval_type:
             errors.append(f"evaluators[{i}]: type 필드 누락")
-        elif eval_type not in VALID_EVALUATOR_TYPES:
-            errors.append(f"evaluators[{i}]: 잘못된 type '{eval_type}'")
+        elif eval_type not in EVALUATOR_TYPES:
+            errors.append(
+                f"evaluators[{i}]: 잘못된 type '{eval_type}' (허용: {EVALUATOR_TYPES}, "
+                "사용자 정의 검사는 rule_based checks에 등록)"
+            )
+        elif eval_type == "rule_based":
+            checks = evaluator.get("checks") or []
+            unknown = [c for c in checks if c not in available_rule_checks()]
+            if unknown:
+                errors.append(
+                    f"evaluators[{i}]: checks에 알 수 없는 검사 {unknown} "
+                    f"(허용: {available_rule_checks()})"
+                )
+
+    # 9. llm_judge depends_on 확인 (sanity 검사만 허용: 실패 시 케이스가 이미 실패 처리되는 검사)
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "llm_judge":
+            continue
+        depends_on = evaluator.get("depends_on")
+        if depends_on is None:
+            continue
+        if not isinstance(depends_on, list):
+            errors.append(f"evaluators[{i}]: depends_on은 리스트여야 합니다.")
+            continue
+        for dep in depends_on:
+            if dep not in SANITY_CHECKS:
+                errors.append(
+                    f"evaluators[{i}]: depends_on에는 sanity 검사만 지정할 수 있습니다: '{dep}' "
+                    f"(허용: {list(SANITY_CHECKS)})"
+                )
+
+    # 10. llm_judge criterion_options 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "llm_judge":
+            continue
+        criterion_options = evaluator.get("criterion_options")
+        if criterion_options is None:
+            continue
+        if not isinstance(criterion_options, dict):
+            errors.append(f"evaluators[{i}]: criterion_options는 dict여야 합니다.")
+            continue
+        criteria = evaluator.get("criteria", [])
+        for criterion, options in criterion_options.items():
+            if criterion not in criteria:
+                warnings.append(
+                    f"evaluators[{i}]: criterion_options의 '{criterion}'이 criteria에 없음"
+                )
+            samples = (options or {}).get("samples", 1)
+            if not isinstance(samples, int) or samples < 1:
+                errors.append(
+                    f"evaluators[{i}]: '{criterion}' samples는 1 이상의 정수여야 합니다."
+                )
+            mode = (options or {}).get("mode", "json")
+            if mode not in JUDGE_MODES:
+                errors.append(
+                    f"evaluators[{i}]: '{criterion}' mode '{mode}' (허용: {JUDGE_MODES})"
+                )
+            elif mode == "logprob" and isinstance(samples, int) and samples > 1:
+                warnings.append(
+                    f"evaluators[{i}]: '{criterion}' logprob 모드에서는 samples가 무시됩니다."
+                )
+
+    # 11. semantic_similarity / criteria_reference threshold 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") not in ("semantic_similarity", "criteria_reference"):
+            continue
+        threshold = evaluator.get("threshold")
+        if threshold is not None and (
+            not isinstance(threshold, (int, float)) or not 0.0 <= threshold <= 1.0
+        ):
+            errors.append(f"evaluators[{i}]: threshold는 0~1 사이 숫자여야 합니다.")
+
+    # 12. thresholds / weights 확인
+    thresholds = config.get("thresholds") or {}
+    if not isinstance(thresholds, dict):
+        errors.append("thresholds는 dict여야 합니다.")
+        thresholds = {}
+    for key in ("pass_rate", "min_score", "keyword"):
+        value = thresholds.get(key)
+        if value is not None and (
+            not isinstance(value, (int, float)) or not 0.0 <= value <= 1.0
+        ):
+            errors.append(f"thresholds.{key}는 0~1 사이 숫자여야 합니다.")
+    weights = config.get("weights") or {}
+    if not isinstance(weights, dict):
+        errors.append("weights는 dict여야 합니다.")
+        weights = {}
+    judge_criteria = [
+        criterion
+        for evaluator in config.get("evaluators", [])
+        if evaluator.get("type") == "llm_judge"
+        for criterion in evaluator.get("criteria", [])
+    ]
+    for criterion, weight in weights.items():
+        if not isinstance(weight, (int, float)) or weight < 0:
+            errors.append(f"weights의 '{criterion}'은 0 이상의 숫자여야 합니다.")
+        if criterion in REFERENCE_SCORE_NAMES:
+            continue
+        if criterion.removeprefix("llm_judge_") not in judge_criteria:
+            warnings.append(f"weights의 '{criterion}'이 llm_judge criteria에 없음")
+
+    # 13. rule_based string_similarity 옵션 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        options = evaluator.get("string_similarity")
+        if options is None:
+            continue
+        if not isinstance(options, dict):
+            errors.append(f"evaluators[{i}]: string_similarity는 dict여야 합니다.")
+            continue
+        method = options.get("method", "edit_distance")
+        if method not in STRING_SIMILARITY_METHODS:
+            errors.append(
+                f"evaluators[{i}]: string_similarity method '{method}' "
+                f"(허용: {STRING_SIMILARITY_METHODS})"
+            )
+        unknown = set(options) - {"method", "threshold", "decompose_hangul"}
+        if unknown:
+            warnings.append(
+                f"evaluators[{i}]: string_similarity에 알 수 없는 옵션 {sorted(unknown)}"
+            )
+
+    # 14. rule_based normalize 단계 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        steps = evaluator.get("normalize")
+        if steps is None:
+            continue
+        if not isinstance(steps, list):
+            errors.append(f"evaluators[{i}]: normalize는 리스트여야 합니다.")
+            continue
+        unknown = [step for step in steps if step not in NORMALIZATION_STEPS]
+        if unknown:
+            errors.append(
+                f"evaluators[{i}]: normalize에 알 수 없는 단계 {unknown} "
+                f"(허용: {NORMALIZATION_STEPS})"
+            )
+
+    # 15. rule_based match 방식 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        match = evaluator.get("match")
+        if match is not None and match not in MATCH_MODES:
+            errors.append(
+                f"evaluators[{i}]: match '{match}' (허용: {MATCH_MODES})"
+            )
+
+    # 16. rule_based schema_compliance 옵션 확인
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        if "schema_compliance" not in evaluator.get("checks", []):
+            continue
+        options = evaluator.get("schema_compliance")
+        if not isinstance(options, dict) or not isinstance(
+            options.get("schema"), (str, dict)
+        ):
+            errors.append(
+                f"evaluators[{i}]: schema_compliance.schema (클래스명/타입 표현식 또는 "
+                "필드 → 타입 dict)가 필요합니다."
+            )
+            continue
+        unknown = set(options) - {"schema", "strict"}
+        if unknown:
+            warnings.append(
+                f"evaluators[{i}]: schema_compliance에 알 수 없는 옵션 {sorted(unknown)}"
+            )
+        if not (targets_dir / prompt_name / "schemas.py").exists():
+            errors.append(
+                f"evaluators[{i}]: schema_compliance용 schemas.py 없음: "
+                f"{targets_dir / prompt_name / 'schemas.py'}"
+            )
+
+    # 17. rule_based pattern 규칙 확인 (config.yaml + expected.json 케이스별 patterns)
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        if "pattern" not in evaluator.get("checks", []):
+            continue
+        from prompt_evaluator.evaluators.pattern import PATTERN_RULE_KINDS
+
+        options = evaluator.get("pattern") or {}
+        errors.extend(_validate_pattern_spec(options, f"evaluators[{i}].pattern"))
+        unknown = set(options) - set(PATTERN_RULE_KINDS) - {"ignore_case"}
+        if unknown:
+            warnings.append(
+                f"evaluators[{i}]: pattern에 알 수 없는 옵션 {sorted(unknown)}"
+            )
+        expected_file = datasets_dir / prompt_name / "expected.json"
+        if expected_file.exists():
+            with open(expected_file, "r", encoding="utf-8") as f:
+                expected_all = json.load(f)
+            for case_id, expected in expected_all.items():
+                if isinstance(expected, dict) and expected.get("patterns"):
+                    errors.extend(
+                        _validate_pattern_spec(
+                            expected["patterns"], f"expected.json[{case_id}].patterns"
+                        )
+                    )
+
+    # 18. rule_based json_assertions 확인 (config.yaml + expected.json 케이스별 assertions)
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        if "json_assertions" not in evaluator.get("checks", []):
+            continue
+        errors.extend(
+            _validate_json_assertions(
+                evaluator.get("json_assertions") or [], f"evaluators[{i}].json_assertions"
+            )
+        )
+        expected_file = datasets_dir / prompt_name / "expected.json"
+        if expected_file.exists():
+            with open(expected_file, "r", encoding="utf-8") as f:
+                expected_all = json.load(f)
+            for case_id, expected in expected_all.items():
+                if isinstance(expected, dict) and expected.get("assertions"):
+                    errors.extend(
+                        _validate_json_assertions(
+                            expected["assertions"], f"expected.json[{case_id}].assertions"
+                        )
+                    )
+
+    # 19. rule_based markdown_structure 규칙 확인 (config.yaml + expected.json 케이스별 structure)
+    for i, evaluator in enumerate(config.get("evaluators", [])):
+        if evaluator.get("type") != "rule_based":
+            continue
+        if "markdown_structure" not in evaluator.get("checks", []):
+            continue
+        errors.extend(
+            _validate_structure_spec(
+                evaluator.get("markdown_structure") or {},
+                f"evaluators[{i}].markdown_structure",
+            )
+        )
+        expected_file = datasets_dir / prompt_name / "expected.json"
+        if expected_file.exists():
+            with open(expected_file, "r", encoding="utf-8") as f:
+                expected_all = json.load(f)
+            for case_id, expected in expected_all.items():
+                if isinstance(expected, dict) and expected.get("structure"):
+                    errors.extend(
+                        _validate_structure_spec(
+                            expected["structure"], f"expected.json[{case_id}].structure"
+                        )
+                    )
+
+    # 20. pairwise 설정 확인 (compare 명령어)
+    pairwise = config.get("pairwise")
+    if pairwise is not None:
+        if not isinstance(pairwise, dict):
+            errors.append("pairwise는 dict여야 합니다.")
+        elif not isinstance(pairwise.get("criteria", ""), str):
+            errors.append("pairwise.criteria는 문자열이어야 합니다.")
 
     valid = len(errors) == 0
     return ValidationResult(valid=valid, errors=errors, warnings=warnings)
@@ -179,3 +442,124 @@ def validate_all_configs(
         results[prompt_name] = result
 
     return results
+
+
+def _validate_pattern_spec(spec: dict, where: str) -> list[str]:
+    """pattern 규칙 선언(required/forbidden/count) 검증 (정규식 컴파일 포함)."""
+    from prompt_evaluator.evaluators.pattern import compile_pattern
+
+    if not isinstance(spec, dict):
+        return [f"{where}는 dict여야 합니다."]
+    errors = []
+    regexes = list(spec.get("required") or []) + list(spec.get("forbidden") or [])
+    for item in spec.get("count") or []:
+        if not isinstance(item, dict) or "regex" not in item:
+            errors.append(f"{where}.count 항목에 regex가 필요합니다: {item}")
+            continue
+        low, high = item.get("min", 0), item.get("max")
+        if high is not None and low > high:
+            errors.append(f"{where}.count '{item['regex']}': min({low}) > max({high})")
+        regexes.append(item["regex"])
+    for regex in regexes:
+        try:
+            compile_pattern(regex)
+        except ValueError as e:
+            errors.append(f"{where}: {e}")
+    return errors
+
+
+def _validate_structure_spec(spec: dict, where: str) -> list[str]:
+    """markdown_structure 규칙 선언 검증 (옵션 이름, 섹션 스타일, 개수 범위)."""
+    from prompt_evaluator.evaluators.markdown_structure import (
+        SECTION_STYLES,
+        STRUCTURE_OPTIONS,
+    )
+
+    if not isinstance(spec, dict):
+        return [f"{where}는 dict여야 합니다."]
+    errors = []
+    unknown = set(spec) - set(STRUCTURE_OPTIONS)
+    if unknown:
+        errors.append(f"{where}: 알 수 없는 옵션 {sorted(unknown)} (허용: {STRUCTURE_OPTIONS})")
+    for key in ("headers", "required_sections", "forbidden_sections"):
+        value = spec.get(key)
+        if value is not None and not (
+            isinstance(value, list) and all(isinstance(v, str) for v in value)
+        ):
+            errors.append(f"{where}.{key}는 문자열 리스트여야 합니다.")
+    for key in ("sections", "bullets"):
+        value = spec.get(key)
+        if value is None:
+            continue
+        if not isinstance(value, dict):
+            errors.append(f"{where}.{key}는 dict여야 합니다.")
+            continue
+        low, high = value.get("min", 0), value.get("max")
+        if not isinstance(low, int) or (high is not None and not isinstance(high, int)):
+            errors.append(f"{where}.{key}: min/max는 정수여야 합니다.")
+        elif high is not None and low > high:
+            errors.append(f"{where}.{key}: min({low}) > max({high})")
+    sections = spec.get("sections")
+    style = sections.get("style", "numbered") if isinstance(sections, dict) else "numbered"
+    if style not in SECTION_STYLES:
+        errors.append(f"{where}.sections.style: '{style}' (허용: {SECTION_STYLES})")
+    return errors
+
+
+def _validate_json_assertions(assertions: list, where: str) -> list[str]:
+    """json_assertions 선언 검증 (경로 문법, 조건 이름, type 값)."""
+    from prompt_evaluator.evaluators.json_assertions import (
+        JSON_ASSERTION_MODIFIERS,
+        JSON_ASSERTION_OPS,
+        JSON_TYPES,
+        compile_path,
+    )
+
+    if not isinstance(assertions, list):
+        return [f"{where}는 리스트여야 합니다."]
+    errors = []
+    for j, assertion in enumerate(assertions):
+        if not isinstance(assertion, dict) or "path" not in assertion:
+            errors.append(f"{where}[{j}]: path가 필요합니다.")
+            continue
+        try:
+            compile_path(assertion["path"])
+        except ValueError as e:
+            errors.append(f"{where}[{j}]: {e}")
+        ops = set(assertion) - {"path"} - set(JSON_ASSERTION_MODIFIERS)
+        unknown = ops - set(JSON_ASSERTION_OPS)
+        if unknown:
+            errors.append(
+                f"{where}[{j}]: 알 수 없는 조건 {sorted(unknown)} (허용: {JSON_ASSERTION_OPS})"
+            )
+        elif not ops:
+            errors.append(f"{where}[{j}]: 조건이 없습니다 (허용: {JSON_ASSERTION_OPS})")
+        if "type" in assertion and assertion["type"] not in JSON_TYPES:
+            errors.append(
+                f"{where}[{j}]: 알 수 없는 type '{assertion['type']}' (허용: {list(JSON_TYPES)})"
+            )
+    return errors
+
+
+def _validate_criterion_front_matter(criterion_file: Path) -> list[str]:
+    """평가 프롬프트 front matter (inputs, prompt) 검증."""
+    try:
+        meta, _ = parse_criterion_file(criterion_file.read_text(encoding="utf-8"))
+    except (ValueError, yaml.YAMLError) as e:
+        return [f"{criterion_file}: front matter 오류: {e}"]
+
+    errors = []
+    inputs = meta.get("inputs", "all")
+    if not (
+        isinstance(inputs, str)
+        or (isinstance(inputs, list) and all(isinstance(k, str) for k in inputs))
+    ):
+        errors.append(
+            f"{criterion_file}: inputs는 all, none 또는 필드 이름 목록이어야 합니다."
+        )
+    if not isinstance(meta.get("prompt", True), bool):
+        errors.append(f"{criterion_file}: prompt는 true/false여야 합니다.")
+    unknown = set(meta) - {"inputs", "prompt"}
+    if unknown:
+        errors.append(f"{criterion_file}: 알 수 없는 front matter 키 {sorted(unknown)}")
+    return errors
@@ -0,0 +1,250 @@
+"""OpenAI 호환 stand-in 서버 (오프라인 Judge/실행 경로 점검용).
+
+표준 라이브러리만으로 /v1/chat/completions, /v1/embeddings를 흉내 낸다.
+응답은 요청 내용 해시로 결정되는 결정적(deterministic) 값이라 같은 요청에는 항상 같은 응답을 준다.
+
+- response_format (json_schema): 스키마를 만족하는 JSON 생성 (체크리스트 0/1, pairwise winner 등)
+- logprobs: 체크리스트 항목 수만큼 0/1 토큰과 top_logprobs 반환 (logprob 모드)
+- 그 외: 마지막 user 메시지를 요약한 텍스트 반환 (프롬프트 실행 역할)
+
+사용법:
+    python -m prompt_evaluator.utils.stub_server --port 8089 --latency-ms 20
+
+    JUDGE_BASE_URL=http://127.0.0.1:8089/v1 EXECUTION_BASE_URL=http://127.0.0.1:8089/v1 \\
+        prompt-eval experiment --name {name} --backend langfuse
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+STUB_EMBEDDING_DIM = 64
+STUB_PASS_RATE = 0.8  # 체크리스트 항목이 1(pass)로 생성될 확률
+
+# build_logprob_instruction의 "## Checklist Items" 목록
+_CHECKLIST_ITEM_RE = re.compile(r"^\d+\. \S+", re.MULTILINE)
+
+
+def _seed(payload: Any) -> int:
+    digest = hashlib.sha256(
+        json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _count_tokens(text: str) -> int:
+    """토큰 수 근사 (문자 4개당 1토큰)."""
+    return max(1, len(text) // 4)
+
+
+def fake_from_schema(schema: dict, rng: random.Random) -> Any:
+    """JSON Schema를 만족하는 결정적 값 생성."""
+    if "enum" in schema:
+        values = schema["enum"]
+        if values == [0, 1]:
+            return 1 if rng.random() < STUB_PASS_RATE else 0
+        return rng.choice(values)
+
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            key: fake_from_schema(sub, rng)
+            for key, sub in (schema.get("properties") or {}).items()
+        }
+    if kind == "array":
+        return []
+    if kind == "integer":
+        return rng.randint(0, 1)
+    if kind == "number":
+        return round(rng.random(), 2)
+    if kind == "boolean":
+        return rng.random() < 0.5
+    return "stub feedback"
+
+
+def build_chat_completion(request: dict) -> dict:
+    """chat.completions 요청에 대한 응답 본문 생성."""
+    messages = request.get("messages") or []
+    rng = random.Random(_seed(messages))
+    last_user = next(
+        (m.get("content", "") for m in reversed(messages) if m.get("role") == "user"),
+        "",
+    )
+    if isinstance(last_user, list):
+        last_user = " ".join(part.get("text", "") for part in last_user)
+
+    logprobs = None
+    response_format = request.get("response_format") or {}
+    if request.get("logprobs"):
+        n_items = len(_CHECKLIST_ITEM_RE.findall(last_user)) or 1
+        top_k = int(request.get("top_logprobs") or 0)
+        tokens, entries = [], []
+        for _ in range(n_items):
+            p_one = rng.uniform(0.05, 0.95)
+            digit = "1" if p_one >= 0.5 else "0"
+            candidates = [
+                {"token": "1", "logprob": math.log(p_one)},
+                {"token": "0", "logprob": math.log(1 - p_one)},
+            ]
+            candidates.sort(key=lambda c: -c["logprob"])
+            entries.append(
+                {
+                    "token": digit,
+                    "logprob": candidates[0]["logprob"],
+                    "top_logprobs": candidates[:top_k],
+                }
+            )
+            entries.append({"token": "\n", "logprob": 0.0, "top_logprobs": []})
+            tokens.append(digit)
+        content = "\n".join(tokens)
+        logprobs = {"content": entries[:-1]}
+    elif response_format.get("type") == "json_schema":
+        schema = response_format["json_schema"].get("schema") or {}
+        content = json.dumps(fake_from_schema(schema, rng), ensure_ascii=False)
+    elif response_format.get("type") == "json_object":
+        content = json.dumps({"output": "stub"}, ensure_ascii=False)
+    else:
+        content = f"[stub] {last_user[:200]}"
+
+    prompt_tokens = sum(_count_tokens(str(m.get("content", ""))) for m in messages)
+    completion_tokens = _count_tokens(content)
+    return {
+        "id": f"chatcmpl-stub-{rng.getrandbits(32):08x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "stub"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "logprobs": logprobs,
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": 0},
+        },
+    }
+
+
+def build_embeddings(request: dict) -> dict:
+    """embeddings 요청에 대한 응답 본문 생성 (텍스트 해시 기반 결정적 벡터)."""
+    inputs = request.get("input")
+    if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+        inputs = [inputs]
+    data = []
+    for index, text in enumerate(inputs or []):
+        rng = random.Random(_seed(text))
+        data.append(
+            {
+                "object": "embedding",
+                "index": index,
+                "embedding": [rng.gauss(0, 1) for _ in range(STUB_EMBEDDING_DIM)],
+            }
+        )
+    tokens = sum(_count_tokens(str(text)) for text in inputs or [])
+    return {
+        "object": "list",
+        "data": data,
+        "model": request.get("model", "stub"),
+        "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """OpenAI 호환 엔드포인트 핸들러."""
+
+    latency: float = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send(400, {"error": {"message": "invalid JSON body"}})
+            return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        path = self.path.rstrip("/")
+        if path.endswith("/chat/completions"):
+            self._send(200, build_chat_completion(request))
+        elif path.endswith("/embeddings"):
+            self._send(200, build_embeddings(request))
+        else:
+            self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._send(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+        else:
+            self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def _send(self, status: int, body: dict):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def start_stub_server(
+    host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0
+) -> tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드로 stand-in 서버 시작.
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 빈 포트 자동 할당)
+        latency_ms: 요청당 인위적 지연 (처리량 측정용)
+
+    Returns:
+        (서버 인스턴스, base_url). 종료는 server.shutdown()
+    """
+    handler = type("Handler", (StubHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}/v1"
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 stand-in 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    handler = type("Handler", (StubHandler,), {"latency": args.latency_ms / 1000})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"stub server: http://{args.host}:{server.server_address[1]}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
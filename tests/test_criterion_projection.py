@@ -0,0 +1,61 @@
+"""평가 기준 front matter 입력 투영 테스트 (실제 기준 파일 기준)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from prompt_evaluator.evaluators.llm_judge import (
+    _project_judge_context,
+    build_judge_messages,
+    parse_criterion_file,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+CRITERION_FILES = [
+    ROOT / "eval_prompts" / "general" / "output_quality.txt",
+    ROOT
+    / "prompt_evaluator"
+    / "evaluators"
+    / "eval_prompts"
+    / "general"
+    / "output_quality.txt",
+]
+
+
+def _judge_text(template, prompt_template, criterion_input, output, include_prompt):
+    messages = build_judge_messages(
+        template,
+        prompt_template,
+        criterion_input,
+        output,
+        include_prompt=include_prompt,
+    )
+    return "".join(content for _, content in messages)
+
+
+@pytest.mark.parametrize(
+    "criterion_file", CRITERION_FILES, ids=lambda p: str(p.relative_to(ROOT))
+)
+def test_output_quality_projects_smaller_input(criterion_file):
+    meta, template = parse_criterion_file(criterion_file.read_text(encoding="utf-8"))
+    assert meta.get("inputs") == "none"
+
+    cases_file = ROOT / "datasets" / "prep_generate" / "test_cases.json"
+    cases = json.loads(cases_file.read_text(encoding="utf-8"))
+    inputs = cases[0]["inputs"]
+    input_text = json.dumps(inputs, ensure_ascii=False, indent=2)
+    prompt_template = "Generate 1:1 meeting preparation questions."
+    output = "질문 1: 최근 업무에서 가장 어려웠던 점은 무엇인가요?"
+
+    criterion_input, include_prompt, tokens_saved = _project_judge_context(
+        template, meta, inputs, input_text, prompt_template
+    )
+
+    assert tokens_saved > 0
+    assert len(criterion_input) < len(input_text)
+    projected = _judge_text(
+        template, prompt_template, criterion_input, output, include_prompt
+    )
+    full = _judge_text(template, prompt_template, input_text, output, True)
+    assert len(projected) < len(full)
@@ -0,0 +1,88 @@
+"""scoring 통과 판정 테스트 (Judge 미설정 vs Judge 미채점 구분)."""
+
+from prompt_evaluator.evaluators.scoring import (
+    ERROR,
+    SKIPPED,
+    ScoringPolicy,
+    build_score_matrix,
+    compute_pass_results,
+    rescore_results,
+)
+
+POLICY = ScoringPolicy(min_score=0.7)
+
+
+def test_no_judge_configured_passes_on_sanity():
+    [result] = compute_pass_results(
+        [{"keyword_inclusion": 1.0, "forbidden_word_check": 1.0}], POLICY
+    )
+    assert result["overall_score"] is None
+    assert result["passed"] is True
+
+
+def test_all_judges_skipped_fails():
+    [result] = compute_pass_results(
+        [{"keyword_inclusion": 1.0, "llm_judge_general/output_quality": SKIPPED}],
+        POLICY,
+    )
+    assert result["overall_score"] is None
+    assert result["sanity_passed"] is True
+    assert result["passed"] is False
+
+
+def test_all_judges_errored_fails():
+    [result] = compute_pass_results(
+        [
+            {
+                "keyword_inclusion": 1.0,
+                "llm_judge_general/output_quality": ERROR,
+                "llm_judge_general/instruction_following": ERROR,
+            }
+        ],
+        POLICY,
+    )
+    assert result["overall_score"] is None
+    assert result["judge_errors"] == [
+        "llm_judge_general/output_quality",
+        "llm_judge_general/instruction_following",
+    ]
+    assert result["passed"] is False
+
+
+def test_partial_judge_error_scored_from_remaining():
+    [result] = compute_pass_results(
+        [
+            {
+                "llm_judge_general/output_quality": ERROR,
+                "llm_judge_general/instruction_following": 0.9,
+            }
+        ],
+        POLICY,
+    )
+    assert result["overall_score"] == 0.9
+    assert result["passed"] is True
+
+
+def test_judge_expected_is_per_row():
+    matrix = build_score_matrix(
+        [
+            {"keyword_inclusion": 1.0},
+            {"llm_judge_general/output_quality": SKIPPED},
+            {"pattern": 1.0},
+        ]
+    )
+    assert matrix.judge_expected.tolist() == [False, True, True]
+
+
+def test_rescore_fails_unjudged_cases():
+    results = [
+        {"case_id": "a", "scores": {"keyword_inclusion": 1.0}, "passed": True},
+        {
+            "case_id": "b",
+            "scores": {"llm_judge_general/output_quality": ERROR},
+            "passed": True,
+        },
+    ]
+    rescored = rescore_results(results, POLICY)
+    assert [r["passed"] for r in rescored] == [True, False]
+    assert results[1]["passed"] is True